@@ -8,12 +8,17 @@ Classes:
 Bits -- An immutable container for binary data.
 BitArray -- A mutable container for binary data.
 Reader -- Wraps a Bits or BitArray with a bit position for sequential reading.
+StreamReader -- Reads sequentially from a binary stream such as a pipe or socket.
+AsyncReader -- Reads sequentially from an asyncio.StreamReader.
 Array -- An efficient list-like container where each item has a fixed-length binary format.
+MXArray -- A tensor of MX format values, in blocks that each share a scale.
+MappedArray -- A read-only Array over a memory-mapped file, decoded as it is used.
 Dtype -- Encapsulate the data types used in the other classes.
 
 Functions:
 
 pack -- Create a Bits object from a format string.
+pack_rows -- Create a Bits object by packing many rows of values with one format string.
 
 Exceptions:
 
@@ -58,9 +63,11 @@ import bitstring.bitstore as bitstore  # noqa: F401 - the core must be initialis
 
 from .bits import Bits
 from .bitarray_ import BitArray
-from .reader import Reader
-from .methods import pack
+from .reader import Reader, StreamReader, AsyncReader
+from .methods import pack, pack_rows
 from .array_ import Array
+from .mxarray import MXArray
+from .mappedarray import MappedArray
 from .exceptions import Error, ReadError, InterpretError, ByteAlignError, CreationError
 from .dtypes import DtypeDefinition as _DtypeDefinition, dtype_register as _dtype_register, Dtype
 from typing import Literal as _Literal
@@ -221,13 +228,13 @@ _dtype_definitions = [
                     multiplier=8, description="a bytes object"),
     # Unknown length types
     _DtypeDefinition('se', Bits._setse, Bits._getse, int, True, None,
-                    variable_length=True, description="a signed exponential-Golomb code"),
+                    read_fn=Bits._readse, variable_length=True, description="a signed exponential-Golomb code"),
     _DtypeDefinition('ue', Bits._setue, Bits._getue, int, False, None,
-                    variable_length=True, description="an unsigned exponential-Golomb code"),
+                    read_fn=Bits._readue, variable_length=True, description="an unsigned exponential-Golomb code"),
     _DtypeDefinition('sie', Bits._setsie, Bits._getsie, int, True, None,
-                    variable_length=True, description="a signed interleaved exponential-Golomb code"),
+                    read_fn=Bits._readsie, variable_length=True, description="a signed interleaved exponential-Golomb code"),
     _DtypeDefinition('uie', Bits._setuie, Bits._getuie, int, False, None,
-                    variable_length=True, description="an unsigned interleaved exponential-Golomb code"),
+                    read_fn=Bits._readuie, variable_length=True, description="an unsigned interleaved exponential-Golomb code"),
     # Special case pad type
     _DtypeDefinition('pad', Bits._setpad, Bits._getpad, None, False, None,
                     read_fn=Bits._readpad,
@@ -304,6 +311,6 @@ if Bits.__doc__ is not None:
     Bits.__doc__ = Bits.__doc__.replace('[GENERATED_PROPERTY_DESCRIPTIONS]', _property_docstring)
 if BitArray.__doc__ is not None:
     BitArray.__doc__ = BitArray.__doc__.replace('[GENERATED_PROPERTY_DESCRIPTIONS]', _property_docstring)
-__all__ = ['Reader', 'BitArray', 'Array',
-           'Bits', 'pack', 'Error', 'ReadError', 'InterpretError',
+__all__ = ['Reader', 'StreamReader', 'AsyncReader', 'BitArray', 'Array', 'MXArray', 'MappedArray',
+           'Bits', 'pack', 'pack_rows', 'Error', 'ReadError', 'InterpretError',
            'ByteAlignError', 'CreationError', 'Dtype']
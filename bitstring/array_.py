@@ -1,15 +1,23 @@
 from __future__ import annotations
 
+import bisect
+import functools
+import itertools
 import math
 import numbers
+import struct
 from collections.abc import Sized
 from bitstring.exceptions import CreationError
 from typing import Any, BinaryIO, overload, TextIO
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from bitstring.bits import Bits, BitsType
 from bitstring.bitarray_ import BitArray
 from bitstring.dtypes import Dtype, dtype_register
 import bitstring.bitstore as bitstore
+import bitstring.bitstore_helpers as helpers
+from bitstring.fp8 import p4binary_fmt, p3binary_fmt
+from bitstring.mxfp import (e3m2mxfp_fmt, e2m3mxfp_fmt, e2m1mxfp_fmt, e4m3mxfp_saturate_fmt,
+                            e5m2mxfp_saturate_fmt, e4m3mxfp_overflow_fmt, e5m2mxfp_overflow_fmt)
 from bitstring import utils
 from bitstring.colour import Colour, should_use_color
 import copy
@@ -25,6 +33,237 @@ ElementType = float | str | int | bytes | bool | Bits
 
 MutableBitStore = bitstring.bitstore.MutableBitStore
 
+# In an Array of a variable-length dtype, the bit position of every this many items is
+# kept, so finding an item never needs more than this many codes to be decoded.
+_OFFSET_INDEX_INTERVAL = 64
+
+# How many items a variable-length Array decodes at a time when iterating.
+_VARIABLE_LENGTH_ITER_CHUNK = 1024
+
+# bitstring dtype name -> the NumPy type with the same layout, for whole-byte lengths.
+_NUMPY_EQUIVALENT_DTYPES = {'u': '>u', 'ube': '>u', 'ule': '<u', 'i': '>i', 'ibe': '>i', 'ile': '<i',
+                            'f': '>f', 'fle': '<f'}
+
+
+# The float formats that bitstring implements with lookup tables rather than tibs. Every
+# code of one of these is at most 8 bits, so a table of all their values is small.
+_LUT_DECODED_DTYPES = frozenset(['p3binary', 'p4binary', 'e4m3mxfp_saturate', 'e4m3mxfp_overflow',
+                                 'e5m2mxfp_saturate', 'e5m2mxfp_overflow', 'e3m2mxfp', 'e2m3mxfp',
+                                 'e2m1mxfp', 'e8m0mxfp', 'mxint'])
+
+# Item bit lengths that an array.array can hold as raw unsigned codes, with their typecodes.
+_RAW_ITEM_TYPECODES = {array.array(tc).itemsize * 8: tc for tc in 'BHIQ'}
+
+# How many items of a dtype without a tibs equivalent are decoded at a time when iterating.
+_BULK_DECODE_ITER_CHUNK = 4096
+
+# How many items are decoded at a time by reductions such as sum and max.
+_REDUCTION_CHUNK = 65536
+
+# bitstring dtype name -> the dtype whose values sort its items in the same order, for
+# unscaled fixed-length items. Strings and bytes of a fixed length sort in the same order
+# as their codes read as unsigned integers, so they can be sorted without being decoded.
+_SORT_KEY_DTYPES = {'u': 'u', 'ube': 'u', 'ule': 'ule', 'i': 'i', 'ibe': 'i', 'ile': 'ile',
+                    'bool': 'u', 'hex': 'u', 'bin': 'u', 'oct': 'u', 'bytes': 'u'}
+
+
+def _decode_bfloat(store: Any, start: int, end: int, big_endian: bool) -> list[float]:
+    # A bfloat is the top half of a float32, so put two zero bytes at the end of each one.
+    b = store.read_bytes(start, end - start)
+    padded = bytearray(2 * len(b))
+    if big_endian:
+        padded[0::4] = b[0::2]
+        padded[1::4] = b[1::2]
+    else:
+        padded[2::4] = b[0::2]
+        padded[3::4] = b[1::2]
+    return list(struct.unpack(f"{'>' if big_endian else '<'}{len(b) // 2}f", padded))
+
+
+@functools.lru_cache(64)
+def _bulk_decoder(name: str, bitlength: int | None):
+    """Return a function decoding the items in a bit range of a store all at once.
+
+    For the dtypes with no tibs equivalent that can still be decoded in bulk: the raw
+    codes are read in one tibs call and mapped through a table of every code's value.
+    The function takes the store and the start and end bit positions. None for any
+    other dtype.
+    """
+    if name in _LUT_DECODED_DTYPES:
+        raw_dtype = bitstore.tibs_dtype_for('u', bitlength)
+        code = Dtype('u', bitlength)
+        dtype = Dtype(name, bitlength)
+        # Built from the dtype itself, so the values are exactly those of an item at a time.
+        lut = tuple(dtype.unpack(code.pack(i)) for i in range(1 << bitlength))
+
+        def decode(store: Any, start: int, end: int) -> list[float]:
+            return list(map(lut.__getitem__, store.to_values(raw_dtype, start, end)))
+        return decode
+    if name in ('bfloat', 'bfloatle') and bitlength == 16:
+        return functools.partial(_decode_bfloat, big_endian=(name == 'bfloat'))
+    return None
+
+
+# The float formats encoded by rounding to a float16 and looking up the result, with the
+# lookup table's attribute name.
+_FLOAT16_LUT_FORMATS = {
+    'p4binary': (p4binary_fmt, 'lut_float16_to_binary8'),
+    'p3binary': (p3binary_fmt, 'lut_float16_to_binary8'),
+    'e4m3mxfp_saturate': (e4m3mxfp_saturate_fmt, 'lut_float16_to_mxfp'),
+    'e4m3mxfp_overflow': (e4m3mxfp_overflow_fmt, 'lut_float16_to_mxfp'),
+    'e5m2mxfp_saturate': (e5m2mxfp_saturate_fmt, 'lut_float16_to_mxfp'),
+    'e5m2mxfp_overflow': (e5m2mxfp_overflow_fmt, 'lut_float16_to_mxfp'),
+    'e3m2mxfp': (e3m2mxfp_fmt, 'lut_float16_to_mxfp'),
+    'e2m3mxfp': (e2m3mxfp_fmt, 'lut_float16_to_mxfp'),
+    'e2m1mxfp': (e2m1mxfp_fmt, 'lut_float16_to_mxfp'),
+}
+
+# The smallest magnitudes that struct can't pack as a float16 or a float32.
+_FLOAT16_OVERFLOW = 65520.0
+_FLOAT32_OVERFLOW = 2.0 ** 128 - 2.0 ** 103
+
+
+def _pack_floats(floats: list[float], fmt: str, overflow: float) -> tuple[bytes, list[int]]:
+    """Pack the floats with struct in native byte order, also returning the indices of any that overflow.
+
+    The overflowing values are packed as zero, for the caller to replace.
+    """
+    try:
+        return struct.pack(f'={len(floats)}{fmt}', *floats), []
+    except OverflowError:
+        over = [i for i, f in enumerate(floats) if abs(f) >= overflow and not math.isinf(f)]
+        patched = floats.copy()
+        for i in over:
+            patched[i] = 0.0
+        return struct.pack(f'={len(floats)}{fmt}', *patched), over
+
+
+def _encode_via_float16(values: Iterable[Any], fmt: Any, lut_name: str, bitlength: int) -> MutableBitStore:
+    floats = list(map(float, values))
+    if bitlength != 8 and any(map(math.isnan, floats)):
+        raise ValueError("NaN has no representation in this format.")
+    packed, over = _pack_floats(floats, 'e', _FLOAT16_OVERFLOW)
+    lut = getattr(fmt, lut_name)
+    codes = bytearray(map(lut.__getitem__, array.array('H', packed)))
+    for i in over:
+        codes[i] = fmt.pos_clamp_value if floats[i] > 0 else fmt.neg_clamp_value
+    if bitlength == 8:
+        return MutableBitStore.from_bytes(codes)
+    return MutableBitStore.from_values(bitstore.tibs_dtype_for('u', bitlength), codes)
+
+
+def _encode_bfloat(values: Iterable[Any], big_endian: bool) -> MutableBitStore:
+    floats = list(map(float, values))
+    packed, over = _pack_floats(floats, 'f', _FLOAT32_OVERFLOW)
+    if over:
+        # For consistency with packing one at a time, these overflow to infinity.
+        for i in over:
+            floats[i] = math.copysign(math.inf, floats[i])
+        packed = struct.pack(f'={len(floats)}f', *floats)
+    # A bfloat is the top half of a float32.
+    top = 2 if sys.byteorder == 'little' else 0
+    halves = bytearray(len(packed) // 2)
+    if big_endian:
+        halves[0::2] = packed[top + 1::4]
+        halves[1::2] = packed[top::4]
+    else:
+        halves[0::2] = packed[top::4]
+        halves[1::2] = packed[top + 1::4]
+    return MutableBitStore.from_bytes(halves)
+
+
+_E8M0_CODES = {f: i for i, f in enumerate(helpers.e8m0mxfp_allowed_values)}
+
+
+def _encode_e8m0(values: Iterable[Any]) -> MutableBitStore:
+    # No rounding is done, so a value not in the table raises KeyError.
+    return MutableBitStore.from_bytes(bytes([_E8M0_CODES[f] if f == f else 0xff for f in map(float, values)]))
+
+
+def _encode_mxint(values: Iterable[Any]) -> MutableBitStore:
+    # round() rounds ties to even, and raises ValueError for a NaN.
+    codes = [127 if f > 127 else -128 if f <= -128 else round(f)
+             for f in (float(v) * 64 for v in values)]
+    return MutableBitStore.from_values(bitstore.tibs_dtype_for('i', 8), codes)
+
+
+@functools.lru_cache(64)
+def _bulk_encoder(name: str, bitlength: int | None):
+    """Return a function packing a whole sequence of values at once, for the dtypes
+    with no tibs equivalent that can still be encoded in bulk. None for any other dtype.
+
+    The function raises for any value it can't encode exactly as an item at a time
+    would be, so that the caller can fall back to that.
+    """
+    if name in _FLOAT16_LUT_FORMATS:
+        fmt, lut_name = _FLOAT16_LUT_FORMATS[name]
+        return functools.partial(_encode_via_float16, fmt=fmt, lut_name=lut_name, bitlength=bitlength)
+    if name in ('bfloat', 'bfloatle') and bitlength == 16:
+        return functools.partial(_encode_bfloat, big_endian=(name == 'bfloat'))
+    if name == 'e8m0mxfp':
+        return _encode_e8m0
+    if name == 'mxint':
+        return _encode_mxint
+    return None
+
+
+@functools.lru_cache(64)
+def _scaled_bulk_decoder(dtype: Dtype):
+    """Return a function decoding a bit range of a store all at once for a dtype with a
+    scale factor, or None if it can't be done in bulk.
+
+    The raw values are decoded in bulk and then multiplied by the scale in a single
+    pass, giving exactly what the scaled get function would for each item.
+    """
+    tibs_dtype = bitstore.tibs_dtype_for(dtype._name, dtype._bitlength)
+    if tibs_dtype is not None:
+        def unscaled(store: Any, start: int, end: int) -> list[Any]:
+            return store.to_values(tibs_dtype, start, end)
+    else:
+        unscaled = _bulk_decoder(dtype._name, dtype._bitlength)
+        if unscaled is None:
+            return None
+    scale = dtype._scale
+
+    def decode(store: Any, start: int, end: int) -> list[Any]:
+        return [v * scale for v in unscaled(store, start, end)]
+    return decode
+
+
+@functools.lru_cache(64)
+def _scaled_bulk_encoder(dtype: Dtype):
+    """Return a function packing a whole sequence of values at once for a numeric dtype
+    with a scale factor, or None if it can't be done in bulk.
+
+    Each value is divided by the scale, as the scaled set function does, before the
+    results are packed in bulk.
+    """
+    scale = dtype._scale
+    tibs_dtype = bitstore.tibs_dtype_for(dtype._name, dtype._bitlength)
+    if tibs_dtype is not None:
+        # The integer set functions truncate with int(), which tibs won't do for us.
+        convert = int if dtype._return_type is int else float
+
+        def encode(values: Iterable[Any]) -> MutableBitStore:
+            return MutableBitStore.from_values(tibs_dtype, [convert(v / scale) for v in values])
+        return encode
+    unscaled = _bulk_encoder(dtype._name, dtype._bitlength)
+    if unscaled is None:
+        return None
+
+    def encode(values: Iterable[Any]) -> MutableBitStore:
+        return unscaled([v / scale for v in values])
+    return encode
+
+
+def _import_numpy():
+    # NumPy is optional, so it's only imported when it's needed.
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError("NumPy is needed for this method, but it couldn't be imported.") from None
+    return numpy
+
 
 def _array_typecode_to_dtype(typecode: str) -> Dtype | None:
     endian = '<' if sys.byteorder == 'little' else '>'
@@ -48,6 +287,10 @@ class Array:
     Array will have 'trailing_bits' which will prevent some methods from appending to the
     Array.
 
+    The variable-length exponential-Golomb dtypes ('ue', 'se', 'uie' and 'sie') can also be
+    used, in which case the codes are stored back to back and an index of the bit position of
+    every 64th item is kept for random access.
+
     Methods:
 
     append() -- Append a single item to the end of the Array.
@@ -56,14 +299,18 @@ class Array:
     extend() -- Append new items to the end of the Array from an iterable.
     from_bytes() -- Create a new Array with binary data from a bytes-like object.
     from_file() -- Create a new Array with items read from a file path or binary file object.
+    from_numpy() -- Create a new Array with items from a NumPy array.
     from_zeros() -- Create a new Array containing zeroed items.
     insert() -- Insert an item at a given position.
+    memmap() -- Return a MappedArray that reads and writes the items of a file in place.
     pop() -- Remove and return an item.
     pp() -- Pretty print the Array.
     reverse() -- Reverse the order of all items.
     to_bytes() -- Return Array data as bytes object, padding with zero bits at the end if needed.
     to_file() -- Write Array data to a file, padding with zero bits at the end if needed.
     to_list() -- Return Array items as a list.
+    to_numpy() -- Return Array items as a NumPy array.
+    view() -- Return a new Array of some of the items, sharing the data rather than copying it.
 
     Special methods:
 
@@ -81,6 +328,10 @@ class Array:
 
     """
 
+    # For a variable-length dtype: (the data's bitstore, its mutation count, the offset index,
+    # the item count, the bit position after the last item), or None if it needs building.
+    _index: tuple[Any, int, array.array, int, int] | None = None
+
     def __init__(self, dtype: str | Dtype, initializer: Array | array.array | Iterable | None = None,
                  trailing_bits: BitsType | None = None) -> None:
         self.data = BitArray()
@@ -90,6 +341,11 @@ class Array:
             # common - every elementwise operator does it - so skip them in that case.
             self._reject_removed_initializer(initializer)
         if isinstance(dtype, Dtype) and dtype.scale == 'auto':
+            if isinstance(initializer, Iterator):
+                # The scale depends on every value and nothing can be packed until it's
+                # known, so a generator's values have to be kept. They're read into a list
+                # once, which the scale is found from and which is then packed in bulk.
+                initializer = list(initializer)
             auto_scale = self._calculate_auto_scale(initializer, dtype.name, dtype.length)
             dtype = Dtype(dtype.name, dtype.length, scale=auto_scale)
         try:
@@ -129,6 +385,7 @@ class Array:
         if n < 0:
             raise ValueError(f"Can't create an Array of negative length {n}.")
         x = cls(dtype)
+        x._check_fixed_length('Array.from_zeros()')
         x.data = BitArray.from_zeros(n * x.itemsize)
         return x
 
@@ -141,10 +398,44 @@ class Array:
         x.data += data
         return x
 
+    @classmethod
+    def from_numpy(cls, dtype: str | Dtype, arr: Any, /) -> Array:
+        """Create a new Array with items from a one-dimensional NumPy array.
+
+        If the dtype has the same layout as the NumPy array's type, apart from possibly
+        its byte order, then the data is copied across directly without packing each item.
+        It's only copied once, unless the byte order needs changing first.
+        """
+        np = _import_numpy()
+        arr = np.asarray(arr)
+        if arr.ndim != 1:
+            raise ValueError(f"Array.from_numpy() needs a one-dimensional array, but received one with {arr.ndim} dimensions.")
+        x = cls(dtype)
+        np_dtype = x._numpy_dtype()
+        if np_dtype is not None and arr.dtype.kind == np_dtype[1] and arr.dtype.itemsize == x.itemsize // 8:
+            arr = np.ascontiguousarray(arr.astype(np_dtype, copy=False))
+            x.data._bitstore = MutableBitStore.from_bytes(memoryview(arr.view(np.uint8)))
+        elif x._dtype._name == 'bool' and x._dtype._scale is None and arr.dtype.kind == 'b':
+            x.data._bitstore = MutableBitStore.from_bytes(np.packbits(arr).tobytes(), length=len(arr))
+        else:
+            x.extend(arr.tolist())
+        return x
+
+    def _numpy_dtype(self) -> str | None:
+        """The NumPy type string with the same layout as the dtype, or None if there isn't one."""
+        if self._dtype._scale is not None:
+            return None
+        np_type = _NUMPY_EQUIVALENT_DTYPES.get(self._dtype._name)
+        bitlength = self._dtype._bitlength
+        if np_type is None or bitlength not in (8, 16, 32, 64) or (np_type[1] == 'f' and bitlength == 8):
+            return None
+        return f'{np_type}{bitlength // 8}'
+
     _largest_values = None
 
     @staticmethod
-    def _calculate_auto_scale(initializer, name: str, length: int | None) -> float:
+    def _largest_value(name: str, length: int | None) -> float | None:
+        """The largest value of the format, used to calculate 'auto' scales, or None if it isn't supported."""
         # Now need to find the largest power of 2 representable with this format.
         if Array._largest_values is None:
             Array._largest_values = {
@@ -162,24 +453,36 @@ class Array:
                 # The bfloat range is so large the scaling algorithm doesn't work well, so I'm disallowing it.
                 # 'bfloat16': Bits('0x7f7f').bfloat16,  # 3.38953139e38,
             }
-        if f'{name}{length}' in Array._largest_values.keys():
-            float_values = Array('f64', initializer).to_list()
-            if not float_values:
+        return Array._largest_values.get(f'{name}{length}')
+
+    @staticmethod
+    def _scale_for_max(max_float_value: float, largest_value: float) -> float:
+        """Return the power of two scale that best fits values up to max_float_value into a format."""
+        if max_float_value == 0:
+            # This special case isn't covered in the standard. I'm choosing to return no scale.
+            return 1.0
+        # We need to find the largest power of 2 that is less than the max value
+        log2 = math.floor(math.log2(max_float_value))
+        lp2 = math.floor(math.log2(largest_value))
+        lg_scale = log2 - lp2
+        # Saturate at values representable in E8M0 format.
+        if lg_scale > 127:
+            lg_scale = 127
+        elif lg_scale < -127:
+            lg_scale = -127
+        return 2 ** lg_scale
+
+    @staticmethod
+    def _calculate_auto_scale(initializer, name: str, length: int | None) -> float:
+        largest_value = Array._largest_value(name, length)
+        if largest_value is not None:
+            if isinstance(initializer, str):
+                raise TypeError("Can't extend an Array with a str.")
+            # A single pass over the values, without making a list of them.
+            max_float_value = None if initializer is None else max(map(abs, map(float, initializer)), default=None)
+            if max_float_value is None:
                 raise ValueError("Can't calculate an 'auto' scale with an empty Array initializer.")
-            max_float_value = max(abs(x) for x in float_values)
-            if max_float_value == 0:
-                # This special case isn't covered in the standard. I'm choosing to return no scale.
-                return 1.0
-            # We need to find the largest power of 2 that is less than the max value
-            log2 = math.floor(math.log2(max_float_value))
-            lp2 = math.floor(math.log2(Array._largest_values[f'{name}{length}']))
-            lg_scale = log2 - lp2
-            # Saturate at values representable in E8M0 format.
-            if lg_scale > 127:
-                lg_scale = 127
-            elif lg_scale < -127:
-                lg_scale = -127
-            return 2 ** lg_scale
+            return Array._scale_for_max(max_float_value, largest_value)
         else:
             raise ValueError(f"Can't calculate auto scale for format '{name}{length}'. "
                              f"This feature is only available for these formats: {list(Array._largest_values.keys())}.")
@@ -188,11 +491,14 @@ class Array:
     def itemsize(self) -> int:
         bitlength = self._dtype.bitlength
         if bitlength is None:
-            raise ValueError("A fixed length format is needed for an Array.")
+            raise ValueError(f"The items of an Array with the variable-length dtype '{self._dtype}' have no fixed itemsize.")
         return bitlength
 
     @property
     def trailing_bits(self) -> BitArray:
+        if self._dtype._variable_length:
+            _, _, end = self._variable_index()
+            return self.data[end:]
         trailing_bit_length = len(self.data) % self._dtype.bitlength
         return BitArray() if trailing_bit_length == 0 else self.data[-trailing_bit_length:]
 
@@ -207,14 +513,23 @@ class Array:
     def _set_tibs_dtype(self) -> None:
         """Cache the tibs dtype matching self._dtype, for bulk packing and unpacking.
 
-        None whenever there isn't an exact equivalent, which leaves every operation on
-        the per-element path. A scale factor always disqualifies a dtype, as the scaling
-        is applied by bitstring's own get/set functions.
+        It's None for a dtype with a scale factor, as the core can't apply the scaling.
+        Such a dtype instead gets bulk functions that read or write the unscaled values
+        in one call and scale them in a single pass. The float formats implemented with
+        lookup tables get bulk decoding and encoding functions too. Anything else
+        without an exact equivalent is left on the per-element path.
         """
+        self._bulk_decode = self._bulk_encode = None
         if self._dtype._scale is not None:
             self._tibs_dtype = None
+            self._bulk_decode = _scaled_bulk_decoder(self._dtype)
+            if self._dtype._return_type in (int, float):
+                self._bulk_encode = _scaled_bulk_encoder(self._dtype)
         else:
-            self._tibs_dtype = bitstore.tibs_dtype_for(self._dtype._name, self._dtype._bitlength)
+            self._tibs_dtype = self._dtype._tibs_dtype
+            if self._tibs_dtype is None:
+                self._bulk_decode = _bulk_decoder(self._dtype._name, self._dtype._bitlength)
+                self._bulk_encode = _bulk_encoder(self._dtype._name, self._dtype._bitlength)
 
     def _set_dtype(self, new_dtype: str | Dtype) -> None:
         if isinstance(new_dtype, Dtype):
@@ -230,12 +545,77 @@ class Array:
                     dtype = Dtype(name_length[0], name_length[1])
                 else:
                     raise ValueError(f"Inappropriate Dtype for Array: '{new_dtype}'.")
-            if dtype.length is None:
+            if dtype.length is None and not dtype.variable_length:
                 raise ValueError(f"A fixed length format is needed for an Array, received '{new_dtype}'.")
             self._dtype = dtype
         if self._dtype.scale == 'auto':
             raise ValueError("A Dtype with an 'auto' scale factor can only be used when creating a new Array.")
         self._set_tibs_dtype()
+        self._index = None
+
+    def _read_codes(self, pos: int, n: int) -> tuple[list[ElementType], int]:
+        """Read n items of a variable-length dtype from pos, returning them and the new pos.
+
+        Raises ReadError if there aren't n whole items.
+        """
+        bulk_read = bitstring.bits._BULK_VARIABLE_LENGTH_READS.get(self._dtype._name)
+        if bulk_read is None:
+            values = []
+            for _ in range(n):
+                value, pos = self._dtype._read_fn(self.data, pos)
+                values.append(value)
+            return values, pos
+        values, pos = bulk_read(self.data, pos, n)
+        scale = self._dtype._scale
+        if scale is not None:
+            values = [v * scale for v in values]
+        return values, pos
+
+    def _variable_index(self, resume: tuple[array.array, int, int] | None = None) -> tuple[array.array, int, int]:
+        """Return the offset index, item count and end of the items for a variable-length dtype.
+
+        The index is kept while the data is unchanged, which is judged by its bitstore
+        and the count of mutations made to it, so changes made directly to the data are
+        noticed. Methods that append to the data pass the index from before in resume,
+        so that only the new items are decoded.
+        """
+        data = self.data
+        index = self._index
+        store = data._bitstore
+        if resume is None and index is not None and index[0] is store and index[1] == store.mutations:
+            return index[2], index[3], index[4]
+        offsets, count, pos = (array.array('Q'), 0, 0) if resume is None else resume
+        length = len(data)
+        while pos < length:
+            start = pos
+            wanted = _OFFSET_INDEX_INTERVAL - count % _OFFSET_INDEX_INTERVAL
+            try:
+                _, pos = self._read_codes(pos, wanted)
+                got = wanted
+            except bitstring.ReadError:
+                # Fewer whole items than that are left, so find them one at a time.
+                got = 0
+                while True:
+                    try:
+                        _, pos = self._read_codes(pos, 1)
+                    except bitstring.ReadError:
+                        break
+                    got += 1
+            if got and count % _OFFSET_INDEX_INTERVAL == 0:
+                offsets.append(start)
+            count += got
+            if got < wanted:
+                break
+        self._index = (store, store.mutations, offsets, count, pos)
+        return offsets, count, pos
+
+    def _item_pos(self, key: int) -> int:
+        """The bit position of item key, which can equal the item count, for a variable-length dtype."""
+        offsets, count, end = self._variable_index()
+        if key == count:
+            return end
+        block, skip = divmod(key, _OFFSET_INDEX_INTERVAL)
+        return self._read_codes(offsets[block], skip)[1]
 
     def _create_element(self, value: ElementType) -> Bits:
         """Create Bits from value according to the token_name and token_length"""
@@ -245,6 +625,8 @@ class Array:
         return b
 
     def __len__(self) -> int:
+        if self._dtype._variable_length:
+            return self._variable_index()[1]
         return len(self.data) // self.itemsize
 
     @overload
@@ -256,15 +638,21 @@ class Array:
         ...
 
     def __getitem__(self, key: slice | int) -> Array | ElementType:
+        if self._dtype._variable_length:
+            return self._getitem_variable(key)
         if isinstance(key, slice):
             start, stop, step = key.indices(len(self))
+            if step == -1:
+                a = self[stop + 1: start + 1]
+                a.reverse()
+                return a
             if step != 1:
-                d = BitArray()
                 itemsize = self.itemsize
-                for s in range(start * itemsize, stop * itemsize, step * itemsize):
-                    d.append(self.data[s: s + itemsize])
                 a = self.__class__(self._dtype)
-                a.data = d
+                # Pick out the items as raw codes, whatever the dtype, in two tibs calls.
+                raw_dtype = bitstore.tibs_dtype_for('u', itemsize)
+                codes = self.data._bitstore.to_values(raw_dtype, 0, len(self) * itemsize)
+                a.data._addright_bitstore(bitstore.MutableBitStore.from_values(raw_dtype, codes[key]))
                 return a
             else:
                 itemsize = self.itemsize
@@ -272,6 +660,8 @@ class Array:
                 a = object.__new__(self.__class__)
                 a._dtype = self._dtype
                 a._tibs_dtype = self._tibs_dtype
+                a._bulk_decode = self._bulk_decode
+                a._bulk_encode = self._bulk_encode
                 a.data = self.data[start * itemsize: stop * itemsize]
                 return a
         else:
@@ -286,6 +676,35 @@ class Array:
                 return self.data._bitstore.to_value(self._tibs_dtype, start, start + itemsize)
             return self._dtype._read_fn(self.data, start=start)
 
+    def _getitem_variable(self, key: slice | int) -> Array | ElementType:
+        offsets, count, _ = self._variable_index()
+        if isinstance(key, slice):
+            start, stop, step = key.indices(count)
+            if step != 1:
+                return self.__class__(self._dtype, self.to_list()[key])
+            a = self.__class__(self._dtype)
+            if start < stop:
+                a.data = self.data[self._item_pos(start): self._item_pos(stop)]
+            return a
+        if key < 0:
+            key += count
+        if key < 0 or key >= count:
+            raise IndexError(f"Index {key} out of range for Array of length {count}.")
+        block, skip = divmod(key, _OFFSET_INDEX_INTERVAL)
+        return self._read_codes(offsets[block], skip + 1)[0][-1]
+
+    def view(self, start: int | None = None, stop: int | None = None) -> Array:
+        """Return a new Array of the items from start to stop, sharing the data rather than copying it.
+
+        start and stop are used as for a slice, so a[start:stop] gives the same items.
+        Changing either Array doesn't change the other, as the first one to be changed
+        takes its own copy of the data. Until then, the Array and all its views use the
+        same memory, and further slices of them don't copy it either.
+        """
+        # The data is moved into an immutable store, which slices without copying.
+        self.data._bitstore.share()
+        return self[start:stop]
+
     @overload
     def __setitem__(self, key: slice, value: Iterable[ElementType]) -> None:
         ...
@@ -295,21 +714,21 @@ class Array:
         ...
 
     def __setitem__(self, key: slice | int, value: Iterable[ElementType] | ElementType) -> None:
+        if self._dtype._variable_length:
+            self._setitem_variable(key, value)
+            return
         if isinstance(key, slice):
             start, stop, step = key.indices(len(self))
             if not isinstance(value, Iterable):
                 raise TypeError("Can only assign an iterable to a slice.")
             if step == 1:
                 itemsize = self.itemsize
-                if self._tibs_dtype is not None and isinstance(value, (list, tuple, range)):
+                if isinstance(value, (list, tuple, range)):
                     # Bulk pack, far quicker than an item at a time. Only for types that
                     # can be iterated twice, as a failure falls back to the loop below
                     # so that a bad value raises exactly the error it always did.
-                    try:
-                        packed = bitstore.MutableBitStore.from_values(self._tibs_dtype, value)
-                    except Exception:
-                        pass
-                    else:
+                    packed = self._bulk_pack(value)
+                    if packed is not None:
                         self.data._bitstore[start * itemsize: stop * itemsize] = packed
                         return
                 new_data = BitArray()
@@ -347,7 +766,61 @@ class Array:
             self.data.overwrite(start, self._create_element(value))
             return
 
+    def _setitem_variable(self, key: slice | int, value: Iterable[ElementType] | ElementType) -> None:
+        offsets, count, end = self._variable_index()
+        if isinstance(key, slice):
+            start, stop, step = key.indices(count)
+            if not isinstance(value, Iterable):
+                raise TypeError("Can only assign an iterable to a slice.")
+            if step == 1:
+                if start > stop:
+                    stop = start
+                packed = self._dtype.pack_many(value)
+                self.data[self._item_pos(start): self._item_pos(stop)] = packed
+                return
+            items = self.to_list()
+            if not isinstance(value, Sized):
+                value = list(value)
+            items_in_slice = len(range(start, stop, step))
+            if len(value) != items_in_slice:
+                raise ValueError(f"Can't assign {len(value)} values to an extended slice of length {items_in_slice}.")
+            items[key] = value
+            self.data[:end] = self._dtype.pack_many(items)
+            return
+        if key < 0:
+            key += count
+        if key < 0 or key >= count:
+            raise IndexError(f"Index {key} out of range for Array of length {count}.")
+        packed = self._dtype.pack(value)
+        block, skip = divmod(key, _OFFSET_INDEX_INTERVAL)
+        start = self._read_codes(offsets[block], skip)[1]
+        stop = self._read_codes(start, 1)[1]
+        self.data[start: stop] = packed
+        # Only the positions after the changed item move, so the index can be kept.
+        delta = len(packed) - (stop - start)
+        for b in range(block + 1, len(offsets)):
+            offsets[b] += delta
+        store = self.data._bitstore
+        self._index = (store, store.mutations, offsets, count, end + delta)
+
     def __delitem__(self, key: slice | int) -> None:
+        if self._dtype._variable_length:
+            count = len(self)
+            if isinstance(key, slice):
+                start, stop, step = key.indices(count)
+                if step != 1:
+                    items = self.to_list()
+                    del items[key]
+                    self.data[:self._item_pos(count)] = self._dtype.pack_many(items)
+                elif start < stop:
+                    del self.data[self._item_pos(start): self._item_pos(stop)]
+                return
+            if key < 0:
+                key += count
+            if key < 0 or key >= count:
+                raise IndexError
+            del self.data[self._item_pos(key): self._item_pos(key + 1)]
+            return
         if isinstance(key, slice):
             start, stop, step = key.indices(len(self))
             if step == 1:
@@ -370,9 +843,8 @@ class Array:
 
     def __repr__(self) -> str:
         list_str = f"{self.to_list()}"
-        trailing_bit_length = len(self.data) % self.itemsize
-        final_str = "" if trailing_bit_length == 0 else ", trailing_bits=" + repr(
-            self.data[-trailing_bit_length:])
+        trailing_bits = self.trailing_bits
+        final_str = "" if len(trailing_bits) == 0 else ", trailing_bits=" + repr(trailing_bits)
         return f"Array('{self._dtype}', {list_str}{final_str})"
 
     def astype(self, dtype: str | Dtype) -> Array:
@@ -381,11 +853,15 @@ class Array:
         return new_array
 
     def to_list(self) -> list[ElementType]:
+        if self._dtype._variable_length:
+            return self._read_codes(0, len(self))[0]
         itemsize = self.itemsize
         if self._tibs_dtype is not None:
             # Bulk unpack, which is far quicker than reading an item at a time. Any
             # trailing bits are excluded, as tibs won't unpack a partial final item.
-            return self.data._bitstore.to_values(self._tibs_dtype, len(self.data) // itemsize * itemsize)
+            return self.data._bitstore.to_values(self._tibs_dtype, 0, len(self.data) // itemsize * itemsize)
+        if self._bulk_decode is not None:
+            return self._bulk_decode(self.data._bitstore, 0, len(self.data) // itemsize * itemsize)
         return [self._dtype._read_fn(self.data, start=start)
                 for start in range(0, len(self.data) - itemsize + 1, itemsize)]
 
@@ -393,12 +869,71 @@ class Array:
         """Deprecated compatibility alias for :meth:`to_list`."""
         return self.to_list()
 
+    def to_numpy(self) -> Any:
+        """Return the Array items as a one-dimensional NumPy array.
+
+        If the dtype has the same layout as a NumPy type then the result is a read-only
+        NumPy array of that type, keeping the byte order, which usually uses the Array's
+        data without copying it. A 'bool' Array gives a NumPy bool array, and other
+        dtypes are converted from their values. Any trailing bits are ignored.
+        """
+        np = _import_numpy()
+        np_dtype = self._numpy_dtype()
+        if np_dtype is not None:
+            n = len(self.data) // self.itemsize
+            length = n * self.itemsize
+            store = self.data._bitstore
+            if type(store) is bitstore.SharedBitStore:
+                try:
+                    buffer = store.getslice(0, length).to_memoryview()
+                except BufferError:
+                    # The data doesn't start on a byte boundary of the storage it shares.
+                    buffer = store.read_bytes(0, length)
+            else:
+                # A Mutibs can't be viewed as a buffer, but sharing the data moves it into
+                # a Tibs that can. As for a view(), the Array takes its own copy of the
+                # data only if it's changed later, so the NumPy array is left as it was.
+                buffer = bitstore.ConstBitStore(store.share()[:length]).to_memoryview()
+            return np.frombuffer(buffer, np_dtype, count=n)
+        if self._dtype._name == 'bool' and self._dtype._scale is None:
+            return np.unpackbits(np.frombuffer(self.data.to_bytes(), np.uint8), count=len(self.data)).astype(bool)
+        if self._dtype.return_type is Bits:
+            raise ValueError(f"Can't convert an Array with dtype '{self._dtype}' to a NumPy array.")
+        return np.array(self.to_list())
+
     def append(self, x: ElementType) -> None:
+        if self._dtype._variable_length:
+            self.extend([x])
+            return
         if len(self.data) % self.itemsize != 0:
             raise ValueError("Cannot append to Array as its length is not a multiple of the format length.")
         self.data += self._create_element(x)
 
+    def _extend_variable(self, iterable: Array | array.array | Iterable[Any]) -> None:
+        index = self._variable_index()
+        if index[2] != len(self.data):
+            raise ValueError(f"Cannot extend Array as it has {len(self.data) - index[2]} trailing bits.")
+        if isinstance(iterable, Array):
+            if self._dtype.name != iterable._dtype.name:
+                raise TypeError(
+                    f"Cannot extend an Array with format '{self._dtype}' from an Array of format '{iterable._dtype}'.")
+            if len(iterable.trailing_bits) != 0:
+                raise ValueError("Cannot extend from an Array with trailing bits.")
+            packed = iterable.data._bitstore
+        elif isinstance(iterable, array.array):
+            raise ValueError(f"Cannot extend an Array with format '{self._dtype}' from an array.")
+        else:
+            if isinstance(iterable, str):
+                raise TypeError("Can't extend an Array with a str.")
+            # The whole lot is encoded in one go, so a bad value leaves the Array unchanged.
+            packed = self._dtype.pack_many(iterable)._bitstore
+        self.data._addright_bitstore(packed)
+        self._variable_index(resume=index)
+
     def extend(self, iterable: Array | array.array | Iterable[Any]) -> None:
+        if self._dtype._variable_length:
+            self._extend_variable(iterable)
+            return
         itemsize = self.itemsize
         if len(self.data) % itemsize != 0:
             raise ValueError(f"Cannot extend Array as its data length ({len(self.data)} bits) is not a multiple of the format length ({itemsize} bits).")
@@ -420,16 +955,13 @@ class Array:
         else:
             if isinstance(iterable, str):
                 raise TypeError("Can't extend an Array with a str.")
-            if self._tibs_dtype is not None and isinstance(iterable, (list, tuple, range)):
+            if isinstance(iterable, (list, tuple, range)):
                 # Bulk pack, which is far quicker than packing an item at a time. Only
                 # for types that can be iterated twice, as a failure has to fall back to
                 # the loop below - that way a bad value raises exactly the error it
                 # always did, and leaves the same partially extended Array behind.
-                try:
-                    packed = bitstore.MutableBitStore.from_values(self._tibs_dtype, iterable)
-                except Exception:
-                    pass
-                else:
+                packed = self._bulk_pack(iterable)
+                if packed is not None:
                     self.data._addright_bitstore(packed)
                     return
             for item in iterable:
@@ -441,6 +973,9 @@ class Array:
         """
         # Match list.insert semantics: clamp both high and low indices.
         i = max(min(i, len(self)), -len(self))
+        if self._dtype._variable_length:
+            self.data.insert(self._item_pos(i if i >= 0 else i + len(self)), self._dtype.pack(x))
+            return
         self.data.insert(i * self.itemsize, self._create_element(x))
 
     def pop(self, i: int = -1) -> ElementType:
@@ -461,6 +996,7 @@ class Array:
         If the Array format is not a whole number of bytes a ValueError will be raised.
 
         """
+        self._check_fixed_length('byteswap()')
         if self.itemsize % 8 != 0:
             raise ValueError(
                 f"byteswap can only be used for whole-byte elements. The '{self._dtype}' format is {self.itemsize} bits long.")
@@ -481,11 +1017,269 @@ class Array:
                 return False
 
         if is_nan(value):
-            return sum(is_nan(i) for i in self)
+            # A NaN is the only value that doesn't equal itself.
+            return sum(len(values) - sum(map(operator.eq, values, values)) for values in self._value_chunks())
         else:
             # Bulk read, then let list.count do the comparing.
             return self.to_list().count(value)
 
+    def _value_chunks(self, chunk_size: int | None = None) -> Iterator[list[ElementType]]:
+        """Yield lists of the items in order, decoding chunk_size items at a time to bound memory use."""
+        if chunk_size is None:
+            chunk_size = _REDUCTION_CHUNK
+        if self._dtype._variable_length:
+            pos = 0
+            remaining = len(self)
+            while remaining > 0:
+                values, pos = self._read_codes(pos, min(remaining, chunk_size))
+                remaining -= len(values)
+                yield values
+            return
+        itemsize = self.itemsize
+        end = len(self.data) // itemsize * itemsize
+        chunk_bits = chunk_size * itemsize
+        for start in range(0, end, chunk_bits):
+            stop = min(start + chunk_bits, end)
+            if self._tibs_dtype is not None:
+                yield self.data._bitstore.to_values(self._tibs_dtype, start, stop)
+            elif self._bulk_decode is not None:
+                yield self._bulk_decode(self.data._bitstore, start, stop)
+            else:
+                yield [self._dtype._read_fn(self.data, start=s) for s in range(start, stop, itemsize)]
+
+    def _check_fixed_length(self, method: str) -> None:
+        if self._dtype._variable_length:
+            raise ValueError(f"Can't use {method} with the variable-length dtype '{self._dtype}', as it needs fixed-length items.")
+
+    def _check_numeric(self, method: str) -> None:
+        if self._dtype.return_type not in (int, float, bool):
+            raise TypeError(f"Can't find the {method} of an Array with dtype '{self._dtype}' as it isn't numeric.")
+
+    def _sum_and_count(self, skip_nan: bool) -> tuple[int | float, int]:
+        """Return the sum of the items and how many were summed, optionally skipping NaNs."""
+        if self._dtype._name == 'bool' and self._dtype._scale is None:
+            # The sum is just the number of set bits.
+            return self.data.count(1), len(self)
+        count = 0
+
+        def chunks() -> Iterator[list[ElementType]]:
+            nonlocal count
+            for values in self._value_chunks():
+                if skip_nan and not all(map(operator.eq, values, values)):
+                    values = [v for v in values if v == v]
+                count += len(values)
+                yield values
+
+        # A single sum over every chunk, so the result is exactly that of summing a list of
+        # all the items. Restarting sum() for each chunk would lose the compensation that
+        # it uses for floats from Python 3.12.
+        total = sum(itertools.chain.from_iterable(chunks()))
+        return total, count
+
+    def _extreme(self, fn: Any, skip_nan: bool, method: str) -> tuple[int, ElementType]:
+        """Return the index and value of the first item picked by fn, which is min or max.
+
+        Any NaN is picked unless skip_nan is True, in which case they're ignored.
+        """
+        better = operator.lt if fn is min else operator.gt
+        # Only float items can be NaN, so other dtypes skip the check.
+        check_nan = self._dtype.return_type is float
+        best_chunk = best_offset = best = None
+        offset = 0
+        for values in self._value_chunks():
+            candidates = values
+            if check_nan and not all(map(operator.eq, values, values)):
+                if not skip_nan:
+                    i = next(i for i, v in enumerate(values) if v != v)
+                    return offset + i, values[i]
+                candidates = [v for v in values if v == v]
+            if candidates:
+                value = fn(candidates)
+                # Strictly better only, so that the first of equal items wins.
+                if best_chunk is None or better(value, best):
+                    best_chunk, best_offset, best = values, offset, value
+            offset += len(values)
+        if best_chunk is None:
+            raise ValueError(f"Can't find the {method} of an Array with no {'non-NaN ' if skip_nan else ''}items.")
+        return best_offset + best_chunk.index(best), best
+
+    def sum(self) -> int | float:
+        """Return the sum of the items. A bool Array gives the number of True items."""
+        self._check_numeric('sum')
+        return self._sum_and_count(False)[0]
+
+    def nansum(self) -> int | float:
+        """Return the sum of the items, ignoring any NaNs."""
+        self._check_numeric('sum')
+        return self._sum_and_count(True)[0]
+
+    def mean(self) -> float:
+        """Return the arithmetic mean of the items. Raises ValueError if the Array is empty."""
+        self._check_numeric('mean')
+        total, count = self._sum_and_count(False)
+        if count == 0:
+            raise ValueError("Can't find the mean of an Array with no items.")
+        return total / count
+
+    def nanmean(self) -> float:
+        """Return the arithmetic mean of the items, ignoring any NaNs.
+
+        Raises ValueError if there are no items that aren't NaN.
+        """
+        self._check_numeric('mean')
+        total, count = self._sum_and_count(True)
+        if count == 0:
+            raise ValueError("Can't find the mean of an Array with no non-NaN items.")
+        return total / count
+
+    def min(self) -> ElementType:
+        """Return the smallest item, or NaN if there are any. Raises ValueError if the Array is empty."""
+        return self._extreme(min, False, 'min')[1]
+
+    def max(self) -> ElementType:
+        """Return the largest item, or NaN if there are any. Raises ValueError if the Array is empty."""
+        return self._extreme(max, False, 'max')[1]
+
+    def argmin(self) -> int:
+        """Return the index of the first smallest item, or of the first NaN if there are any.
+
+        Raises ValueError if the Array is empty.
+        """
+        return self._extreme(min, False, 'argmin')[0]
+
+    def argmax(self) -> int:
+        """Return the index of the first largest item, or of the first NaN if there are any.
+
+        Raises ValueError if the Array is empty.
+        """
+        return self._extreme(max, False, 'argmax')[0]
+
+    def nanmin(self) -> ElementType:
+        """Return the smallest item, ignoring any NaNs. Raises ValueError if there are no other items."""
+        return self._extreme(min, True, 'min')[1]
+
+    def nanmax(self) -> ElementType:
+        """Return the largest item, ignoring any NaNs. Raises ValueError if there are no other items."""
+        return self._extreme(max, True, 'max')[1]
+
+    def nanargmin(self) -> int:
+        """Return the index of the first smallest item, ignoring any NaNs.
+
+        Raises ValueError if there are no other items.
+        """
+        return self._extreme(min, True, 'argmin')[0]
+
+    def nanargmax(self) -> int:
+        """Return the index of the first largest item, ignoring any NaNs.
+
+        Raises ValueError if there are no other items.
+        """
+        return self._extreme(max, True, 'argmax')[0]
+
+    def _sort_key_dtype(self) -> Any:
+        """The tibs dtype whose values sort the items in the same order, or None if there isn't one."""
+        if self._dtype._variable_length or self._dtype._scale is not None:
+            return None
+        key_name = _SORT_KEY_DTYPES.get(self._dtype._name)
+        return None if key_name is None else bitstore.tibs_dtype_for(key_name, self.itemsize)
+
+    def _sorted_order(self, reverse: bool) -> tuple[list[Any], list[int]]:
+        """Return the sort keys and the indices that would sort the items, with any NaNs last.
+
+        The keys are the items themselves unless the dtype has a sort key dtype.
+        """
+        key_dtype = self._sort_key_dtype()
+        if key_dtype is not None:
+            # Read the codes as sort keys in one call, rather than decoding the items.
+            keys = self.data._bitstore.to_values(key_dtype, 0, len(self) * self.itemsize)
+            return keys, sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+        values = self.to_list()
+        if self._dtype.return_type is float and not all(map(operator.eq, values, values)):
+            nans = [i for i, v in enumerate(values) if v != v]
+            others = [i for i, v in enumerate(values) if v == v]
+            return values, sorted(others, key=values.__getitem__, reverse=reverse) + nans
+        return values, sorted(range(len(values)), key=values.__getitem__, reverse=reverse)
+
+    def argsort(self, *, reverse: bool = False) -> list[int]:
+        """Return a list of the indices that would sort the Array.
+
+        reverse -- If True the indices sort the Array in descending order.
+
+        The sort is stable, and any NaNs are placed last. Integer, bool, string and bytes
+        dtypes are sorted by their codes without being decoded. Other dtypes, such as
+        floats, have every item decoded into a list at once.
+        """
+        return self._sorted_order(reverse)[1]
+
+    def sort(self, *, reverse: bool = False) -> None:
+        """Sort the items of the Array in place.
+
+        reverse -- If True the items are sorted in descending order.
+
+        The sort is stable, and any NaNs are placed last. The items keep their exact
+        bits, for example a negative zero stays negative. Any trailing bits are unchanged.
+
+        As with argsort(), integer, bool, string and bytes dtypes are sorted by their
+        codes without being decoded, and other dtypes have every item decoded at once.
+        """
+        key_dtype = self._sort_key_dtype()
+        if key_dtype is not None:
+            # Each code has its own key, so the sorted keys can be packed straight back.
+            end = len(self) * self.itemsize
+            keys = self.data._bitstore.to_values(key_dtype, 0, end)
+            self.data._bitstore[0: end] = bitstore.MutableBitStore.from_values(key_dtype, sorted(keys, reverse=reverse))
+            return
+        values, order = self._sorted_order(reverse)
+        if self._dtype._variable_length:
+            self[:] = [values[i] for i in order]
+            return
+        # Reorder the raw codes rather than repacking the values, so no bits can change.
+        end = len(order) * self.itemsize
+        raw_dtype = bitstore.tibs_dtype_for('u', self.itemsize)
+        codes = self.data._bitstore.to_values(raw_dtype, 0, end)
+        self.data._bitstore[0: end] = bitstore.MutableBitStore.from_values(raw_dtype, [codes[i] for i in order])
+
+    def is_sorted(self, *, reverse: bool = False) -> bool:
+        """Return whether the items are in order, as sort() would leave them.
+
+        reverse -- If True check for descending order instead of ascending.
+
+        Any NaNs must all be at the end.
+        """
+        in_order = operator.ge if reverse else operator.le
+        check_nan = self._dtype.return_type is float
+        previous: list[ElementType] = []
+        seen_nan = False
+        for values in self._value_chunks():
+            if check_nan and (seen_nan or not all(map(operator.eq, values, values))):
+                # Everything after the first NaN has to be a NaN too.
+                first_nan = next((i for i, v in enumerate(values) if v != v), len(values))
+                if any(v == v for v in values[first_nan:]) or (seen_nan and first_nan != 0):
+                    return False
+                seen_nan = seen_nan or first_nan != len(values)
+                values = values[:first_nan]
+            values = previous + values
+            if not all(map(in_order, values, values[1:])):
+                return False
+            previous = values[-1:] or previous
+        return True
+
+    def searchsorted(self, value: ElementType, *, side: str = 'left') -> int:
+        """Return the index at which value would be inserted to keep a sorted Array in order.
+
+        value -- The value to find the position of.
+        side -- With 'left' the index is before any items equal to value, and with
+                'right' it is after them.
+
+        The Array must already be sorted in ascending order. Only the items probed by
+        the binary search are decoded, so this takes O(log n) item reads.
+        """
+        if side == 'left':
+            return bisect.bisect_left(self, value)
+        if side == 'right':
+            return bisect.bisect_right(self, value)
+        raise ValueError(f"side must be 'left' or 'right', not {side!r}.")
+
     def to_bytes(self) -> bytes:
         """Return the Array data as a bytes object, padding with zero bits if needed.
 
@@ -511,18 +1305,26 @@ class Array:
         self.to_file(f)
 
     @classmethod
-    def from_file(cls, dtype: str | Dtype, source: str | pathlib.Path | BinaryIO | None = None, /, n: int | None = None) -> Array:
+    def from_file(cls, dtype: str | Dtype, source: str | pathlib.Path | BinaryIO | None = None, /, n: int | None = None,
+                  *, lazy: bool = False) -> Array | bitstring.MappedArray:
         """Create a new Array with items read from a file path or binary file object.
 
         If a file object is given the items are read from its current file position.
         If n is given then exactly n items are read, and an EOFError is raised if
         not enough data is available. Otherwise as many whole items as possible are read.
+
+        If lazy is True a read-only MappedArray is returned instead, which memory-maps
+        the file and only decodes items when they are used. A file object must then be
+        open on a real file, and its position isn't changed.
         """
         if source is None:
             raise TypeError("Array.from_file() missing its 'source' argument: a file path or binary file object.")
-        x = cls(dtype)
         if n is not None and n < 0:
             raise ValueError("n must be >= 0.")
+        x = cls(dtype)
+        x._check_fixed_length('Array.from_file()')
+        if lazy:
+            return bitstring.mappedarray.MappedArray._from_source(dtype, source, n)
         item_bits = x.itemsize
         bytes_wanted = None if n is None else (n * item_bits + 7) // 8
         if isinstance(source, (str, pathlib.Path)):
@@ -539,17 +1341,51 @@ class Array:
             x.data._bitstore += MutableBitStore.from_bytes(b, length=bits_to_use)
         return x
 
+    @classmethod
+    def memmap(cls, dtype: str | Dtype, source: str | pathlib.Path | BinaryIO, /, n: int | None = None, *,
+               mode: str = 'r+') -> bitstring.MappedArray:
+        """Return a MappedArray over the items of a file, which is memory-mapped rather than read.
+
+        mode -- 'r+' to write changes to the items straight into the file, or 'r' for
+                read-only access as with from_file(..., lazy=True).
+
+        If a file object is given it must be open on a real file, and in a mode that
+        allows writing for 'r+'. The items start at its current file position. If n is
+        given then exactly n items are used, and an EOFError is raised if not enough
+        data is available. Otherwise as many whole items as possible are used.
+        """
+        if mode not in ('r', 'r+'):
+            raise ValueError(f"mode must be 'r' or 'r+', not {mode!r}.")
+        if n is not None and n < 0:
+            raise ValueError("n must be >= 0.")
+        cls(dtype)._check_fixed_length('Array.memmap()')
+        return bitstring.mappedarray.MappedArray._from_source(dtype, source, n, mode == 'r+')
+
     def reverse(self) -> None:
+        if self._dtype._variable_length:
+            _, _, end = self._variable_index()
+            if end != len(self.data):
+                raise ValueError(f"Cannot reverse the items in the Array as it has {len(self.data) - end} trailing bits.")
+            self.data[:] = self._dtype.pack_many(reversed(self.to_list()))
+            return
         itemsize = self.itemsize
         trailing_bit_length = len(self.data) % itemsize
         if trailing_bit_length != 0:
             raise ValueError(f"Cannot reverse the items in the Array as its data length ({len(self.data)} bits) is not a multiple of the format length ({itemsize} bits).")
-        for start_bit in range(0, len(self.data) // 2, itemsize):
-            start_swap_bit = len(self.data) - start_bit - itemsize
-            temp = self.data[start_bit: start_bit + itemsize]
-            self.data[start_bit: start_bit + itemsize] = self.data[
-                                                               start_swap_bit: start_swap_bit + itemsize]
-            self.data[start_swap_bit: start_swap_bit + itemsize] = temp
+        store = self.data._bitstore
+        typecode = _RAW_ITEM_TYPECODES.get(itemsize)
+        if typecode is not None:
+            # The items are whole machine-sized words, so reversing them as such keeps
+            # the bytes within each item in order.
+            words = array.array(typecode, store.to_bytes())
+            words.reverse()
+            reversed_store = bitstore.MutableBitStore.from_bytes(words.tobytes())
+        else:
+            raw_dtype = bitstore.tibs_dtype_for('u', itemsize)
+            codes = store.to_values(raw_dtype, 0, len(store))
+            codes.reverse()
+            reversed_store = bitstore.MutableBitStore.from_values(raw_dtype, codes)
+        store[:] = reversed_store
 
     def pp(self, fmt: str | None = None, width: int = 120,
            show_offset: bool = True, stream: TextIO | None = None, color: bool | None = None) -> None:
@@ -563,6 +1399,7 @@ class Array:
         color -- If True use ANSI colours, if False disable them. Defaults to honouring NO_COLOR.
 
         """
+        self._check_fixed_length('pp()')
         if stream is None:
             stream = sys.stdout
         colour = Colour(should_use_color(color))
@@ -635,42 +1472,79 @@ class Array:
         return False
 
     def __iter__(self) -> Iterable[ElementType]:
+        if self._dtype._variable_length:
+            # Decode a chunk of codes at a time rather than the whole Array up front.
+            for values in self._value_chunks(_VARIABLE_LENGTH_ITER_CHUNK):
+                yield from values
+            return
         itemsize = self.itemsize
         if self._tibs_dtype is not None:
             yield from self.data._bitstore.to_values_iter(
-                self._tibs_dtype, len(self.data) // itemsize * itemsize)
+                self._tibs_dtype, 0, len(self.data) // itemsize * itemsize)
+            return
+        if self._bulk_decode is not None:
+            for values in self._value_chunks(_BULK_DECODE_ITER_CHUNK):
+                yield from values
             return
         start = 0
         for _ in range(len(self)):
             yield self._dtype._read_fn(self.data, start=start)
             start += itemsize
 
+    def __buffer__(self, flags: int, /) -> memoryview:
+        """Return a read-only memoryview of a copy of the data, for the buffer protocol (Python 3.12 or later).
+
+        Raises BufferError unless the data is a whole number of bytes.
+        """
+        return self.data.__buffer__(flags)
+
     def __copy__(self) -> Array:
         a_copy = self.__class__(self._dtype)
         a_copy.data = copy.copy(self.data)
         return a_copy
 
     def __getstate__(self) -> dict[str, Any]:
-        # The cached tibs dtype can't be pickled, and is derived anyway.
+        # The cached tibs dtype and offset index can't be pickled, and are derived anyway.
         state = self.__dict__.copy()
         del state['_tibs_dtype']
+        del state['_bulk_decode']
+        del state['_bulk_encode']
+        state.pop('_index', None)
         return state
 
     def __setstate__(self, state: dict[str, Any]) -> None:
         self.__dict__.update(state)
         self._set_tibs_dtype()
 
+    def _bulk_list(self) -> list[ElementType] | None:
+        """Return every item decoded in bulk, or None if they have to be read one at a time."""
+        if self._tibs_dtype is None and self._bulk_decode is None:
+            return None
+        return self.to_list()
+
+    def _bulk_pack(self, values: Iterable[Any]) -> MutableBitStore | None:
+        """Pack values for this Array's dtype in one go, or return None if that's not possible.
+
+        None is also returned for a bad value, so the caller can fall back to packing
+        an item at a time, which raises exactly the error it always did.
+        """
+        try:
+            if self._tibs_dtype is not None:
+                return bitstore.MutableBitStore.from_values(self._tibs_dtype, values)
+            if self._bulk_encode is not None:
+                return self._bulk_encode(values)
+        except Exception:
+            pass
+        return None
+
     def _bulk_pack_into(self, new_array: Array, values: Iterable[Any]) -> bool:
         """Pack values into an empty new_array in one go, returning False if it can't.
 
         A False return leaves new_array untouched, so the caller can fall back to
         packing an element at a time.
         """
-        if new_array._tibs_dtype is None:
-            return False
-        try:
-            packed = bitstore.MutableBitStore.from_values(new_array._tibs_dtype, values)
-        except Exception:
+        packed = new_array._bulk_pack(values)
+        if packed is None:
             return False
         new_array.data._addright_bitstore(packed)
         return True
@@ -687,19 +1561,23 @@ class Array:
         else:
             def partial_op(a):
                 return op(a)
+        if self._dtype._variable_length:
+            new_array.data = self._apply_op_to_codes(op, partial_op, new_array._dtype)
+            return new_array
         itemsize = self.itemsize
-        if self._tibs_dtype is not None:
+        values = self._bulk_list()
+        if values is not None:
             # Bulk read, apply, bulk write. Anything that goes wrong - a bad operand or
             # a result that won't pack - falls through to the loop below, which reports
             # the failure count and message exactly as it always has.
             try:
-                new_values = [partial_op(v) for v in self.to_list()]
+                new_values = [partial_op(v) for v in values]
             except Exception:
                 new_values = None
             if new_values is not None and self._bulk_pack_into(new_array, new_values):
                 return new_array
         for i in range(len(self)):
-            v = self._dtype._read_fn(self.data, start=itemsize * i)
+            v = values[i] if values is not None else self._dtype._read_fn(self.data, start=itemsize * i)
             try:
                 new_data.append(new_array._create_element(partial_op(v)))
             except (CreationError, ZeroDivisionError, ValueError) as e:
@@ -713,15 +1591,65 @@ class Array:
         new_array.data = new_data
         return new_array
 
+    def _apply_op_to_codes(self, op, partial_op, dtype: Dtype) -> BitArray:
+        """Apply partial_op to each item of a variable-length Array and return the results packed as dtype.
+
+        Failures are counted and reported in the same way as for fixed-length dtypes.
+        """
+        values = self.to_list()
+        try:
+            new_array = self.__class__(dtype, [partial_op(v) for v in values])
+        except Exception:
+            pass  # Fall through to the loop below for its error reporting.
+        else:
+            return new_array.data
+        new_data = BitArray()
+        failures = index = 0
+        msg = ''
+        for i, v in enumerate(values):
+            try:
+                new_data.append(dtype.pack(partial_op(v)))
+            except (CreationError, ZeroDivisionError, ValueError) as e:
+                if failures == 0:
+                    msg = str(e)
+                    index = i
+                failures += 1
+        if failures != 0:
+            raise ValueError(f"Applying operator '{op.__name__}' to Array caused {failures} errors. "
+                             f'First error at index {index} was: "{msg}"')
+        return new_data
+
     def _apply_op_to_all_elements_inplace(self, op, value: int | float) -> Array:
         """Apply op with value to each element of the Array in place."""
-        # This isn't really being done in-place, but it's simpler and faster for now?
+        if self._dtype._variable_length:
+            new_data = self._apply_op_to_codes(op, lambda a: op(a, value), self._dtype)
+            # Any trailing bits are kept, as they are when items are assigned.
+            _, _, end = self._variable_index()
+            self.data._bitstore[0: end] = new_data._bitstore
+            return self
         new_data = BitArray()
         failures = index = 0
         msg = ''
         itemsize = self.itemsize
+        values = self._bulk_list()
+        if values is not None:
+            # Bulk read, apply, and then overwrite the data with the bulk packed results.
+            # As in _apply_op_to_all_elements, anything that goes wrong falls through
+            # to the loop below for its error reporting, with the Array left unchanged.
+            try:
+                new_values = [op(v, value) for v in values]
+            except Exception:
+                new_values = None
+            packed = None if new_values is None else self._bulk_pack(new_values)
+            if packed is not None:
+                end = len(values) * itemsize
+                store = self.data._bitstore
+                store[0: end] = packed
+                # Trailing bits are dropped, just as they are by the per-element version.
+                del store[end:]
+                return self
         for i in range(len(self)):
-            v = self._dtype._read_fn(self.data, start=itemsize * i)
+            v = values[i] if values is not None else self._dtype._read_fn(self.data, start=itemsize * i)
             try:
                 new_data.append(self._create_element(op(v, value)))
             except (CreationError, ZeroDivisionError, ValueError) as e:
@@ -737,18 +1665,25 @@ class Array:
 
     def _apply_bitwise_op_to_all_elements(self, op, value: BitsType) -> Array:
         """Apply op with value to each element of the Array as an unsigned integer and return a new Array"""
+        self._check_fixed_length('the bitwise operators')
         a_copy = self[:]
         a_copy._apply_bitwise_op_to_all_elements_inplace(op, value)
         return a_copy
 
     def _apply_bitwise_op_to_all_elements_inplace(self, op, value: BitsType) -> Array:
         """Apply op with value to each element of the Array as an unsigned integer in place."""
+        self._check_fixed_length('the bitwise operators')
         value = BitArray._create_from_bitstype(value)
         itemsize = self.itemsize
         if len(value) != itemsize:
             raise ValueError(f"Bitwise op needs a bitstring of length {itemsize} to match format {self._dtype}.")
-        for start in range(0, len(self) * itemsize, itemsize):
-            self.data[start: start + itemsize] = op(self.data[start: start + itemsize], value)
+        # The same value is used for every item, so repeat it and apply the op just once.
+        mask = value * len(self)
+        trailing = len(self.data) - len(mask)
+        if trailing:
+            # The trailing bits aren't an item, so pad the mask with bits that leave them unchanged.
+            mask.append(Bits.from_ones(trailing) if op is operator.iand else Bits.from_zeros(trailing))
+        op(self.data, mask)
         return self
 
     def _apply_op_between_arrays(self, op, other: Array, is_comparison: bool = False) -> Array:
@@ -761,26 +1696,33 @@ class Array:
             raise ValueError(msg)
         if is_comparison:
             new_type = dtype_register.get_dtype('bool', 1)
+        elif self._dtype._variable_length and self._dtype == other._dtype:
+            new_type = self._dtype
         else:
             new_type = self._promotetype(self._dtype, other._dtype)
         new_array = self.__class__(new_type)
+        if self._dtype._variable_length or other._dtype._variable_length:
+            new_array.extend(list(map(op, self.to_list(), other.to_list())))
+            return new_array
         new_data = BitArray()
         failures = index = 0
         msg = ''
         itemsize = self.itemsize
         other_itemsize = other.itemsize
-        if self._tibs_dtype is not None and other._tibs_dtype is not None:
+        values = self._bulk_list()
+        other_values = other._bulk_list()
+        if values is not None and other_values is not None:
             # As in _apply_op_to_all_elements: bulk where possible, and fall through to
             # the per-element loop for exact error reporting when anything fails.
             try:
-                new_values = list(map(op, self.to_list(), other.to_list()))
+                new_values = list(map(op, values, other_values))
             except Exception:
                 new_values = None
             if new_values is not None and self._bulk_pack_into(new_array, new_values):
                 return new_array
         for i in range(len(self)):
-            a = self._dtype._read_fn(self.data, start=itemsize * i)
-            b = other._dtype._read_fn(other.data, start=other_itemsize * i)
+            a = values[i] if values is not None else self._dtype._read_fn(self.data, start=itemsize * i)
+            b = other_values[i] if other_values is not None else other._dtype._read_fn(other.data, start=other_itemsize * i)
             try:
                 new_data.append(new_array._create_element(op(a, b)))
             except (CreationError, ValueError, ZeroDivisionError) as e:
@@ -9,7 +9,7 @@ import array
 import io
 import functools
 from typing import Union, Any, BinaryIO, TextIO, overload, TypeVar
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Iterator, Sequence
 from tibs import Mutibs, Tibs
 import bitstring
 from bitstring import utils
@@ -42,6 +42,59 @@ _PROMOTED_STR_CACHE_SIZE = 256
 # Maximum number of digits to use in __str__ and __repr__.
 MAX_CHARS: int = 250
 
+# Searched for to find the end of an exponential-Golomb code's leading zeros.
+_ONE_BIT = ConstBitStore.from_bin('1')
+
+# How many bits the bulk exponential-Golomb decoders take from the store at a time.
+_EXP_GOLOMB_WINDOW_BITS = 1024
+
+
+def _interleaved_lut_entry(b: int) -> tuple[int, int, int, bool]:
+    # An interleaved exponential-Golomb code is pairs of a zero and a data bit, ended
+    # by a one where the next pair would start. For the 8 bits b from a code, give
+    # (data bit count, data bits, bits used, whether the code ended).
+    data = 0
+    for j in range(4):
+        if (b >> (7 - 2 * j)) & 1:
+            return j, data, 2 * j + 1, True
+        data = (data << 1) | ((b >> (6 - 2 * j)) & 1)
+    return 4, data, 8, False
+
+
+_INTERLEAVED_LUT: list[tuple[int, int, int, bool]] = [_interleaved_lut_entry(b) for b in range(256)]
+
+
+def _decode_interleaved(rest: int, avail: int, signed: bool) -> tuple[int, int] | None:
+    """Decode an interleaved exponential-Golomb code from the top avail bits of rest.
+
+    Returns the value and how many bits are left after it, or None if the code
+    doesn't end within the avail bits.
+
+    """
+    codenum = 1
+    while True:
+        if avail >= 8:
+            count, data, used, done = _INTERLEAVED_LUT[(rest >> (avail - 8)) & 0xff]
+        elif avail > 0:
+            # Pad with zeros, which can't end the code, so it only ends if it's in real bits.
+            count, data, used, done = _INTERLEAVED_LUT[(rest << (8 - avail)) & 0xff]
+            if not done:
+                return None
+        else:
+            return None
+        codenum = (codenum << count) | data
+        avail -= used
+        if done:
+            break
+    value = codenum - 1
+    if signed and value:
+        if avail == 0:
+            return None
+        avail -= 1
+        if (rest >> avail) & 1:
+            value = -value
+    return value, avail
+
 
 def _is_bit_pattern(value: Any) -> bool:
     if not isinstance(value, (list, tuple)):
@@ -49,15 +102,16 @@ def _is_bit_pattern(value: Any) -> bool:
     return all(isinstance(x, bool) or (isinstance(x, numbers.Integral) and int(x) in (0, 1)) for x in value)
 
 
-def _open_file_source(source: str | pathlib.Path | BinaryIO) -> tuple[mmap.mmap, int, str | None]:
-    """Map a file path or binary file object for reading.
+def _open_file_source(source: str | pathlib.Path | BinaryIO, writable: bool = False) -> tuple[mmap.mmap, int, str | None]:
+    """Map a file path or binary file object for reading, or also for writing if writable is True.
 
     Returns the mmap, the bit offset of the file object's current position
     (zero for paths) and the filename if constructed from a path.
     """
+    access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
     if isinstance(source, (str, pathlib.Path)):
-        with open(pathlib.Path(source), 'rb') as f:
-            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ), 0, f.name
+        with open(pathlib.Path(source), 'r+b' if writable else 'rb') as f:
+            return mmap.mmap(f.fileno(), 0, access=access), 0, f.name
     try:
         fileno = source.fileno()
         base_bits = source.tell() * 8
@@ -66,7 +120,7 @@ def _open_file_source(source: str | pathlib.Path | BinaryIO) -> tuple[mmap.mmap,
             f"from_file() needs a file path or a file object that is open on a real file, "
             f"but received a {type(source).__name__}. For in-memory streams use from_bytes() "
             f"instead, e.g. 'from_bytes(stream.getvalue())'.")
-    return mmap.mmap(fileno, 0, access=mmap.ACCESS_READ), base_bits, None
+    return mmap.mmap(fileno, 0, access=access), base_bits, None
 
 
 class Bits:
@@ -353,6 +407,21 @@ class Bits:
     def __bytes__(self) -> bytes:
         return self.to_bytes()
 
+    def __buffer__(self, flags: int, /) -> memoryview:
+        """Return a read-only memoryview of the data, for the buffer protocol (Python 3.12 or later).
+
+        Raises BufferError unless the bitstring is a whole number of bytes. A Bits is
+        viewed without copying if it starts on a byte boundary of the data it shares,
+        which includes every Bits that isn't a slice. A BitArray can change length so
+        the view is of a copy, as it is for a Bits slice not starting on a byte boundary.
+        """
+        try:
+            return self._bitstore.to_memoryview()
+        except BufferError:
+            if len(self) % 8 != 0:
+                raise
+            return memoryview(self.to_bytes())
+
     def __str__(self) -> str:
         """Return approximate string representation of bitstring for printing.
 
@@ -986,23 +1055,60 @@ class Bits:
         reading the code.
 
         """
-        oldpos = pos
-        try:
-            while not self[pos]:
-                pos += 1
-        except IndexError:
+        length = len(self._bitstore)
+        # One search for the leading one bit, rather than testing a bit at a time.
+        one_pos = self._bitstore.find(_ONE_BIT, pos, length)
+        if one_pos is None:
+            raise bitstring.ReadError("Read off end of bitstring trying to read code.")
+        leadingzeros = one_pos - pos
+        if leadingzeros == 0:
+            return 0, pos + 1
+        end = one_pos + 1 + leadingzeros
+        if end > length:
             raise bitstring.ReadError("Read off end of bitstring trying to read code.")
-        leadingzeros = pos - oldpos
-        codenum = (1 << leadingzeros) - 1
-        if leadingzeros > 0:
-            if pos + leadingzeros + 1 > len(self):
+        return (1 << leadingzeros) - 1 + self._bitstore.read_u(one_pos + 1, leadingzeros), end
+
+    def _readue_list(self, pos: int, n: int) -> tuple[list[int], int]:
+        """Read n unsigned exponential-Golomb codes from pos, returning them and the new pos.
+
+        A window of bits is read from the store as one int, and each code's leading
+        zeros come from int.bit_length, so most codes cost a few int operations
+        rather than a call into the store. A code that doesn't fit in a window is
+        read by _readue instead.
+
+        Raises ReadError if the end of the bitstring is encountered while
+        reading the codes.
+
+        """
+        values: list[int] = []
+        append = values.append
+        store = self._bitstore
+        length = len(store)
+        remaining = n
+        while remaining > 0:
+            window = min(length - pos, _EXP_GOLOMB_WINDOW_BITS)
+            if window <= 0:
                 raise bitstring.ReadError("Read off end of bitstring trying to read code.")
-            codenum += self[pos + 1:pos + 1 + leadingzeros]._getuint()
-            pos += leadingzeros + 1
-        else:
-            assert codenum == 0
-            pos += 1
-        return codenum, pos
+            rest = store.read_u(pos, window)
+            avail = window
+            while remaining > 0:
+                leadingzeros = avail - rest.bit_length()
+                code_length = 2 * leadingzeros + 1
+                if code_length > avail:
+                    break
+                avail -= code_length
+                append((rest >> avail) - 1)
+                rest &= (1 << avail) - 1
+                remaining -= 1
+            if avail == window and remaining > 0:
+                # Not even one code fitted. Either it's too long for the window or we're
+                # at the end of the data, and _readue deals with both.
+                value, pos = self._readue(pos)
+                append(value)
+                remaining -= 1
+            else:
+                pos += window - avail
+        return values, pos
 
     def _getue(self) -> tuple[int, int]:
         try:
@@ -1045,6 +1151,11 @@ class Bits:
         m = (codenum + 1) // 2
         return (m, pos) if codenum % 2 else (-m, pos)
 
+    def _readse_list(self, pos: int, n: int) -> tuple[list[int], int]:
+        """Read n signed exponential-Golomb codes from pos, returning them and the new pos."""
+        codenums, pos = self._readue_list(pos, n)
+        return [(c + 1) // 2 if c % 2 else -(c // 2) for c in codenums], pos
+
     def _setuie(self, i: int) -> None:
         """Initialise bitstring with unsigned interleaved exponential-Golomb code for integer i.
 
@@ -1060,17 +1171,59 @@ class Bits:
         reading the code.
 
         """
-        try:
-            codenum: int = 1
-            while not self[pos]:
-                pos += 1
-                codenum <<= 1
-                codenum += self[pos]
-                pos += 1
-            pos += 1
-        except IndexError:
-            raise bitstring.ReadError("Read off end of bitstring trying to read code.")
-        return codenum - 1, pos
+        return self._read_interleaved(pos, False)
+
+    def _read_interleaved(self, pos: int, signed: bool) -> tuple[int, int]:
+        # Decode from a window of bits read as one int, 8 bits per table lookup,
+        # doubling the window for the rare code that's too long for it.
+        store = self._bitstore
+        available = len(store) - pos
+        window = min(available, 64)
+        while window > 0:
+            decoded = _decode_interleaved(store.read_u(pos, window), window, signed)
+            if decoded is not None:
+                value, avail = decoded
+                return value, pos + window - avail
+            if window == available:
+                break
+            window = min(available, 2 * window)
+        raise bitstring.ReadError("Read off end of bitstring trying to read code.")
+
+    def _read_interleaved_list(self, pos: int, n: int, signed: bool) -> tuple[list[int], int]:
+        # As _readue_list, but with the table driven decoder for each code.
+        values: list[int] = []
+        append = values.append
+        store = self._bitstore
+        length = len(store)
+        remaining = n
+        while remaining > 0:
+            window = min(length - pos, _EXP_GOLOMB_WINDOW_BITS)
+            if window <= 0:
+                raise bitstring.ReadError("Read off end of bitstring trying to read code.")
+            rest = store.read_u(pos, window)
+            avail = window
+            while remaining > 0:
+                decoded = _decode_interleaved(rest, avail, signed)
+                if decoded is None:
+                    break
+                value, avail = decoded
+                append(value)
+                remaining -= 1
+            if avail == window and remaining > 0:
+                value, pos = self._read_interleaved(pos, signed)
+                append(value)
+                remaining -= 1
+            else:
+                pos += window - avail
+        return values, pos
+
+    def _readuie_list(self, pos: int, n: int) -> tuple[list[int], int]:
+        """Read n unsigned interleaved exponential-Golomb codes from pos, returning them and the new pos."""
+        return self._read_interleaved_list(pos, n, False)
+
+    def _readsie_list(self, pos: int, n: int) -> tuple[list[int], int]:
+        """Read n signed interleaved exponential-Golomb codes from pos, returning them and the new pos."""
+        return self._read_interleaved_list(pos, n, True)
 
     def _setsie(self, i: int, ) -> None:
         """Initialise bitstring with signed interleaved exponential-Golomb code for integer i."""
@@ -1085,13 +1238,7 @@ class Bits:
         reading the code.
 
         """
-        codenum, pos = self._readuie(pos)
-        if not codenum:
-            return 0, pos
-        try:
-            return (-codenum, pos + 1) if self[pos] else (codenum, pos + 1)
-        except IndexError:
-            raise bitstring.ReadError("Read off end of bitstring trying to read code.")
+        return self._read_interleaved(pos, True)
 
     def _setbool(self, value: bool | str) -> None:
         # We deliberately don't want to have implicit conversions to bool here.
@@ -1284,6 +1431,77 @@ class Bits:
         """
         return self._readlist(fmt, 0, **kwargs)[0]
 
+    def unpack_records(self, fmt: str | list[str | int | Dtype] | ReadPlan, n: int | None = None, *,
+                       arrays: bool = False, **kwargs) -> list[list[Any]] | list[bitstring.Array]:
+        """Interpret the bitstring as repeated records of fmt and return a column per field.
+
+        fmt -- The format of a single record, as for unpack. Every token needs a known length.
+        n -- The number of records. Defaults to as many whole records as there are bits for.
+        arrays -- If True each column is returned as an Array of the field's dtype rather than a list.
+        kwargs -- A dictionary or keyword-value pairs - the keywords used in the
+                  format string will be replaced with their given value.
+
+        Pad tokens don't get a column. If the records are all plain fixed-length values
+        they are read with a single call rather than one read per record.
+
+        Raises ReadError if there aren't enough bits for n records.
+
+        """
+        plan = _plan_for(fmt, **kwargs)
+        if n is None:
+            if plan._record_length is not None:
+                n = len(self) // plan._record_length if plan._record_length else 0
+            else:
+                return self._record_columns(plan, self._read_records_to_end(plan, 0), arrays)
+        return self._record_columns(plan, self._read_records(plan, 0, n)[0], arrays)
+
+    def _read_records(self, plan: ReadPlan, pos: int, n: int) -> tuple[list[Any], int]:
+        """Read n records, as a list of rows that are each a list or tuple of values."""
+        if n < 0:
+            raise ValueError(f"Cannot read a negative number ({n}) of records.")
+        plan._check_record()
+        if plan._record_dtype is not None:
+            end = pos + n * plan._record_length
+            if pos < 0 or end > len(self):
+                raise bitstring.ReadError(f"Needed a length of at least {end - pos} bits for {n} records, "
+                                          f"but only {len(self) - pos} bits were available.")
+            if n == 0:
+                return [], pos
+            return self._bitstore.to_value_tuples(plan._record_dtype, pos, end), end
+        rows = []
+        for _ in range(n):
+            row, pos = plan._read(self, pos)
+            rows.append(row)
+        if pos > len(self):
+            raise bitstring.ReadError(f"Reading off end of bitstring after {n} records.")
+        return rows, pos
+
+    def _read_records_to_end(self, plan: ReadPlan, pos: int) -> list[Any]:
+        plan._check_record()
+        rows = []
+        while pos < len(self):
+            row, pos = plan._read(self, pos)
+            rows.append(row)
+        if pos > len(self):
+            raise bitstring.ReadError(f"Reading off end of bitstring after {len(rows)} records.")
+        return rows
+
+    @staticmethod
+    def _record_columns(plan: ReadPlan, rows: list[Any], arrays: bool) -> list[list[Any]] | list[bitstring.Array]:
+        """Transpose rows of records into a column per field."""
+        if rows:
+            columns = list(zip(*rows))
+            if plan._record_dtype is not None:
+                if plan._record_columns is not None:
+                    columns = [columns[i] for i in plan._record_columns]
+                for i, scale in plan._record_scales:
+                    columns[i] = [v * scale for v in columns[i]]
+        else:
+            columns = [()] * len(plan._dtypes)
+        if arrays:
+            return [bitstring.Array(dtype, column) for dtype, column in zip(plan._dtypes, columns)]
+        return [list(column) for column in columns]
+
     def _readlist(self, fmt: str | list[str | int | Dtype], pos: int, **kwargs) \
             -> tuple[list[int | float | str | Bits | bool | bytes | None], int]:
         if type(fmt) is str and not kwargs:
@@ -1296,9 +1514,17 @@ class Bits:
                 if 0 <= pos and end <= len(self):
                     return list(self._bitstore.to_value_tuple(dtype_tuple, pos, end)), end
             return self._read_dtype_list(dtypes, pos)
+        if type(fmt) is ReadPlan:
+            return fmt._read(self, pos)
+        return self._read_dtype_list(Bits._fmt_to_dtypes(fmt, **kwargs), pos)
+
+    @staticmethod
+    def _fmt_to_dtypes(fmt: str | list[str | int | Dtype], **kwargs) -> Sequence[Dtype]:
+        """Convert a read format to a flat list of Dtypes."""
+        if type(fmt) is str and not kwargs:
+            return _prepared_fmt(fmt)[0]
         if isinstance(fmt, str):
             fmt = [fmt]
-        # Convert to a flat list of Dtypes
         dtype_list = []
         for f_item in fmt:
             if isinstance(f_item, numbers.Integral):
@@ -1314,7 +1540,7 @@ class Bits:
                         dtype_list.append(Dtype('bits', int(t)))
                     else:
                         dtype_list.append(Dtype(name, length))
-        return self._read_dtype_list(dtype_list, pos)
+        return dtype_list
 
     def _read_dtype_list(self, dtypes: list[Dtype], pos: int) -> tuple[list[int | float | str | Bits | bool | bytes | None], int]:
         has_stretchy_token = False
@@ -1332,7 +1558,22 @@ class Bits:
 
         # We should have precisely zero or one stretchy token
         vals = []
-        for dtype in dtypes:
+        i = 0
+        while i < len(dtypes):
+            dtype = dtypes[i]
+            i += 1
+            if dtype._variable_length and dtype._scale is None:
+                bulk_read = _BULK_VARIABLE_LENGTH_READS.get(dtype._name)
+                if bulk_read is not None and i < len(dtypes) and dtypes[i] == dtype:
+                    # A run of the same code, as is typical of coefficient lists, which
+                    # is decoded in one call rather than a dispatch per token.
+                    run_end = i + 1
+                    while run_end < len(dtypes) and dtypes[run_end] == dtype:
+                        run_end += 1
+                    run_vals, pos = bulk_read(self, pos, run_end - i + 1)
+                    vals.extend(run_vals)
+                    i = run_end
+                    continue
             stretchy = dtype.bitlength is None and not dtype.variable_length
             if stretchy:
                 bits_remaining = len(self) - pos
@@ -1620,6 +1861,13 @@ class Bits:
         Up to seven zero bits will be added at the end to byte align.
 
         """
+        if len(self) % 8 == 0 and isinstance(self._bitstore, ConstBitStore):
+            try:
+                # Writes straight from the data, with no copy even if it's file based.
+                f.write(self._bitstore.to_memoryview())
+                return
+            except BufferError:
+                pass  # Not on a byte boundary of the data it shares.
         # If the bitstring is file based then we don't want to read it all in to memory first.
         chunk_size = 8 * 100 * 1024 * 1024  # 100 MiB
         for chunk in self.cut(chunk_size):
@@ -1997,6 +2245,14 @@ class Bits:
         return self._bitstore.to_tibs()
 
 
+# Variable length dtypes that _read_dtype_list can decode a run of in one call.
+_BULK_VARIABLE_LENGTH_READS = {
+    'ue': Bits._readue_list,
+    'se': Bits._readse_list,
+    'uie': Bits._readuie_list,
+    'sie': Bits._readsie_list,
+}
+
 # Types accepted directly by the auto initialiser, so that _initialise can skip the
 # checks for the initialiser forms removed in 5.0. Lists and tuples are excluded as
 # they still need validating as bit patterns.
@@ -2028,3 +2284,178 @@ def _prepared_fmt(fmt: str) -> tuple[tuple[Dtype, ...], Any, int]:
     if not specs:
         return tuple(dtypes), None, 0
     return tuple(dtypes), bitstore.tibs_dtype_tuple_for(tuple(specs)), sum(b for _, b in specs)
+
+
+# The kinds of step in a ReadPlan.
+_PLAN_FIXED_RUN, _PLAN_FIXED, _PLAN_PAD, _PLAN_CODE_RUN, _PLAN_VARIABLE, _PLAN_SCALED_RUN, _PLAN_STRETCHY = range(7)
+
+
+class ReadPlan:
+    """A read format parsed once, ready to be used for many reads.
+
+    Create with Reader.compile() and use in place of the format with Reader.read_list(),
+    Reader.peek_list() or Bits.unpack().
+
+    The tokens are grouped into steps: each run of plain fixed-length tokens is read
+    with a single core call, and each run of the same exponential-Golomb code is
+    decoded in bulk. A run that includes scaled tokens is read raw in the same way,
+    and then those values are multiplied by their scales. Anything else is read a
+    token at a time.
+
+    As with an uncompiled format, one token can have no length, in which case its
+    length is worked out at read time from the bits left after the fixed-length
+    tokens that follow it.
+    """
+
+    __slots__ = ("_fmt", "_steps", "_dtypes", "_stretchy", "_record_length", "_record_dtype", "_record_columns",
+                 "_record_scales")
+
+    def __init__(self, fmt: str | list[str | int | Dtype], **kwargs) -> None:
+        self._fmt = fmt
+        dtypes = Bits._fmt_to_dtypes(fmt, **kwargs)
+        self._stretchy = False
+        bits_after_stretchy_token = 0
+        for dtype in dtypes:
+            if dtype._bitlength is None and not dtype._variable_length:
+                if self._stretchy:
+                    raise bitstring.Error("It's not possible to have more than one 'filler' token.")
+                self._stretchy = True
+            elif self._stretchy:
+                if dtype._variable_length:
+                    raise bitstring.Error(f"It's not possible to parse a variable length token '{dtype}' after a 'filler' token.")
+                bits_after_stretchy_token += dtype._bitlength
+        steps = []
+        i = 0
+        while i < len(dtypes):
+            dtype = dtypes[i]
+            if dtype._bitlength is None and not dtype._variable_length:
+                steps.append((_PLAN_STRETCHY, dtype, bits_after_stretchy_token))
+                i += 1
+                continue
+            if dtype._variable_length:
+                run_end = i + 1
+                while run_end < len(dtypes) and dtypes[run_end] == dtype:
+                    run_end += 1
+                bulk_read = _BULK_VARIABLE_LENGTH_READS.get(dtype._name) if dtype._scale is None else None
+                if bulk_read is not None and run_end - i > 1:
+                    steps.append((_PLAN_CODE_RUN, bulk_read, run_end - i))
+                else:
+                    steps.extend((_PLAN_VARIABLE, dtype, None) for _ in range(i, run_end))
+                i = run_end
+                continue
+            if dtype._name == 'pad':
+                steps.append((_PLAN_PAD, None, dtype._bitlength))
+                i += 1
+                continue
+            run_end = i
+            while (run_end < len(dtypes) and dtypes[run_end]._bitlength is not None
+                   and bitstore.tibs_dtype_for(dtypes[run_end]._name, dtypes[run_end]._bitlength) is not None):
+                run_end += 1
+            dtype_tuple = None
+            if run_end > i:
+                dtype_tuple = bitstore.tibs_dtype_tuple_for(tuple((d._name, d._bitlength) for d in dtypes[i:run_end]))
+            if dtype_tuple is not None:
+                run_dtypes = tuple(dtypes[i:run_end])
+                bitlength = sum(d._bitlength for d in run_dtypes)
+                scales = tuple(d._scale for d in run_dtypes)
+                if any(scale is not None for scale in scales):
+                    steps.append((_PLAN_SCALED_RUN, (dtype_tuple, run_dtypes, scales), bitlength))
+                else:
+                    steps.append((_PLAN_FIXED_RUN, (dtype_tuple, run_dtypes), bitlength))
+                i = run_end
+            else:
+                steps.append((_PLAN_FIXED, dtype, dtype._bitlength))
+                i += 1
+        self._steps = tuple(steps)
+        self._dtypes = tuple(d for d in dtypes if d._name != 'pad')
+
+        # The layout for reading the plan as many repeated records, used by read_records.
+        self._record_length = None
+        self._record_dtype = None
+        self._record_columns = None
+        self._record_scales = ()
+        if not self._stretchy and not any(d._variable_length for d in dtypes):
+            self._record_length = sum(d._bitlength for d in dtypes)
+            # Pad bits are read as throwaway bin columns so that the whole record is one core dtype.
+            specs = tuple(('bin' if d._name == 'pad' else d._name, d._bitlength) for d in dtypes)
+            self._record_dtype = bitstore.tibs_dtype_tuple_for(specs)
+            if self._record_dtype is not None:
+                if len(self._dtypes) != len(dtypes):
+                    self._record_columns = tuple(i for i, d in enumerate(dtypes) if d._name != 'pad')
+                # Scaled fields are read raw, and then each of their columns is scaled in one pass.
+                self._record_scales = tuple((i, d._scale) for i, d in enumerate(self._dtypes) if d._scale is not None)
+
+    def _read(self, bits: Bits, pos: int) -> tuple[list[Any], int]:
+        vals = []
+        length = len(bits._bitstore)
+        for kind, x, n in self._steps:
+            if kind == _PLAN_FIXED_RUN:
+                end = pos + n
+                if end > length:
+                    raise ReadPlan._run_read_error(x[1], pos, length)
+                vals.extend(bits._bitstore.to_value_tuple(x[0], pos, end))
+                pos = end
+            elif kind == _PLAN_SCALED_RUN:
+                dtype_tuple, run_dtypes, scales = x
+                end = pos + n
+                if end > length:
+                    raise ReadPlan._run_read_error(run_dtypes, pos, length)
+                vals.extend(v if scale is None else v * scale
+                            for v, scale in zip(bits._bitstore.to_value_tuple(dtype_tuple, pos, end), scales))
+                pos = end
+            elif kind == _PLAN_CODE_RUN:
+                run_vals, pos = x(bits, pos, n)
+                vals.extend(run_vals)
+            elif kind == _PLAN_FIXED:
+                vals.append(x._read_fn(bits, pos))
+                pos += n
+            elif kind == _PLAN_PAD:
+                pos += n
+            elif kind == _PLAN_STRETCHY:
+                # Set the length to the bits remaining, less those needed by the tokens after it.
+                bitlength = max(length - pos - n, 0)
+                items, remainder = divmod(bitlength, x._bits_per_item)
+                if remainder != 0:
+                    raise ValueError(
+                        f"The '{x.name}' type must have a bit length that is a multiple of {x._bits_per_item}"
+                        f" so cannot be created from the {bitlength} bits that are available for this stretchy token.")
+                dtype = Dtype(x._name, items)
+                val = dtype._read_fn(bits, pos)
+                pos += dtype._bitlength
+                if val is not None:  # A pad token
+                    vals.append(val)
+            else:
+                val, pos = x._read_fn(bits, pos)
+                vals.append(val)
+        return vals, pos
+
+    def _check_record(self) -> None:
+        if self._stretchy:
+            raise ValueError(f"Every token in a record needs a known length, but {self!r} has one that doesn't.")
+
+    @staticmethod
+    def _run_read_error(run_dtypes: tuple[Dtype, ...], pos: int, length: int) -> bitstring.ReadError:
+        """The error for a run that doesn't fit, naming the first of its tokens that doesn't, as a token-at-a-time read would."""
+        for dtype in run_dtypes:
+            if pos + dtype._bitlength > length:
+                break
+            pos += dtype._bitlength
+        return bitstring.ReadError(f"Needed a length of at least {dtype._bitlength} bits, "
+                                   f"but only {length - pos} bits were available.")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self._fmt!r})"
+
+
+@functools.lru_cache(256)
+def _compiled_fmt(fmt: str) -> ReadPlan:
+    return ReadPlan(fmt)
+
+
+def _plan_for(fmt: str | list[str | int | Dtype] | ReadPlan, **kwargs) -> ReadPlan:
+    """Return a ReadPlan for a format, reusing the plan for a format string seen before."""
+    if type(fmt) is ReadPlan:
+        return fmt
+    if type(fmt) is str and not kwargs:
+        return _compiled_fmt(fmt)
+    return ReadPlan(fmt, **kwargs)
@@ -81,6 +81,11 @@ def tibs_dtype_tuple_for(specs: tuple[tuple[str, int | None], ...]) -> DtypeTupl
         return None
 
 
+def _check_whole_bytes_for_buffer(length: int) -> None:
+    if length % 8 != 0:
+        raise BufferError(f"Only a whole number of bytes can be exported as a buffer, but the data is {length} bits long.")
+
+
 def _normalise_byte_import_args(offset: int | None, length: int | None) -> tuple[int | None, int | None]:
     if length is None and isinstance(offset, int) and offset == 0:
         offset = None
@@ -234,17 +239,17 @@ class _BitStoreBase:
     def count(self, value: Any) -> int:
         return self.tibs.count(value)
 
-    def to_values(self, dtype: DtypeSingle, end: int) -> list[Any]:
-        """Unpack the bits up to end as a list of dtype values.
+    def to_values(self, dtype: DtypeSingle, start: int, end: int) -> list[Any]:
+        """Unpack the bits from start to end as a list of dtype values.
 
-        end must be a multiple of the dtype's length - tibs won't unpack a partial
+        The range must be a multiple of the dtype's length - tibs won't unpack a partial
         final item the way bitstring's Array tolerates trailing bits.
         """
-        return dtype.unpack_values(self.tibs, 0, end)
+        return dtype.unpack_values(self.tibs, start, end)
 
-    def to_values_iter(self, dtype: DtypeSingle, end: int) -> Iterator[Any]:
+    def to_values_iter(self, dtype: DtypeSingle, start: int, end: int) -> Iterator[Any]:
         """As to_values, but yields the values rather than building a list."""
-        return dtype.unpack_values_iter(self.tibs, 0, end)
+        return dtype.unpack_values_iter(self.tibs, start, end)
 
     def to_value(self, dtype: DtypeSingle, start: int, end: int) -> Any:
         """Unpack a single dtype value from the given bit range."""
@@ -254,6 +259,13 @@ class _BitStoreBase:
         """Unpack a whole list of dtypes from the given bit range in one call."""
         return dtype.unpack(self.tibs, start, end)
 
+    def to_value_tuples(self, dtype: DtypeTuple, start: int, end: int) -> list[tuple[Any, ...]]:
+        """Unpack the bit range as repeated records, each a tuple of values.
+
+        The range must be a whole number of records long.
+        """
+        return dtype.unpack_values(self.tibs, start, end)
+
     def __len__(self) -> int:
         return len(self.tibs)
 
@@ -263,6 +275,9 @@ class ConstBitStore(_BitStoreBase):
 
     __slots__ = ()
 
+    # The data can't change, so it's never been mutated.
+    mutations = 0
+
     def __setstate__(self, state: bytes) -> None:
         self.tibs = Tibs.decode(state)
 
@@ -305,7 +320,8 @@ class ConstBitStore(_BitStoreBase):
         return x
 
     @classmethod
-    def from_values(cls, dtype: DtypeSingle, values: Iterable[Any], /) -> ConstBitStore:
+    def from_values(cls, dtype: DtypeSingle | DtypeTuple, values: Iterable[Any], /) -> ConstBitStore:
+        """Pack the values - or, for a DtypeTuple, a sequence of tuples of values."""
         x = super().__new__(cls)
         x.tibs = Tibs.from_values(dtype, values)
         return x
@@ -351,6 +367,15 @@ class ConstBitStore(_BitStoreBase):
     def to_tibs(self) -> Tibs:
         return self.tibs
 
+    def to_memoryview(self) -> memoryview:
+        """A read-only view of the data, without copying it.
+
+        Raises BufferError unless the data is a whole number of bytes and starts on a
+        byte boundary of the storage it shares.
+        """
+        _check_whole_bytes_for_buffer(len(self.tibs))
+        return memoryview(self.tibs)
+
     def chunks(self, bits: int, count: int | None = None) -> Iterator[ConstBitStore]:
         for chunk in self.tibs.chunks_iter(bits, count):
             yield ConstBitStore(chunk)
@@ -378,26 +403,54 @@ class ConstBitStore(_BitStoreBase):
 class MutableBitStore(_BitStoreBase):
     """A light wrapper around tibs.Mutibs"""
 
-    __slots__ = ()
+    # mutations counts the changes made to the data, so that anything derived from it
+    # can tell whether it's still valid.
+    __slots__ = ('mutations',)
+
+    def __init__(self, initializer: Tibs | Mutibs) -> None:
+        self.tibs = initializer
+        self.mutations = 0
 
     def __setstate__(self, state: bytes) -> None:
         self.tibs = Mutibs.decode(state)
+        self.mutations = 0
+
+    # tibs promotes a Mutibs to a Tibs before unpacking it, which copies all of it even
+    # when only a few bits are wanted. Slicing first means only the range is copied.
+
+    def to_values(self, dtype: DtypeSingle, start: int, end: int) -> list[Any]:
+        return dtype.unpack_values(self.tibs[start:end])
+
+    def to_values_iter(self, dtype: DtypeSingle, start: int, end: int) -> Iterator[Any]:
+        return dtype.unpack_values_iter(self.tibs[start:end])
+
+    def to_value(self, dtype: DtypeSingle, start: int, end: int) -> Any:
+        return dtype.unpack(self.tibs[start:end])
+
+    def to_value_tuple(self, dtype: DtypeTuple, start: int, end: int) -> tuple[Any, ...]:
+        return dtype.unpack(self.tibs[start:end])
+
+    def to_value_tuples(self, dtype: DtypeTuple, start: int, end: int) -> list[tuple[Any, ...]]:
+        return dtype.unpack_values(self.tibs[start:end])
 
     @classmethod
     def join(cls, bitstores: Iterable[MutableBitStore], /) -> MutableBitStore:
         x = super().__new__(cls)
+        x.mutations = 0
         x.tibs = Mutibs.from_joined(b.tibs for b in bitstores)
         return x
 
     @classmethod
     def from_zeros(cls, i: int) -> MutableBitStore:
         x = super().__new__(cls)
+        x.mutations = 0
         x.tibs = Mutibs.from_zeros(i)
         return x
 
     @classmethod
     def from_ones(cls, i: int) -> MutableBitStore:
         x = super().__new__(cls)
+        x.mutations = 0
         x.tibs = Mutibs.from_ones(i)
         return x
 
@@ -405,6 +458,7 @@ class MutableBitStore(_BitStoreBase):
     def from_bytes(cls, b: bytes | bytearray | memoryview, /, offset: int | None = None,
                    length: int | None = None) -> MutableBitStore:
         x = super().__new__(cls)
+        x.mutations = 0
         offset, length = _normalise_byte_import_args(offset, length)
         x.tibs = Mutibs.from_bytes(b, offset=offset, length=length)
         return x
@@ -412,36 +466,49 @@ class MutableBitStore(_BitStoreBase):
     @classmethod
     def from_bools(cls, iterable: Iterable[Any], /) -> MutableBitStore:
         x = super().__new__(cls)
+        x.mutations = 0
         x.tibs = Mutibs.from_bools(iterable)
         return x
 
     @classmethod
     def from_values(cls, dtype: DtypeSingle, values: Iterable[Any], /) -> MutableBitStore:
         x = super().__new__(cls)
+        x.mutations = 0
         x.tibs = Mutibs.from_values(dtype, values)
         return x
 
+    def __imul__(self, n: int, /) -> MutableBitStore:
+        self.mutations += 1
+        self.tibs *= n
+        return self
+
     def __ilshift__(self, n: int, /) -> MutableBitStore:
+        self.mutations += 1
         self.tibs <<= n
         return self
 
     def __irshift__(self, n: int, /) -> MutableBitStore:
+        self.mutations += 1
         self.tibs >>= n
         return self
 
     def __iadd__(self, other: MutableBitStore | ConstBitStore, /) -> MutableBitStore:
+        self.mutations += 1
         self.tibs += other.tibs
         return self
 
     def __iand__(self, other: MutableBitStore | ConstBitStore, /) -> MutableBitStore:
+        self.mutations += 1
         self.tibs &= other.tibs
         return self
 
     def __ior__(self, other: MutableBitStore | ConstBitStore, /) -> MutableBitStore:
+        self.mutations += 1
         self.tibs |= other.tibs
         return self
 
     def __ixor__(self, other: MutableBitStore | ConstBitStore, /) -> MutableBitStore:
+        self.mutations += 1
         self.tibs ^= other.tibs
         return self
 
@@ -456,12 +523,15 @@ class MutableBitStore(_BitStoreBase):
         return self.tibs.find_all(bs.tibs, start=start, end=end, byte_aligned=bytealigned)
 
     def clear(self) -> None:
+        self.mutations += 1
         self.tibs.clear()
 
     def reverse(self) -> None:
+        self.mutations += 1
         self.tibs.reverse()
 
     def byte_swap(self, start: int | None, end: int | None) -> None:
+        self.mutations += 1
         self.tibs.byte_swap(start=start, end=end)
 
     def __iter__(self) -> Iterable[bool]:
@@ -471,6 +541,7 @@ class MutableBitStore(_BitStoreBase):
             yield self.getindex(i)
 
     def extend_left(self, other: MutableBitStore | ConstBitStore, /) -> None:
+        self.mutations += 1
         self.tibs.extend_left(other.tibs)
 
     def _mutable_copy(self) -> MutableBitStore:
@@ -488,6 +559,16 @@ class MutableBitStore(_BitStoreBase):
         """Return an immutable snapshot of the data."""
         return ConstBitStore(self.tibs.to_tibs())
 
+    def share(self) -> Tibs:
+        """Return the data as a Tibs that can be shared without copying it.
+
+        The data is moved into the Tibs rather than copied, and the store becomes a
+        SharedBitStore, which only copies it again when it's next changed.
+        """
+        self.tibs = self.tibs.as_tibs()
+        self.__class__ = SharedBitStore
+        return self.tibs
+
     @classmethod
     def from_tibs(cls, t: Tibs | Mutibs, /) -> MutableBitStore:
         if isinstance(t, Tibs):
@@ -499,13 +580,23 @@ class MutableBitStore(_BitStoreBase):
     def to_tibs(self) -> Tibs:
         return self.tibs.to_tibs()
 
+    def to_memoryview(self) -> memoryview:
+        """A read-only view of a copy of the data.
+
+        The mutable storage can move when it's resized, so it can't be viewed directly.
+        """
+        _check_whole_bytes_for_buffer(len(self.tibs))
+        return memoryview(self.tibs.to_bytes())
+
     def invert(self, index: int | None = None, /) -> None:
+        self.mutations += 1
         if index is not None:
             self.tibs.invert(index)
         else:
             self.tibs.invert()
 
     def set(self, value: Any, pos: Any, /) -> None:
+        self.mutations += 1
         if value:
             self.tibs.set(pos)
         else:
@@ -514,16 +605,20 @@ class MutableBitStore(_BitStoreBase):
     def replace(self, old: MutableBitStore | ConstBitStore, new: MutableBitStore | ConstBitStore,
                 start: int | None = None, end: int | None = None,
                 count: int | None = None, bytealigned: bool = False) -> int:
+        self.mutations += 1
         return self.tibs.replace(old.tibs, new.tibs, start=start, end=end, count=count,
                                  byte_aligned=bytealigned)
 
     def rotate_left(self, n: int, start: int | None = None, end: int | None = None) -> None:
+        self.mutations += 1
         self.tibs.rotate_left(n, start=start, end=end)
 
     def rotate_right(self, n: int, start: int | None = None, end: int | None = None) -> None:
+        self.mutations += 1
         self.tibs.rotate_right(n, start=start, end=end)
 
     def __setitem__(self, key, value, /):
+        self.mutations += 1
         if isinstance(value, (MutableBitStore, ConstBitStore)):
             self.tibs.__setitem__(key, value.tibs)
         else:
@@ -535,4 +630,126 @@ class MutableBitStore(_BitStoreBase):
                 self.tibs.unset(key)
 
     def __delitem__(self, key, /):
+        self.mutations += 1
         self.tibs.__delitem__(key)
+
+
+class SharedBitStore(MutableBitStore):
+    """A MutableBitStore whose data is a tibs.Tibs that other stores may also use.
+
+    Slicing a Tibs doesn't copy its data, so a SharedBitStore and its slices can share
+    one buffer. The first change to a store copies the data into a Mutibs of its own,
+    after which it's an ordinary MutableBitStore again.
+    """
+
+    __slots__ = ()
+
+    def __setstate__(self, state: bytes) -> None:
+        self.tibs = Tibs.decode(state)
+        self.mutations = 0
+
+    def _unshare(self) -> None:
+        # Called before every change. The methods then call MutableBitStore's directly,
+        # as the class has changed and super() no longer applies.
+        self.tibs = self.tibs.to_mutibs()
+        self.__class__ = MutableBitStore
+
+    # A Tibs can be unpacked in place, so there's no need to slice it first.
+    to_values = _BitStoreBase.to_values
+    to_values_iter = _BitStoreBase.to_values_iter
+    to_value = _BitStoreBase.to_value
+    to_value_tuple = _BitStoreBase.to_value_tuple
+    to_value_tuples = _BitStoreBase.to_value_tuples
+    to_memoryview = ConstBitStore.to_memoryview
+
+    def findall(self, bs: ConstBitStore | MutableBitStore, start: int, end: int, bytealigned: bool = False) -> Iterator[int]:
+        return self.tibs.find_all_iter(bs.tibs, start=start, end=end, byte_aligned=bytealigned)
+
+    def _mutable_copy(self) -> SharedBitStore:
+        """The copy shares the data too, as neither can change it without copying it first."""
+        return SharedBitStore(self.tibs)
+
+    def to_const(self) -> ConstBitStore:
+        return ConstBitStore(self.tibs)
+
+    def share(self) -> Tibs:
+        return self.tibs
+
+    def to_tibs(self) -> Tibs:
+        return self.tibs
+
+    def __imul__(self, n: int, /) -> MutableBitStore:
+        self._unshare()
+        return MutableBitStore.__imul__(self, n)
+
+    def __ilshift__(self, n: int, /) -> MutableBitStore:
+        self._unshare()
+        return MutableBitStore.__ilshift__(self, n)
+
+    def __irshift__(self, n: int, /) -> MutableBitStore:
+        self._unshare()
+        return MutableBitStore.__irshift__(self, n)
+
+    def __iadd__(self, other: MutableBitStore | ConstBitStore, /) -> MutableBitStore:
+        self._unshare()
+        return MutableBitStore.__iadd__(self, other)
+
+    def __iand__(self, other: MutableBitStore | ConstBitStore, /) -> MutableBitStore:
+        self._unshare()
+        return MutableBitStore.__iand__(self, other)
+
+    def __ior__(self, other: MutableBitStore | ConstBitStore, /) -> MutableBitStore:
+        self._unshare()
+        return MutableBitStore.__ior__(self, other)
+
+    def __ixor__(self, other: MutableBitStore | ConstBitStore, /) -> MutableBitStore:
+        self._unshare()
+        return MutableBitStore.__ixor__(self, other)
+
+    def clear(self) -> None:
+        # Nothing needs copying when it's all about to go.
+        self.mutations += 1
+        self.tibs = Mutibs()
+        self.__class__ = MutableBitStore
+
+    def reverse(self) -> None:
+        self._unshare()
+        MutableBitStore.reverse(self)
+
+    def byte_swap(self, start: int | None, end: int | None) -> None:
+        self._unshare()
+        MutableBitStore.byte_swap(self, start, end)
+
+    def extend_left(self, other: MutableBitStore | ConstBitStore, /) -> None:
+        self._unshare()
+        MutableBitStore.extend_left(self, other)
+
+    def invert(self, index: int | None = None, /) -> None:
+        self._unshare()
+        MutableBitStore.invert(self, index)
+
+    def set(self, value: Any, pos: Any, /) -> None:
+        self._unshare()
+        MutableBitStore.set(self, value, pos)
+
+    def replace(self, old: MutableBitStore | ConstBitStore, new: MutableBitStore | ConstBitStore,
+                start: int | None = None, end: int | None = None,
+                count: int | None = None, bytealigned: bool = False) -> int:
+        self._unshare()
+        return MutableBitStore.replace(self, old, new, start, end, count, bytealigned)
+
+    def rotate_left(self, n: int, start: int | None = None, end: int | None = None) -> None:
+        self._unshare()
+        MutableBitStore.rotate_left(self, n, start, end)
+
+    def rotate_right(self, n: int, start: int | None = None, end: int | None = None) -> None:
+        self._unshare()
+        MutableBitStore.rotate_right(self, n, start, end)
+
+    def __setitem__(self, key, value, /):
+        self._unshare()
+        MutableBitStore.__setitem__(self, key, value)
+
+    def __delitem__(self, key, /):
+        self._unshare()
+        MutableBitStore.__delitem__(self, key)
@@ -4,7 +4,7 @@ from tibs import Tibs, ByteOrder
 
 import struct
 import math
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 import functools
 import bitstring
 from bitstring.fp8 import p4binary_fmt, p3binary_fmt
@@ -68,7 +68,7 @@ CACHE_SIZE = 256
 def _to_const_bitstore(bs: MutableBitStore | ConstBitStore) -> ConstBitStore:
     if isinstance(bs, ConstBitStore):
         return bs
-    return ConstBitStore(bs.tibs.to_tibs())
+    return bs.to_const()
 
 
 def _bin_literal_to_const_bitstore(binstring: str) -> ConstBitStore:
@@ -129,43 +129,110 @@ def bitstore_from_token(name: str, token_length: int | None, value: str | None)
 
 
 
-def ue2bitstore(i: str | int) -> ConstBitStore:
-    i = int(i)
+# Each byte with its bits spread out to the even bit positions of a 16 bit value.
+_SPREAD_BYTE: list[int] = [sum(((b >> j) & 1) << (2 * j) for j in range(8)) for b in range(256)]
+
+# Codes are gathered into an int until it's about this long, then flushed to a tibs.
+_EXP_GOLOMB_FLUSH_BITS = 4096
+
+
+def _ue_code(i: int) -> tuple[int, int]:
+    """The unsigned exponential-Golomb code for i, as its value and bit length."""
     if i < 0:
         raise bitstring.CreationError("Cannot use negative initialiser for unsigned exponential-Golomb.")
+    # The code is i + 1 in binary, preceded by one fewer zeros than it has bits.
+    i += 1
+    return i, 2 * i.bit_length() - 1
+
+
+def _se_code(i: int) -> tuple[int, int]:
+    """The signed exponential-Golomb code for i, as its value and bit length."""
+    return _ue_code(2 * i - 1 if i > 0 else -2 * i)
+
+
+def _uie_code(i: int) -> tuple[int, int]:
+    """The unsigned interleaved exponential-Golomb code for i, as its value and bit length."""
+    if i < 0:
+        raise bitstring.CreationError("Cannot use negative initialiser for unsigned interleaved exponential-Golomb.")
+    # Each bit of i + 1 after the leading one gets a zero before it, then a one ends the code.
+    i += 1
+    n = i.bit_length() - 1
+    tail = i - (1 << n)
+    spread = shift = 0
+    while tail:
+        spread |= _SPREAD_BYTE[tail & 0xff] << shift
+        tail >>= 8
+        shift += 16
+    return (spread << 1) | 1, 2 * n + 1
+
+
+def _sie_code(i: int) -> tuple[int, int]:
+    """The signed interleaved exponential-Golomb code for i, as its value and bit length."""
     if i == 0:
-        return ConstBitStore.from_bin('1')
-    tmp = i + 1
-    leadingzeros = -1
-    while tmp > 0:
-        tmp >>= 1
-        leadingzeros += 1
-    remainingpart = i + 1 - (1 << leadingzeros)
-    return ConstBitStore.from_bin('0' * leadingzeros + '1') + int2bitstore(remainingpart, leadingzeros, False)
+        return 1, 1
+    value, length = _uie_code(abs(i))
+    return (value << 1) | (i < 0), length + 1
+
+
+def _codes2bitstore(code_fn: Callable[[int], tuple[int, int]], values: Iterable[str | int]) -> ConstBitStore:
+    """Encode every value with code_fn and join the codes into a single bitstore."""
+    chunks = []
+    acc = acc_length = 0
+    for v in values:
+        value, length = code_fn(int(v))
+        acc = (acc << length) | value
+        acc_length += length
+        if acc_length >= _EXP_GOLOMB_FLUSH_BITS:
+            chunks.append(Tibs.from_u(acc, acc_length))
+            acc = acc_length = 0
+    if acc_length:
+        chunks.append(Tibs.from_u(acc, acc_length))
+    return ConstBitStore(Tibs.from_joined(chunks))
+
+
+def ue2bitstore(i: str | int) -> ConstBitStore:
+    value, length = _ue_code(int(i))
+    return ConstBitStore(Tibs.from_u(value, length))
 
 
 def se2bitstore(i: str | int) -> ConstBitStore:
-    i = int(i)
-    if i > 0:
-        u = (i * 2) - 1
-    else:
-        u = -2 * i
-    return ue2bitstore(u)
+    value, length = _se_code(int(i))
+    return ConstBitStore(Tibs.from_u(value, length))
 
 
 def uie2bitstore(i: str | int) -> ConstBitStore:
-    i = int(i)
-    if i < 0:
-        raise bitstring.CreationError("Cannot use negative initialiser for unsigned interleaved exponential-Golomb.")
-    return ConstBitStore.from_bin('1' if i == 0 else '0' + '0'.join(bin(i + 1)[3:]) + '1')
+    value, length = _uie_code(int(i))
+    return ConstBitStore(Tibs.from_u(value, length))
 
 
 def sie2bitstore(i: str | int) -> ConstBitStore:
-    i = int(i)
-    if i == 0:
-        return ConstBitStore.from_bin('1')
-    else:
-        return uie2bitstore(abs(i)) + (ConstBitStore.from_bin('1') if i < 0 else ConstBitStore.from_bin('0'))
+    value, length = _sie_code(int(i))
+    return ConstBitStore(Tibs.from_u(value, length))
+
+
+def ue_list2bitstore(values: Iterable[str | int]) -> ConstBitStore:
+    return _codes2bitstore(_ue_code, values)
+
+
+def se_list2bitstore(values: Iterable[str | int]) -> ConstBitStore:
+    return _codes2bitstore(_se_code, values)
+
+
+def uie_list2bitstore(values: Iterable[str | int]) -> ConstBitStore:
+    return _codes2bitstore(_uie_code, values)
+
+
+def sie_list2bitstore(values: Iterable[str | int]) -> ConstBitStore:
+    return _codes2bitstore(_sie_code, values)
+
+
+# The variable length dtypes that can pack a whole list of values in one go.
+list2bitstore_funcs: dict[str, Callable[[Iterable[str | int]], ConstBitStore]] = {
+    'ue': ue_list2bitstore,
+    'se': se_list2bitstore,
+    'uie': uie_list2bitstore,
+    'sie': sie_list2bitstore,
+}
 
 
 def bfloat2bitstore(f: str | float, big_endian: bool) -> ConstBitStore:
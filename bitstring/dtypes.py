@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import functools
 from typing import Any
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 import inspect
 import bitstring
 from bitstring import utils
@@ -60,6 +60,7 @@ class Dtype:
     _bits_per_item: int
     _length: int | None
     _scale: None | float | int
+    _tibs_dtype: Any
 
     def __new__(cls, token: str | Dtype, /, length: int | None = None, scale: None | float | int = None) -> Dtype:
         if isinstance(token, cls):
@@ -154,6 +155,8 @@ class Dtype:
         x._bits_per_item = definition.multiplier
         if x._bitlength is not None:
             x._bitlength *= x._bits_per_item
+        # The core's equivalent of the unscaled dtype, or None, so reads needn't look it up each time.
+        x._tibs_dtype = bitstring.bitstore.tibs_dtype_for(x._name, x._bitlength)
         x._set_fn_needs_length = definition.set_fn_needs_length
         x._variable_length = definition.variable_length
         if x._variable_length or dtype_register.names[x._name].allowed_lengths.only_one_value():
@@ -185,6 +188,33 @@ class Dtype:
             raise ValueError(f"Dtype has a length of {bitlength} bits, but value '{value}' has {len(b)} bits.")
         return b
 
+    def pack_many(self, values: Iterable[Any], /) -> bitstring.Bits:
+        """Pack each of the values and join them into a single bitstring.
+
+        Equivalent to joining pack(value) for every value, but the whole list is
+        encoded in one go where the dtype allows.
+
+        >>> Dtype('ue').pack_many([0, 1, 2])
+        Bits('0b1010011')
+
+        """
+        b = object.__new__(bitstring.Bits)
+        if self._scale is None:
+            list2bitstore = bitstring.bitstore_helpers.list2bitstore_funcs.get(self._name)
+            if list2bitstore is not None:
+                b._bitstore = list2bitstore(values)
+                return b
+            tibs_dtype = self._tibs_dtype
+            if tibs_dtype is not None:
+                values = list(values)
+                try:
+                    b._bitstore = bitstring.bitstore.ConstBitStore.from_values(tibs_dtype, values)
+                    return b
+                except Exception:
+                    pass  # Fall through, so that pack reports the error for the bad value.
+        b._bitstore = bitstring.bitstore.ConstBitStore.join([self.pack(v)._bitstore for v in values])
+        return b
+
     def unpack(self, b: BitsType, /) -> Any:
         """Unpack a bitstring to find its value.
 
@@ -332,12 +362,14 @@ class DtypeDefinition:
                 return x
             self.get_fn = length_checked_get_fn
 
-            def read_fn(bs, start):
-                try:
-                    x, length = get_fn(bs[start:])
-                except bitstring.InterpretError:
-                    raise bitstring.ReadError
-                return x, start + length
+            if read_fn is None:
+                def read_fn(bs, start):
+                    try:
+                        x, length = get_fn(bs[start:])
+                    except bitstring.InterpretError:
+                        raise bitstring.ReadError
+                    return x, start + length
+            # A given read_fn reads in place, returning the value and the new position.
             self.read_fn = read_fn
         self.bitlength2chars_fn = bitlength2chars_fn
 
@@ -0,0 +1,365 @@
+from __future__ import annotations
+
+import collections
+import mmap
+import operator
+import os
+import pathlib
+from collections.abc import Iterable, Iterator
+from typing import Any, BinaryIO, overload
+
+import bitstring
+from bitstring.array_ import Array, ElementType
+from bitstring.bitarray_ import BitArray
+from bitstring.bitstore import MutableBitStore
+from bitstring.dtypes import Dtype
+
+# About how many bytes of the file each chunk of decoded items covers.
+_CHUNK_BYTES = 65536
+
+# How many decoded chunks are kept for repeated access.
+_CACHE_CHUNKS = 16
+
+
+def _is_empty_file(source: str | pathlib.Path | BinaryIO) -> bool:
+    """Whether source is an empty file, which can't be memory-mapped.
+
+    False if it can't be told, leaving the error to come from mapping it.
+    """
+    try:
+        if isinstance(source, (str, pathlib.Path)):
+            return pathlib.Path(source).stat().st_size == 0
+        return os.fstat(source.fileno()).st_size == 0
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+class MappedArray:
+    """An Array whose items stay in a memory-mapped file until they are used.
+
+    Create with Array.from_file(dtype, source, lazy=True) for a read-only MappedArray,
+    or with Array.memmap(dtype, source) for one that writes changes straight into the
+    file. The file isn't read up front, so files much larger than memory can be used.
+    Items are decoded a chunk at a time when they are accessed, and the most recently
+    used chunks are kept.
+
+    Methods:
+
+    close() -- Flush any changes and close the memory map. The MappedArray can't be used after this.
+    flush() -- Write any changed parts of the map back to the file.
+    to_array() -- Return the items as an ordinary Array in memory.
+    to_list() -- Return the items as a list.
+
+    Special methods:
+
+    Items can be read with [], and if the MappedArray is writable they can also be
+    changed with [] and the mutating operators +=, -=, *=, /=, //=, %=, <<=, >>=,
+    &=, |= and ^=. The number of items can't be changed. The operators change the
+    file a chunk at a time, so if one fails the earlier chunks have been changed.
+
+    Properties:
+
+    dtype -- The Dtype of the items. Read only.
+    itemsize -- The length *in bits* of a single item. Read only.
+    mode -- 'r' if the MappedArray is read-only, or 'r+' if it's writable. Read only.
+
+    A MappedArray can also be used as a context manager, which closes it on exit.
+    """
+
+    def __init__(self, dtype: str | Dtype, map_: mmap.mmap | None, offset: int, length: int,
+                 writable: bool = False) -> None:
+        """Use from_file or memmap on Array rather than creating a MappedArray directly.
+
+        offset is the byte position of the first item in the map, and length is the number of items.
+        map_ is None for an empty file, which has no items.
+        """
+        self._template = Array(dtype)
+        if self._template.dtype.variable_length:
+            raise ValueError(f"A MappedArray needs a fixed-length dtype, but received '{self._template.dtype}'.")
+        self._map = map_
+        self._offset = offset
+        self._length = length
+        self._writable = writable
+        # The indices of the map's pages that have been written to since the last flush.
+        self._dirty_pages: set[int] = set()
+        itemsize = self._template.itemsize
+        # A whole number of bytes per chunk, so every chunk starts on a byte boundary.
+        self._chunk_items = max(_CHUNK_BYTES * 8 // itemsize // 8 * 8, 8)
+        self._chunks: collections.OrderedDict[int, list[ElementType]] = collections.OrderedDict()
+
+    @classmethod
+    def _from_source(cls, dtype: str | Dtype, source: str | pathlib.Path | BinaryIO, n: int | None,
+                     writable: bool = False) -> MappedArray:
+        itemsize = Array(dtype).itemsize
+        if _is_empty_file(source):
+            if n:
+                raise EOFError(f"Only 0 items were available, not the {n} items requested.")
+            return cls(dtype, None, 0, 0, writable)
+        map_, base_bits, _ = bitstring.bits._open_file_source(source, writable)
+        offset = base_bits // 8
+        max_items = (len(map_) - offset) * 8 // itemsize
+        if n is not None and max_items < n:
+            map_.close()
+            raise EOFError(f"Only {max_items} items were available, not the {n} items requested.")
+        return cls(dtype, map_, offset, max_items if n is None else n, writable)
+
+    @property
+    def dtype(self) -> Dtype:
+        return self._template.dtype
+
+    @property
+    def itemsize(self) -> int:
+        return self._template.itemsize
+
+    @property
+    def mode(self) -> str:
+        return 'r+' if self._writable else 'r'
+
+    def __len__(self) -> int:
+        return self._length
+
+    def _read(self, start: int, stop: int) -> Array:
+        """Return items start to stop as an Array, reading only their bytes from the map."""
+        itemsize = self._template.itemsize
+        start_bit = start * itemsize
+        end_bit = stop * itemsize
+        first_byte = self._offset + start_bit // 8
+        last_byte = self._offset + (end_bit + 7) // 8
+        a = self._template.__copy__()
+        if stop > start:
+            a.data._bitstore = MutableBitStore.from_bytes(self._map[first_byte: last_byte], offset=start_bit % 8,
+                                                          length=end_bit - start_bit)
+        return a
+
+    def _write(self, start: int, items: Array) -> None:
+        """Write the data of items over the items from position start onwards."""
+        if not self._writable:
+            raise TypeError("This MappedArray is read-only. Use Array.memmap() for one that can be changed.")
+        start_bit = start * self._template.itemsize
+        end_bit = start_bit + len(items.data)
+        first_byte = self._offset + start_bit // 8
+        last_byte = self._offset + (end_bit + 7) // 8
+        if start_bit % 8 == 0 and end_bit % 8 == 0:
+            self._map[first_byte: last_byte] = items.data.to_bytes()
+        else:
+            # Keep the bits of the neighbouring items that share the first and last bytes.
+            covering = BitArray.from_bytes(self._map[first_byte: last_byte])
+            covering.overwrite(start_bit % 8, items.data)
+            self._map[first_byte: last_byte] = covering.to_bytes()
+        granularity = mmap.ALLOCATIONGRANULARITY
+        self._dirty_pages.update(range(first_byte // granularity, (last_byte - 1) // granularity + 1))
+        stop = start + len(items)
+        for index in range(start // self._chunk_items, (stop - 1) // self._chunk_items + 1):
+            self._chunks.pop(index, None)
+
+    def _chunk(self, index: int) -> list[ElementType]:
+        """Return the decoded items of a chunk, keeping the most recently used chunks."""
+        chunk = self._chunks.get(index)
+        if chunk is not None:
+            self._chunks.move_to_end(index)
+            return chunk
+        start = index * self._chunk_items
+        chunk = self._read(start, min(start + self._chunk_items, self._length)).to_list()
+        self._chunks[index] = chunk
+        if len(self._chunks) > _CACHE_CHUNKS:
+            self._chunks.popitem(last=False)
+        return chunk
+
+    @overload
+    def __getitem__(self, key: slice) -> Array:
+        ...
+
+    @overload
+    def __getitem__(self, key: int) -> ElementType:
+        ...
+
+    def __getitem__(self, key: slice | int) -> Array | ElementType:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            if step == 1:
+                return self._read(start, max(start, stop))
+            items = range(start, stop, step)
+            if not items:
+                return self._template.__copy__()
+            if abs(step) > self._chunk_items:
+                # Widely spaced items are read one at a time rather than reading everything between them.
+                a = self._template.__copy__()
+                for i in items:
+                    a.data._addright_bitstore(self._read(i, i + 1).data._bitstore)
+                return a
+            # Read just the range covering the items, and let the Array pick them out.
+            low = min(items[0], items[-1])
+            return self._read(low, max(items[0], items[-1]) + 1)[items[0] - low::step]
+        if key < 0:
+            key += self._length
+        if key < 0 or key >= self._length:
+            raise IndexError(f"Index {key} out of range for MappedArray of length {self._length}.")
+        index, i = divmod(key, self._chunk_items)
+        return self._chunk(index)[i]
+
+    @overload
+    def __setitem__(self, key: slice, value: Iterable[ElementType]) -> None:
+        ...
+
+    @overload
+    def __setitem__(self, key: int, value: ElementType) -> None:
+        ...
+
+    def __setitem__(self, key: slice | int, value: Iterable[ElementType] | ElementType) -> None:
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._length)
+            if not isinstance(value, Iterable):
+                raise TypeError("Can only assign an iterable to a slice.")
+            if step == 1:
+                items = self._template.__copy__()
+                items.extend(value)
+                if len(items) != max(stop - start, 0):
+                    raise ValueError(f"Can't assign {len(items)} values to a slice of length {max(stop - start, 0)}, "
+                                     f"as the length of a MappedArray can't be changed.")
+                if items:
+                    self._write(start, items)
+                return
+            indices = range(start, stop, step)
+            # All the values are packed first, so a bad one leaves the file unchanged.
+            items = self._template.__copy__()
+            items.extend(value)
+            if len(items) != len(indices):
+                raise ValueError(f"Can't assign {len(items)} values to an extended slice of length {len(indices)}.")
+            if step < 0:
+                indices = indices[::-1]
+                items.reverse()
+                step = -step
+            # Change the items a chunk-sized range at a time, so only the ranges that hold
+            # them are read and written. Widely spaced items are done one at a time.
+            per_range = max(self._chunk_items // step, 1)
+            for i in range(0, len(indices), per_range):
+                low = indices[i]
+                covering = self._read(low, indices[min(i + per_range, len(indices)) - 1] + 1)
+                covering[::step] = items[i: i + per_range]
+                self._write(low, covering)
+            return
+        if key < 0:
+            key += self._length
+        if key < 0 or key >= self._length:
+            raise IndexError(f"Index {key} out of range for MappedArray of length {self._length}.")
+        items = self._template.__copy__()
+        items.append(value)
+        self._write(key, items)
+
+    def _apply_inplace(self, op, value: Any) -> MappedArray:
+        """Apply an in-place Array operator with value to every item, a chunk at a time.
+
+        Each chunk is written as soon as it's done, so unlike with an Array, an error
+        leaves the items before the chunk it happened in already changed.
+        """
+        if isinstance(value, (Array, MappedArray)):
+            raise TypeError("Only operators with a scalar value can be applied to a MappedArray in place.")
+        if not self._writable:
+            raise TypeError("This MappedArray is read-only. Use Array.memmap() for one that can be changed.")
+        for start in range(0, self._length, self._chunk_items):
+            items = self._read(start, min(start + self._chunk_items, self._length))
+            try:
+                items = op(items, value)
+            except ValueError:
+                self._raise_item_error(op, value, start, items)
+                # No single item fails, so the chunk's own error is the best there is.
+                raise
+            self._write(start, items)
+        return self
+
+    def _raise_item_error(self, op, value: Any, start: int, items: Array) -> None:
+        """Find the first item of a chunk that op fails on, and raise a ValueError giving its index.
+
+        Returns if op doesn't fail on any of the items on their own.
+        """
+        for i, item in enumerate(items):
+            single = self._template.__copy__()
+            single.append(item)
+            try:
+                op(single, value)
+            except ValueError as e:
+                raise ValueError(f"Applying operator '{op.__name__}' to MappedArray failed at index {start + i}, "
+                                 f"which has the value {item!r}. The {start} items before its chunk "
+                                 f"have already been changed.") from e
+
+    def __iadd__(self, other: int | float) -> MappedArray:
+        return self._apply_inplace(operator.iadd, other)
+
+    def __isub__(self, other: int | float) -> MappedArray:
+        return self._apply_inplace(operator.isub, other)
+
+    def __imul__(self, other: int | float) -> MappedArray:
+        return self._apply_inplace(operator.imul, other)
+
+    def __itruediv__(self, other: int | float) -> MappedArray:
+        return self._apply_inplace(operator.itruediv, other)
+
+    def __ifloordiv__(self, other: int | float) -> MappedArray:
+        return self._apply_inplace(operator.ifloordiv, other)
+
+    def __imod__(self, other: int) -> MappedArray:
+        return self._apply_inplace(operator.imod, other)
+
+    def __ilshift__(self, other: int) -> MappedArray:
+        return self._apply_inplace(operator.ilshift, other)
+
+    def __irshift__(self, other: int) -> MappedArray:
+        return self._apply_inplace(operator.irshift, other)
+
+    def __iand__(self, other: bitstring.bits.BitsType) -> MappedArray:
+        return self._apply_inplace(operator.iand, other)
+
+    def __ior__(self, other: bitstring.bits.BitsType) -> MappedArray:
+        return self._apply_inplace(operator.ior, other)
+
+    def __ixor__(self, other: bitstring.bits.BitsType) -> MappedArray:
+        return self._apply_inplace(operator.ixor, other)
+
+    def __iter__(self) -> Iterator[ElementType]:
+        # Decoded straight through rather than via the cache, so a full pass doesn't evict it.
+        for start in range(0, self._length, self._chunk_items):
+            yield from self._read(start, min(start + self._chunk_items, self._length)).to_list()
+
+    def to_list(self) -> list[ElementType]:
+        """Return all of the items as a list."""
+        return list(self)
+
+    def to_array(self) -> Array:
+        """Return all of the items as an ordinary Array held in memory."""
+        return self._read(0, self._length)
+
+    def flush(self) -> None:
+        """Write the parts of the map that have been changed back to the file.
+
+        Only the pages that were written to since the last flush are synced.
+        """
+        granularity = mmap.ALLOCATIONGRANULARITY
+        pages = sorted(self._dirty_pages)
+        i = 0
+        while i < len(pages):
+            # Sync each run of consecutive pages with one call.
+            j = i + 1
+            while j < len(pages) and pages[j] == pages[j - 1] + 1:
+                j += 1
+            start = pages[i] * granularity
+            self._map.flush(start, min((pages[j - 1] + 1) * granularity, len(self._map)) - start)
+            i = j
+        self._dirty_pages.clear()
+
+    def close(self) -> None:
+        """Flush any changes and close the memory map, after which the MappedArray can't be used."""
+        self._chunks.clear()
+        if self._map is not None:
+            if not self._map.closed:
+                self.flush()
+            self._map.close()
+
+    def __enter__(self) -> MappedArray:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        mode_str = ", mode='r+'" if self._writable else ''
+        return f"{self.__class__.__name__}('{self.dtype}', length={self._length}{mode_str})"
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import functools
+import itertools
+from collections.abc import Iterable, Sequence
+from typing import Any
 import bitstring
 from bitstring.bits import Bits
 from bitstring.utils import tokenparser
@@ -12,13 +15,16 @@ ConstBitStore = bitstring.bitstore.ConstBitStore
 # Sentinel for "the values are used up", avoiding a raised StopIteration per pack().
 _NO_MORE_VALUES = object()
 
+# Rows taken from the iterable at a time by pack_rows.
+_PACK_ROWS_CHUNK_SIZE = 65536
+
 
 @functools.lru_cache(256)
 def _prepared_pack_fmt(fmt: str):
     """A single core dtype covering a whole format string, and how many values it takes.
 
     None unless every token is a plain fixed-length dtype that takes one value, which
-    rules out literals, named values, pad and stretchy tokens.
+    rules out literals, named values, pad, stretchy and variable-length tokens.
     """
     try:
         _, tokens = tokenparser(fmt, ())
@@ -26,10 +32,11 @@ def _prepared_pack_fmt(fmt: str):
         return None
     specs = []
     for name, length, value in tokens:
-        if value is not None or length is None:
+        if value is not None:
             return None
         try:
-            dtype = bitstring.Dtype(name, int(length))
+            # A token such as 'bool' has no length in the format but is still fixed-length.
+            dtype = bitstring.Dtype(name) if length is None else bitstring.Dtype(name, int(length))
         except ValueError:
             return None
         if dtype._scale is not None or dtype._bitlength is None:
@@ -43,6 +50,100 @@ def _prepared_pack_fmt(fmt: str):
     return dtype_tuple, len(specs)
 
 
+@functools.lru_cache(256)
+def _tibs_spec(name: str, length: int | None) -> tuple[str, int] | None:
+    """The (dtype name, bitlength) spec for a plain fixed-length token, or None."""
+    try:
+        dtype = bitstring.Dtype(name) if length is None else bitstring.Dtype(name, length)
+    except ValueError:
+        return None
+    if dtype._scale is not None or dtype._bitlength is None:
+        return None
+    if bitstring.bitstore.tibs_dtype_for(dtype._name, dtype._bitlength) is None:
+        return None
+    return dtype._name, dtype._bitlength
+
+
+@functools.lru_cache(256)
+def _prepared_kwargs_pack_fmt(fmt: str, kwarg_names: tuple[str, ...]):
+    """As _prepared_pack_fmt, but for a format string used with keyword arguments.
+
+    Returns a core dtype covering the whole format, or None if a length is given by a
+    keyword and so can change between calls. Then the (name, length) pairs for the tokens,
+    where a length can be the keyword giving it, the value key for each token, which is
+    the keyword giving the value or None to take the next positional value, and how many
+    positional values are taken.
+
+    None unless every token could be a plain fixed-length dtype, which rules out
+    literals, keyword-only tokens, pad, stretchy and variable-length tokens.
+    """
+    try:
+        _, tokens = tokenparser(fmt, kwarg_names)
+    except ValueError:
+        return None
+    lengths = []
+    value_keys = []
+    specs = []
+    for name, length, value in tokens:
+        if value is None:
+            if name in kwarg_names:
+                return None
+        elif value not in kwarg_names:
+            return None
+        if type(length) is str:
+            specs = None
+        else:
+            spec = _tibs_spec(name, length)
+            if spec is None:
+                return None
+            if specs is not None:
+                specs.append(spec)
+        lengths.append((name, length))
+        value_keys.append(value)
+    if not lengths:
+        return None
+    dtype_tuple = None
+    if specs is not None:
+        dtype_tuple = bitstring.bitstore.tibs_dtype_tuple_for(tuple(specs))
+        if dtype_tuple is None:
+            return None
+    return dtype_tuple, tuple(lengths), tuple(value_keys), value_keys.count(None)
+
+
+@functools.lru_cache(256)
+def _kwargs_dtype_tuple(lengths: tuple[tuple[str, int | str | None], ...], values: tuple[Any, ...]):
+    """The core dtype for a prepared format once the lengths given by keywords are known."""
+    specs = []
+    for (name, _), length in zip(lengths, values):
+        spec = _tibs_spec(name, None if length is None else int(length))
+        if spec is None:
+            return None
+        specs.append(spec)
+    return bitstring.bitstore.tibs_dtype_tuple_for(tuple(specs))
+
+
+def _pack_with_kwargs(fmt: str, values: tuple[Any, ...], kwargs: dict[str, Any]) -> ConstBitStore | None:
+    """Pack using a prepared plan for the format and keyword names, or return None if that's not possible."""
+    # Keyed on the names in the order given rather than sorted, as a call site passes them the same way each time.
+    prepared = _prepared_kwargs_pack_fmt(fmt, tuple(kwargs))
+    if prepared is None:
+        return None
+    dtype_tuple, lengths, value_keys, value_count = prepared
+    if len(values) != value_count:
+        return None
+    value_iter = iter(values)
+    try:
+        token_values = [next(value_iter) if key is None else kwargs[key] for key in value_keys]
+        if dtype_tuple is None:
+            dtype_tuple = _kwargs_dtype_tuple(lengths, tuple(kwargs[length] if type(length) is str else length
+                                                             for _, length in lengths))
+            if dtype_tuple is None:
+                return None
+        return ConstBitStore.from_value(dtype_tuple, token_values)
+    except Exception:
+        return None  # The general path will report the error.
+
+
 def pack(fmt: str | list[str], *values, **kwargs) -> Bits:
     """Pack the values according to the format string and return a new Bits object.
 
@@ -88,6 +189,12 @@ def pack(fmt: str | list[str], *values, **kwargs) -> Bits:
                     s = object.__new__(Bits)
                     s._bitstore = packed
                     return s
+    elif type(fmt) is str:
+        packed = _pack_with_kwargs(fmt, values, kwargs)
+        if packed is not None:
+            s = object.__new__(Bits)
+            s._bitstore = packed
+            return s
 
     tokens = []
     if isinstance(fmt, str):
@@ -130,3 +237,41 @@ def pack(fmt: str | list[str], *values, **kwargs) -> Bits:
     # immutable, so sharing one with whatever produced it is safe.
     s._bitstore = bsl[0] if len(bsl) == 1 else ConstBitStore.join(bsl)
     return s
+
+
+def pack_rows(fmt: str | list[str], rows: Iterable[Sequence[Any]], *,
+              chunk_size: int = _PACK_ROWS_CHUNK_SIZE, **kwargs) -> Bits:
+    """Pack each row of values according to the format string and return them joined as a new Bits object.
+
+    fmt -- A single string or a list of strings with comma separated tokens
+           describing how to pack a single row.
+    rows -- An iterable of rows, each a sequence of values to pack according to the format.
+    chunk_size -- The number of rows taken from the iterable at a time.
+    kwargs -- A dictionary or keyword-value pairs - the keywords used in the
+              format string will be replaced with their given value.
+
+    The result is the same as joining pack(fmt, *row) for every row, but when every
+    token is a plain fixed-length dtype the rows are packed with one call per chunk.
+    Rows can come from a generator, and only a chunk of them is held at a time.
+
+    >>> s = pack_rows('u8, f16', [(1, 0.5), (2, 1.5), (3, 2.5)])
+
+    """
+    if chunk_size <= 0:
+        raise ValueError(f"chunk_size must be positive, but received {chunk_size}.")
+    prepared = _prepared_pack_fmt(fmt) if type(fmt) is str and not kwargs else None
+    row_iter = iter(rows)
+    packed_chunks: list[ConstBitStore] = []
+    while chunk := list(itertools.islice(row_iter, chunk_size)):
+        packed = None
+        if prepared is not None:
+            try:
+                packed = ConstBitStore.from_values(prepared[0], chunk)
+            except Exception:
+                pass  # Fall through, so that pack reports the error for the row at fault.
+        if packed is None:
+            packed = ConstBitStore.join([pack(fmt, *row, **kwargs)._bitstore for row in chunk])
+        packed_chunks.append(packed)
+    s = object.__new__(Bits)
+    s._bitstore = packed_chunks[0] if len(packed_chunks) == 1 else ConstBitStore.join(packed_chunks)
+    return s
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import itertools
+import math
+import operator
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from bitstring.array_ import Array
+from bitstring.dtypes import Dtype
+
+# The element formats of the OCP MX specification, which share a scale within each block.
+_MX_ELEMENT_DTYPES = frozenset(['e4m3mxfp_saturate', 'e4m3mxfp_overflow', 'e5m2mxfp_saturate',
+                                'e5m2mxfp_overflow', 'e3m2mxfp', 'e2m3mxfp', 'e2m1mxfp', 'mxint'])
+
+# How many blocks are dequantized at a time when iterating.
+_ITER_BLOCKS = 2048
+
+
+def _per_item(scales: Iterable[float], block_size: int) -> Iterator[float]:
+    """Repeat each block's scale once for every item in the block."""
+    return itertools.chain.from_iterable(itertools.repeat(s, block_size) for s in scales)
+
+
+class MXArray:
+    """Return an MXArray of values in an MX format, quantized in blocks that share a scale.
+
+    The OCP Microscaling (MX) formats store a tensor as blocks of elements, with each
+    block having a single 'e8m0mxfp' scale. The element codes and the block scales are
+    kept in two Arrays, and the scale of every block is calculated from its largest
+    value when the MXArray is created.
+
+    a = MXArray('e4m3mxfp_saturate', weights)
+    b = MXArray('e2m1mxfp', weights, block_size=16)
+
+    Methods:
+
+    from_arrays() -- Create a new MXArray from an Array of element codes and an Array of scales.
+    to_list() -- Return the dequantized items as a list.
+
+    Properties:
+
+    block_size -- The number of items that share each scale. Read only.
+    codes -- An Array of the unscaled element values, with the element dtype.
+    dtype -- The Dtype of the elements, without a scale. Read only.
+    scales -- An Array of the 'e8m0mxfp' scale for each block.
+
+    """
+
+    def __init__(self, dtype: str | Dtype, initializer: Iterable[float] | None = None, *,
+                 block_size: int = 32) -> None:
+        dtype = self._check_dtype(dtype)
+        if block_size <= 0:
+            raise ValueError(f"The block_size must be positive, but received {block_size}.")
+        self._block_size = block_size
+        values = [] if initializer is None else list(map(float, initializer))
+        largest = Array._largest_value(dtype.name, dtype.length)
+        scales = [self._block_scale(values[i: i + block_size], largest)
+                  for i in range(0, len(values), block_size)]
+        # Every scale is a power of two, so the division is exact.
+        self.codes = Array(dtype, list(map(operator.truediv, values, _per_item(scales, block_size))))
+        self.scales = Array('e8m0mxfp', scales)
+
+    @staticmethod
+    def _check_dtype(dtype: str | Dtype) -> Dtype:
+        if not isinstance(dtype, Dtype):
+            dtype = Dtype(dtype)
+        if dtype.name not in _MX_ELEMENT_DTYPES or dtype.scale is not None:
+            raise ValueError(f"An MXArray needs an unscaled MX element dtype, one of {sorted(_MX_ELEMENT_DTYPES)}, "
+                             f"but received '{dtype}'.")
+        return dtype
+
+    @staticmethod
+    def _block_scale(block: list[float], largest: float) -> float:
+        # NaNs and infinities don't contribute to the scale, so the finite values keep their precision.
+        if not all(map(math.isfinite, block)):
+            block = [v for v in block if math.isfinite(v)]
+        return Array._scale_for_max(max(map(abs, block), default=0.0), largest)
+
+    @classmethod
+    def from_arrays(cls, codes: Array, scales: Array, /, *, block_size: int = 32) -> MXArray:
+        """Create a new MXArray from an Array of element codes and an Array of block scales.
+
+        The Arrays are used directly rather than copied. The scales must have the
+        'e8m0mxfp' dtype, with one for each block of the codes.
+        """
+        cls._check_dtype(codes.dtype)
+        if scales.dtype != Dtype('e8m0mxfp'):
+            raise ValueError(f"The scales need the 'e8m0mxfp' dtype, but have '{scales.dtype}'.")
+        if block_size <= 0:
+            raise ValueError(f"The block_size must be positive, but received {block_size}.")
+        blocks = -(-len(codes) // block_size)
+        if len(scales) != blocks:
+            raise ValueError(f"{len(codes)} items in blocks of {block_size} need {blocks} scales, "
+                             f"but {len(scales)} were given.")
+        x = object.__new__(cls)
+        x._block_size = block_size
+        x.codes = codes
+        x.scales = scales
+        return x
+
+    @property
+    def block_size(self) -> int:
+        return self._block_size
+
+    @property
+    def dtype(self) -> Dtype:
+        return self.codes.dtype
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, key: int) -> float:
+        length = len(self.codes)
+        if key < 0:
+            key += length
+        if key < 0 or key >= length:
+            raise IndexError(f"Index {key} out of range for MXArray of length {length}.")
+        return self.codes[key] * self.scales[key // self._block_size]
+
+    def to_list(self) -> list[float]:
+        """Return the dequantized items as a list of floats."""
+        return list(map(operator.mul, self.codes.to_list(), _per_item(self.scales.to_list(), self._block_size)))
+
+    def __iter__(self) -> Iterator[float]:
+        block_size = self._block_size
+        chunk_blocks = iter(self.scales.to_list())
+        for values in self.codes._value_chunks(_ITER_BLOCKS * block_size):
+            yield from map(operator.mul, values, _per_item(itertools.islice(chunk_blocks, _ITER_BLOCKS), block_size))
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, MXArray):
+            return NotImplemented
+        return (self._block_size == other._block_size and self.codes.dtype == other.codes.dtype
+                and self.codes.data == other.codes.data and self.scales.data == other.scales.data)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}('{self.dtype}', {self.to_list()}, block_size={self._block_size})"
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import numbers
-from typing import Any, overload
+from typing import Any, BinaryIO, overload, TYPE_CHECKING
+from collections.abc import Generator
 
 import bitstring
-import bitstring.bitstore as bitstore
-from bitstring.bits import Bits, BitsType
+from bitstring.bits import Bits, BitsType, ReadPlan, _plan_for
 from bitstring.dtypes import Dtype
 
-# fmt string -> (bitlength, tibs dtype or None, Dtype), for fixed-length dtypes only.
+if TYPE_CHECKING:
+    # Only for annotations, as asyncio is slow to import.
+    import asyncio
+    from bitstring.array_ import Array
+
+# fmt string -> (bitlength, tibs dtype or None, Dtype), for fixed-length dtypes and
+# for variable-length ones, which have a bitlength of None.
 # Lets read() skip the Dtype call and, when there's a tibs equivalent, the whole
 # read_fn wrapper chain - together several times the cost of the actual read.
 _read_fmt_cache: dict[str, tuple[int, Any, Dtype]] = {}
@@ -94,30 +100,44 @@ class Reader:
     def read(self, fmt: int | str | Dtype) -> int | float | str | Bits | bool | bytes | None:
         """Read from the current bit position and interpret according to fmt."""
         if type(fmt) is str:
-            # Fast path for a fixed-length dtype, which is much the most common read.
-            # Anything else (variable length, a short read, a bad position) falls
-            # through to the general version below, which reports the errors.
+            # Fast path for a dtype with a fixed or self-delimiting length, which is much
+            # the most common read. Anything else (no length, a short read, a bad
+            # position) falls through to the general version below, which reports the errors.
             info = _read_fmt_cache.get(fmt)
             if info is None:
                 dtype = Dtype(fmt)
                 bitlength = dtype._bitlength
-                if bitlength is not None:
-                    tibs_dtype = None if dtype._scale is not None else \
-                        bitstore.tibs_dtype_for(dtype._name, bitlength)
+                if bitlength is not None or dtype._variable_length:
+                    tibs_dtype = None if dtype._scale is not None else dtype._tibs_dtype
                     info = (bitlength, tibs_dtype, dtype)
                     if len(_read_fmt_cache) < _READ_FMT_CACHE_SIZE:
                         _read_fmt_cache[fmt] = info
             if info is not None:
                 bitlength, tibs_dtype, dtype = info
                 pos = self._pos
-                end = pos + bitlength
-                if 0 <= pos and end <= len(self._bits):
+                if bitlength is None:
+                    # A variable-length code, whose read_fn reports reading off the end.
+                    if 0 <= pos <= len(self._bits):
+                        value, self._pos = dtype._read_fn(self._bits, pos)
+                        return value
+                elif 0 <= pos and pos + bitlength <= len(self._bits):
+                    end = pos + bitlength
                     if tibs_dtype is not None:
                         value = self._bits._bitstore.to_value(tibs_dtype, pos, end)
                     else:
                         value = dtype._read_fn(self._bits, pos)
                     self._pos = end
                     return value
+        elif type(fmt) is Dtype and fmt._bitlength is not None:
+            # Fast path for a fixed-length Dtype, which may have a scale. The raw value is
+            # read with a single core call and then scaled, as the scaled read_fn would.
+            tibs_dtype = fmt._tibs_dtype
+            pos = self._pos
+            end = pos + fmt._bitlength
+            if tibs_dtype is not None and 0 <= pos and end <= len(self._bits):
+                value = self._bits._bitstore.to_value(tibs_dtype, pos, end)
+                self._pos = end
+                return value if fmt._scale is None else value * fmt._scale
         elif type(fmt) is int and fmt >= 0:
             # Fast path for reading a plain run of bits.
             pos = self._pos
@@ -162,7 +182,7 @@ class Reader:
             self._pos = old_pos
             raise
 
-    def read_list(self, fmt: str | list[int | str | Dtype], **kwargs) \
+    def read_list(self, fmt: str | list[int | str | Dtype] | ReadPlan, **kwargs) \
             -> list[int | float | str | Bits | bool | bytes | None]:
         """Read and interpret one or more format tokens from the current bit position."""
         old_pos = self._pos
@@ -182,6 +202,55 @@ class Reader:
         """Deprecated compatibility alias for :meth:`read_list`."""
         return self.read_list(fmt, **kwargs)
 
+    @staticmethod
+    def compile(fmt: str | list[int | str | Dtype], **kwargs) -> ReadPlan:
+        """Parse a format once, for use in place of fmt in many calls to read_list."""
+        return ReadPlan(fmt, **kwargs)
+
+    def read_records(self, fmt: str | list[int | str | Dtype] | ReadPlan, n: int, *,
+                     arrays: bool = False, **kwargs) -> list[list[Any]] | list[Array]:
+        """Read n repetitions of the record fmt and return a column of values per field.
+
+        If arrays is True each column is an Array of the field's dtype rather than a list.
+        """
+        old_pos = self._pos
+        try:
+            self._ensure_valid_pos()
+            plan = _plan_for(fmt, **kwargs)
+            rows, self._pos = self._bits._read_records(plan, self._pos, n)
+            return Bits._record_columns(plan, rows, arrays)
+        except Exception:
+            self._pos = old_pos
+            raise
+
+    def _read_many(self, bulk_read, n: int) -> list[int]:
+        if n < 0:
+            raise ValueError("Cannot read a negative number of codes.")
+        old_pos = self._pos
+        try:
+            self._ensure_valid_pos()
+            values, self._pos = bulk_read(self._bits, self._pos, n)
+            return values
+        except Exception:
+            self._pos = old_pos
+            raise
+
+    def read_ue_many(self, n: int) -> list[int]:
+        """Read n unsigned exponential-Golomb codes from the current bit position."""
+        return self._read_many(Bits._readue_list, n)
+
+    def read_se_many(self, n: int) -> list[int]:
+        """Read n signed exponential-Golomb codes from the current bit position."""
+        return self._read_many(Bits._readse_list, n)
+
+    def read_uie_many(self, n: int) -> list[int]:
+        """Read n unsigned interleaved exponential-Golomb codes from the current bit position."""
+        return self._read_many(Bits._readuie_list, n)
+
+    def read_sie_many(self, n: int) -> list[int]:
+        """Read n signed interleaved exponential-Golomb codes from the current bit position."""
+        return self._read_many(Bits._readsie_list, n)
+
     @overload
     def peek(self, fmt: int) -> Bits:
         ...
@@ -198,7 +267,7 @@ class Reader:
         finally:
             self._pos = old_pos
 
-    def peek_list(self, fmt: str | list[int | str | Dtype], **kwargs) \
+    def peek_list(self, fmt: str | list[int | str | Dtype] | ReadPlan, **kwargs) \
             -> list[int | float | str | Bits | bool | bytes | None]:
         """Read one or more format tokens without changing the position."""
         old_pos = self._pos
@@ -269,3 +338,319 @@ class Reader:
         return f"Reader(<{self._bits.__class__.__name__} of length {len(self._bits)} bits>, pos={self._pos})"
 
     __str__ = __repr__
+
+
+class _WindowReader:
+    """The parts of StreamReader and AsyncReader that don't depend on how the stream is read.
+
+    The bytes held from the stream are read through an ordinary Reader, so reads that
+    fit in them take all of its fast paths.
+    """
+
+    __slots__ = ("_stream", "_chunk_size", "_buffer", "_offset", "_reader", "_eof")
+
+    def __init__(self, stream: Any, chunk_size: int) -> None:
+        chunk_size = int(chunk_size)
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size must be positive, but received {chunk_size}.")
+        self._stream = stream
+        self._chunk_size = chunk_size
+        # The bytes held from the stream, which start at bit position _offset.
+        self._buffer = b''
+        self._offset = 0
+        self._reader = Reader(Bits(), 0)
+        self._eof = False
+
+    @property
+    def pos(self) -> int:
+        """The current bit position in the stream."""
+        return self._offset + self._reader._pos
+
+    @pos.setter
+    def pos(self, value: int) -> None:
+        self._reader._pos = int(value) - self._offset
+
+    @property
+    def bitpos(self) -> int:
+        """An alias for pos."""
+        return self.pos
+
+    @bitpos.setter
+    def bitpos(self, value: int) -> None:
+        self.pos = value
+
+    @property
+    def bytepos(self) -> int:
+        """The current byte position. Requires the bit position to be byte aligned."""
+        pos = self.pos
+        if pos % 8:
+            raise bitstring.ByteAlignError("Not byte aligned when using bytepos property.")
+        return pos // 8
+
+    @bytepos.setter
+    def bytepos(self, value: int) -> None:
+        self.pos = int(value) * 8
+
+    def _discard(self) -> int:
+        """How many whole bytes before the current position can be dropped from the buffer."""
+        return min(max(self._reader._pos, 0) // 8, len(self._buffer))
+
+    def _refill_size(self) -> int:
+        # At least as much as is still held, so a long read only needs a few refills.
+        return max(self._chunk_size, len(self._buffer) - self._discard())
+
+    def _add_chunk(self, chunk: bytes | None) -> bool:
+        """Drop the consumed bytes and add a chunk read from the stream, returning False at its end."""
+        if not chunk:
+            self._eof = True
+            return False
+        discard = self._discard()
+        self._buffer = self._buffer[discard:] + chunk
+        self._offset += discard * 8
+        self._reader._bits = Bits.from_bytes(self._buffer)
+        self._reader._pos -= discard * 8
+        return True
+
+    def _pos_needs_data(self) -> bool:
+        """Whether the position is past the held data, raising ValueError if it's before it."""
+        if self._reader._pos < 0:
+            raise ValueError(f"Invalid bit position {self.pos}, as the stream has been discarded "
+                             f"before bit position {self._offset}.")
+        if self._reader._pos <= len(self._buffer) * 8:
+            return False
+        if self._eof:
+            raise ValueError(f"Invalid bit position {self.pos} for a stream of length {self._offset + len(self._buffer) * 8}.")
+        return True
+
+    @staticmethod
+    def _reads_to_end(fmt: int | str | Dtype | list[int | str | Dtype] | ReadPlan, **kwargs) -> bool:
+        """Whether fmt has a token with no length, which reads to the end of the stream."""
+        if isinstance(fmt, numbers.Integral):
+            return False
+        if isinstance(fmt, ReadPlan):
+            return fmt._stretchy
+        dtypes = [Dtype(fmt)] if isinstance(fmt, Dtype) else Bits._fmt_to_dtypes(fmt, **kwargs)
+        return any(d.bitlength is None and not d.variable_length for d in dtypes)
+
+    @staticmethod
+    def _search_bits(bs: BitsType) -> Bits:
+        if isinstance(bs, numbers.Integral):
+            raise ValueError("Integers cannot be searched for")
+        bs = Bits._create_from_bitstype(bs)
+        if len(bs) == 0:
+            raise ValueError("Cannot find an empty bitstring.")
+        return bs
+
+    def _find(self, bs: Bits, start: int, search_from: int, bytealigned: bool) -> tuple[int | None, int]:
+        """Search the held data from search_from, returning the match and where to search from after a refill.
+
+        Positions are in the stream. A later search only needs to go back far enough to
+        catch a match straddling the current end of the buffer.
+        """
+        p = self._reader._bits.find(bs, start=search_from - self._offset, bytealigned=bytealigned)
+        if p is not None:
+            return p + self._offset, search_from
+        return None, max(start, self._offset + len(self._buffer) * 8 - len(bs) + 1)
+
+    def _take_to(self, start: int, end: int) -> Bits:
+        value = self._reader._bits._slice(start - self._offset, end - self._offset)
+        self._reader._pos = end - self._offset
+        return value
+
+    # The reading logic is written once, as generators that yield whenever they need more
+    # of the stream and are sent whether a refill got any. StreamReader and AsyncReader
+    # each run them with their own way of filling the buffer.
+
+    def _ensure_valid_pos(self) -> Generator[None, bool, None]:
+        while self._pos_needs_data():
+            yield
+
+    def _read_with_refill(self, read, *args, **kwargs) -> Generator[None, bool, Any]:
+        yield from self._ensure_valid_pos()
+        while True:
+            try:
+                return read(*args, **kwargs)
+            except bitstring.ReadError:
+                # Not enough data yet. The Reader has restored its position, so just retry.
+                if not (yield):
+                    raise
+
+    def _fill_to_end(self) -> Generator[None, bool, None]:
+        while (yield):
+            pass
+
+    def _read(self, fmt: int | str | Dtype) -> Generator[None, bool, Any]:
+        if self._reads_to_end(fmt):
+            yield from self._fill_to_end()
+        return (yield from self._read_with_refill(self._reader.read, fmt))
+
+    def _read_list(self, fmt: str | list[int | str | Dtype] | ReadPlan, **kwargs) -> Generator[None, bool, list[Any]]:
+        if self._reads_to_end(fmt, **kwargs):
+            yield from self._fill_to_end()
+        return (yield from self._read_with_refill(self._reader.read_list, fmt, **kwargs))
+
+    def _peek(self, steps: Generator[None, bool, Any]) -> Generator[None, bool, Any]:
+        old_pos = self.pos
+        try:
+            return (yield from steps)
+        finally:
+            self.pos = old_pos
+
+    def _read_to(self, bs: BitsType, bytealigned: bool) -> Generator[None, bool, Bits]:
+        bs = self._search_bits(bs)
+        yield from self._ensure_valid_pos()
+        start = search_from = self.pos
+        while True:
+            p, search_from = self._find(bs, start, search_from, bytealigned)
+            if p is not None:
+                return self._take_to(start, p + len(bs))
+            if not (yield):
+                raise bitstring.ReadError("Substring not found")
+
+    def _byte_align(self) -> Generator[None, bool, int]:
+        yield from self._ensure_valid_pos()
+        skipped = (8 - (self.pos % 8)) % 8
+        if skipped:
+            yield from self._read_with_refill(self._reader.read, skipped)
+        return skipped
+
+
+class StreamReader(_WindowReader):
+    """Read sequentially from a binary stream, such as a pipe or socket, with bounded memory.
+
+    Data is pulled from the stream in chunks as it's needed, and data before the
+    current position is discarded as the reading moves on, so the stream can be
+    far larger than the available memory.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, stream: BinaryIO, chunk_size: int = 65536) -> None:
+        if not hasattr(stream, 'read'):
+            raise TypeError(f"StreamReader needs a binary stream with a read() method, "
+                            f"but received a {type(stream).__name__}.")
+        super().__init__(stream, chunk_size)
+
+    def _fill(self) -> bool:
+        """Read more of the stream into the buffer, returning False if it's finished."""
+        if self._eof:
+            return False
+        return self._add_chunk(self._stream.read(self._refill_size()))
+
+    def _run(self, steps: Generator[None, bool, Any]) -> Any:
+        """Run one of the reading generators, filling the buffer whenever it asks."""
+        try:
+            next(steps)
+            while True:
+                steps.send(self._fill())
+        except StopIteration as e:
+            return e.value
+        finally:
+            steps.close()
+
+    def read(self, fmt: int | str | Dtype) -> int | float | str | Bits | bool | bytes | None:
+        """Read from the current bit position and interpret according to fmt.
+
+        A dtype with no length reads to the end of the stream.
+        """
+        return self._run(self._read(fmt))
+
+    def read_list(self, fmt: str | list[int | str | Dtype] | ReadPlan, **kwargs) \
+            -> list[int | float | str | Bits | bool | bytes | None]:
+        """Read and interpret one or more format tokens from the current bit position.
+
+        A token with no length reads to the end of the stream.
+        """
+        return self._run(self._read_list(fmt, **kwargs))
+
+    def peek(self, fmt: int | str | Dtype) -> int | float | str | Bits | bool | bytes | None:
+        """Read from the current bit position without changing the position."""
+        return self._run(self._peek(self._read(fmt)))
+
+    def peek_list(self, fmt: str | list[int | str | Dtype] | ReadPlan, **kwargs) \
+            -> list[int | float | str | Bits | bool | bytes | None]:
+        """Read one or more format tokens without changing the position."""
+        return self._run(self._peek(self._read_list(fmt, **kwargs)))
+
+    def read_to(self, bs: BitsType, /, *, bytealigned: bool = False) -> Bits:
+        """Read up to and including the next occurrence of bs."""
+        return self._run(self._read_to(bs, bytealigned))
+
+    def byte_align(self) -> int:
+        """Align to the next byte boundary and return the number of skipped bits."""
+        return self._run(self._byte_align())
+
+    def __repr__(self) -> str:
+        return f"StreamReader(<{self._stream.__class__.__name__}>, pos={self.pos})"
+
+    __str__ = __repr__
+
+
+class AsyncReader(_WindowReader):
+    """Read sequentially from an asyncio.StreamReader.
+
+    The reading methods are coroutines, which only wait on the stream when the data
+    already received doesn't contain enough for the read.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, stream: asyncio.StreamReader, chunk_size: int = 65536) -> None:
+        if not hasattr(stream, 'read'):
+            raise TypeError(f"AsyncReader needs an asyncio.StreamReader or similar, "
+                            f"but received a {type(stream).__name__}.")
+        super().__init__(stream, chunk_size)
+
+    async def _fill(self) -> bool:
+        """Read more of the stream into the buffer, returning False if it's finished."""
+        if self._eof:
+            return False
+        return self._add_chunk(await self._stream.read(self._refill_size()))
+
+    async def _run(self, steps: Generator[None, bool, Any]) -> Any:
+        """Run one of the reading generators, waiting to fill the buffer whenever it asks."""
+        try:
+            next(steps)
+            while True:
+                steps.send(await self._fill())
+        except StopIteration as e:
+            return e.value
+        finally:
+            steps.close()
+
+    async def read(self, fmt: int | str | Dtype) -> int | float | str | Bits | bool | bytes | None:
+        """Read from the current bit position and interpret according to fmt.
+
+        A dtype with no length reads to the end of the stream.
+        """
+        return await self._run(self._read(fmt))
+
+    async def read_list(self, fmt: str | list[int | str | Dtype] | ReadPlan, **kwargs) \
+            -> list[int | float | str | Bits | bool | bytes | None]:
+        """Read and interpret one or more format tokens from the current bit position.
+
+        A token with no length reads to the end of the stream.
+        """
+        return await self._run(self._read_list(fmt, **kwargs))
+
+    async def peek(self, fmt: int | str | Dtype) -> int | float | str | Bits | bool | bytes | None:
+        """Read from the current bit position without changing the position."""
+        return await self._run(self._peek(self._read(fmt)))
+
+    async def peek_list(self, fmt: str | list[int | str | Dtype] | ReadPlan, **kwargs) \
+            -> list[int | float | str | Bits | bool | bytes | None]:
+        """Read one or more format tokens without changing the position."""
+        return await self._run(self._peek(self._read_list(fmt, **kwargs)))
+
+    async def read_to(self, bs: BitsType, /, *, bytealigned: bool = False) -> Bits:
+        """Read up to and including the next occurrence of bs."""
+        return await self._run(self._read_to(bs, bytealigned))
+
+    async def byte_align(self) -> int:
+        """Align to the next byte boundary and return the number of skipped bits."""
+        return await self._run(self._byte_align())
+
+    def __repr__(self) -> str:
+        return f"AsyncReader(<{self._stream.__class__.__name__}>, pos={self.pos})"
+
+    __str__ = __repr__
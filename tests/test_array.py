@@ -10,6 +10,8 @@ import itertools
 import io
 from bitstring.dtypes import Dtype
 import re
+import math
+import operator
 
 sys.path.insert(0, '..')
 
@@ -81,7 +83,7 @@ class TestCreation:
 
         a = Array('>d', [0, 0, 1])
         with pytest.raises(ValueError):
-            a.dtype = 'se'
+            a.dtype = 'u'
         assert a[-1] == 1.0
         assert a.dtype == Dtype('float64')
 
@@ -432,6 +434,20 @@ class TestArrayMethods:
         with pytest.raises(ValueError):
             a.reverse()
 
+    @pytest.mark.parametrize('dtype', ['bool', 'u7', 'u8', 'ile16', 'f32', 'u24', 'i64', 'u100', 'e2m1mxfp', 'hex12'])
+    def test_reverse_and_negative_step_slices(self, dtype):
+        d = Dtype(dtype)
+        a = Array(dtype)
+        a.data = BitArray().join(Bits(u=i * 37 % (1 << d.bitlength), length=d.bitlength) for i in range(50))
+        values = a.tolist()
+        data = a.data
+        a.reverse()
+        assert a.data is data
+        assert a.tolist() == values[::-1]
+        assert a[::-1].tolist() == values
+        assert a[40:10:-1].tolist() == values[::-1][40:10:-1]
+        assert a[10:40:-1].tolist() == []
+
     def test_byteswap(self):
         a = Array('float16')
         a.byteswap()
@@ -661,6 +677,25 @@ class TestArrayOperations:
         assert a.tolist() == [0, 13, 9]
         assert len(a.data) == 21
 
+    def test_in_place_ops_overwrite_data(self):
+        a = Array('u12', [1, 2, 3, 2000])
+        a.data += '0b11'
+        data = a.data
+        a += 5
+        assert a.data is data
+        assert a.to_list() == [6, 7, 8, 2005]
+        assert not a.trailing_bits
+        a <<= 1
+        assert a.to_list() == [12, 14, 16, 4010] and a.data is data
+        with pytest.raises(ValueError, match="caused 1 errors. First error at index 3"):
+            a *= 200
+        assert a.to_list() == [12, 14, 16, 4010]
+        a //= 3
+        assert a.to_list() == [4, 4, 5, 1336]
+        b = Array('e4m3mxfp_saturate', [1.0, -2.0, 3.0])
+        b *= 2
+        assert b.to_list() == [2.0, -4.0, 6.0]
+
     def test_add(self):
         a = Array('>d')
         a.extend([1.0, -2.0, 100.5])
@@ -766,6 +801,24 @@ class TestArrayOperations:
     def test_in_place_xor(self):
         a = Array('u10', [0, 0xf, 0x1f])
         a ^= '0b00, 0x0f'
+        assert a.tolist() == [0xf, 0, 0x10]
+
+    def test_bitwise_ops_leave_trailing_bits(self):
+        for trailing in ['0b1', '0b0', '0b101']:
+            a = Array('u4', [1, 2, 15])
+            a.data += trailing
+            data = a.data
+            a &= '0b0110'
+            assert a.tolist() == [0, 2, 6] and a.trailing_bits == trailing
+            a |= '0b1000'
+            assert a.tolist() == [8, 10, 14] and a.trailing_bits == trailing
+            b = a ^ '0b1111'
+            a ^= '0b1111'
+            assert a.tolist() == b.tolist() == [7, 5, 1] and a.trailing_bits == trailing
+            assert a.data is data
+        a = Array('u4')
+        a &= '0xf'
+        assert a.tolist() == []
 
     def test_rshift(self):
         a = Array(dtype='u8')
@@ -1021,3 +1074,599 @@ class TestMisc:
         y = Array('float16', [100, 2.0, 0.0, 4])
         x = x + (y == 0.0)
         assert x.tolist() == [1, 2, 4, 4]
+
+
+class TestVariableLengthDtypes:
+
+    def test_creation_and_access(self):
+        values = [3, 0, 100, 2 ** 40, 7] * 40
+        for name in ['ue', 'uie']:
+            a = Array(name, values)
+            assert len(a) == 200
+            assert a.data == Dtype(name).pack_many(values)
+            assert a.to_list() == values
+            assert list(a) == values
+            assert a[63] == values[63]
+            assert a[64] == values[64]
+            assert a[-1] == values[-1]
+            assert a[60:130].to_list() == values[60:130]
+            assert a[::7].to_list() == values[::7]
+            with pytest.raises(IndexError):
+                _ = a[200]
+        a = Array('se', [-5, 5, 0])
+        assert a.dtype == Dtype('se')
+        assert repr(a) == "Array('se', [-5, 5, 0])"
+        with pytest.raises(ValueError):
+            _ = a.itemsize
+
+    def test_modification(self):
+        values = list(range(300))
+        a = Array('sie', values)
+        a[100] = -2 ** 30
+        values[100] = -2 ** 30
+        assert a[250] == 250
+        a[1:5] = [9]
+        values[1:5] = [9]
+        a[::10] = [1] * len(values[::10])
+        values[::10] = [1] * len(values[::10])
+        del a[70]
+        del values[70]
+        del a[10:20]
+        del values[10:20]
+        a.insert(3, -4)
+        values.insert(3, -4)
+        a.append(12)
+        values.append(12)
+        a.extend(range(100))
+        values.extend(range(100))
+        assert a.pop() == values.pop()
+        assert a.to_list() == values
+        a.reverse()
+        values.reverse()
+        assert a.to_list() == values
+        assert (a + 1).to_list() == [v + 1 for v in values]
+        a -= 1
+        assert a.to_list() == [v - 1 for v in values]
+
+    def test_bad_values_and_trailing_bits(self):
+        a = Array('ue', [1, 2])
+        with pytest.raises(ValueError):
+            a.extend([3, -1])
+        assert a.to_list() == [1, 2]
+        with pytest.raises(ValueError):
+            _ = a - 3
+
+        a = Array.from_bytes('ue', b'\xff\x01')
+        assert len(a) == 8
+        assert a.trailing_bits == '0x01'
+        with pytest.raises(ValueError):
+            a.append(0)
+        a += 2
+        assert a.to_list() == [2] * 8
+        assert a.trailing_bits == '0x01'
+
+    def test_operator_errors_are_counted(self):
+        a = Array('ue', [1, 2, 0, 5, 0])
+        for f in [lambda: a - 1, lambda: a.__isub__(1)]:
+            with pytest.raises(ValueError, match="'sub' to Array caused 2 errors. First error at index 2 was: "):
+                f()
+        assert a.to_list() == [1, 2, 0, 5, 0]
+        with pytest.raises(ValueError, match="'floordiv' to Array caused 5 errors. First error at index 0 was: "):
+            a //= 0
+        assert a.to_list() == [1, 2, 0, 5, 0]
+
+    def test_data_changed_directly(self):
+        a = Array('ue', range(100))
+        assert len(a) == 100
+        a.data.append('0b1')
+        assert len(a) == 101
+        a.data = Bits('0b010, 0b011').to_bitarray()
+        assert a.to_list() == [1, 2]
+        a.dtype = 'uie'
+        assert a.to_list() == [5, 0]
+
+    def test_methods_needing_fixed_length(self, tmp_path):
+        a = Array('ue', [1, 2, 3])
+        with pytest.raises(ValueError, match="variable-length dtype 'ue' have no fixed itemsize"):
+            _ = a.itemsize
+        with pytest.raises(ValueError, match=r"byteswap\(\) with the variable-length dtype 'ue'"):
+            a.byteswap()
+        with pytest.raises(ValueError, match=r"pp\(\) with the variable-length dtype 'ue'"):
+            a.pp(stream=io.StringIO())
+        for op in (operator.and_, operator.or_, operator.xor, operator.iand, operator.ior, operator.ixor):
+            with pytest.raises(ValueError, match="the bitwise operators with the variable-length dtype 'ue'"):
+                _ = op(a, '0b1')
+        assert a.to_list() == [1, 2, 3]
+        with pytest.raises(ValueError, match=r"Array.from_zeros\(\) with the variable-length"):
+            _ = Array.from_zeros('se', 4)
+        filename = tmp_path / 'codes.bin'
+        filename.write_bytes(b'\xff')
+        with pytest.raises(ValueError, match=r"Array.from_file\(\) with the variable-length"):
+            _ = Array.from_file('uie', filename)
+        with pytest.raises(ValueError, match=r"Array.from_file\(\) with the variable-length"):
+            _ = Array.from_file('uie', filename, lazy=True)
+        with pytest.raises(ValueError, match=r"Array.memmap\(\) with the variable-length"):
+            _ = Array.memmap('uie', filename)
+
+    def test_data_changed_in_place_keeping_length(self):
+        a = Array('ue', [0, 0, 0])
+        assert len(a) == 3
+        a.data.overwrite(0, '0b010')
+        assert len(a) == 1
+        assert a.to_list() == [1]
+        a.data.invert()
+        assert a.to_list() == [0]
+        assert a.trailing_bits == '0b01'
+
+
+class TestNumpy:
+
+    def test_to_numpy(self):
+        np = pytest.importorskip('numpy')
+        a = Array('ule16', [1, 2, 65535])
+        n = a.to_numpy()
+        assert n.dtype == np.dtype('<u2')
+        assert n.tolist() == [1, 2, 65535]
+        # A read-only view of the Array's data, which is left alone when the Array changes.
+        assert not n.flags.writeable
+        with pytest.raises(ValueError):
+            n[0] = 7
+        a.data += '0b11'
+        assert a.to_numpy().tolist() == [1, 2, 65535]
+        a[1] = 3
+        assert a.to_numpy().tolist() == [1, 3, 65535]
+        assert n.tolist() == [1, 2, 65535]
+        # Data that doesn't start on a byte boundary of the storage it shares.
+        b = Array('u4', [1, 2, 3, 4, 5]).view(1)
+        b.dtype = 'u8'
+        assert b.to_numpy().tolist() == [0x23, 0x45]
+        for dtype in ['u8', 'i8', 'ibe16', 'ile32', 'u64', 'f16', 'fle32', 'f64']:
+            values = [0, 1, 100, -5] if dtype[0] in 'if' else [0, 1, 100, 5]
+            assert Array(dtype, values).to_numpy().tolist() == values
+
+        assert Array('bool', [1, 0, 1, 1, 0, 0, 0, 0, 1]).to_numpy().tolist() == [True, False, True, True, False, False, False, False, True]
+        assert Array('u12', [1, 4095]).to_numpy().tolist() == [1, 4095]
+        assert Array(Dtype('u8', scale=0.5), [1, 2]).to_numpy().tolist() == [1.0, 2.0]
+        assert Array('ue', [3, 1000]).to_numpy().tolist() == [3, 1000]
+        with pytest.raises(ValueError):
+            Array('bits4', ['0xf']).to_numpy()
+
+    def test_from_numpy(self):
+        np = pytest.importorskip('numpy')
+        values = [1, 2, 3, 1000]
+        for np_dtype in ['<u2', '>u2', '<i4', '>i4']:
+            for dtype in ['u16', 'ule16', 'ibe32', 'ile32']:
+                a = Array.from_numpy(dtype, np.array(values, dtype=np_dtype))
+                assert a.dtype == Dtype(dtype)
+                assert a.to_list() == values
+        a = Array.from_numpy('f32', np.array([0.5, -1.25], dtype='<f4'))
+        assert a.equals(Array('f32', [0.5, -1.25]))
+        assert Array.from_numpy('bool', np.array([True, False, True])).to_list() == [True, False, True]
+        assert Array.from_numpy('u12', np.arange(5)).to_list() == [0, 1, 2, 3, 4]
+        assert Array.from_numpy('f16', np.array([1, 2], dtype=np.int64)).to_list() == [1.0, 2.0]
+        with pytest.raises(ValueError):
+            Array.from_numpy('u8', np.array([1, 256]))
+        with pytest.raises(ValueError):
+            Array.from_numpy('u8', np.array([[1, 2]]))
+
+
+class TestBufferProtocol:
+
+    def test_buffer(self):
+        a = Array('u16', [1, 2, 3])
+        assert a.__buffer__(0).tobytes() == b'\x00\x01\x00\x02\x00\x03'
+        a.data.append('0b1')
+        with pytest.raises(BufferError):
+            a.__buffer__(0)
+        if sys.version_info >= (3, 12):
+            assert memoryview(Array('ule16', [1, 2, 3])).cast('H').tolist() == ([1, 2, 3] if sys.byteorder == 'little' else [256, 512, 768])
+
+
+class TestBulkDecode:
+
+    @pytest.mark.parametrize('dtype', ['p3binary', 'p4binary', 'e4m3mxfp_saturate', 'e4m3mxfp_overflow',
+                                       'e5m2mxfp_saturate', 'e5m2mxfp_overflow', 'e3m2mxfp', 'e2m3mxfp',
+                                       'e2m1mxfp', 'e8m0mxfp', 'mxint', 'bfloat', 'bfloatle'])
+    def test_matches_item_at_a_time(self, dtype):
+        d = Dtype(dtype)
+        # Every code, so that NaNs and infinities are covered too.
+        codes = range(1 << d.bitlength) if d.bitlength <= 8 else range(0, 1 << 16, 97)
+        a = Array(dtype)
+        a.data = BitArray().join(Bits(u=c, length=d.bitlength) for c in codes)
+        expected = [a[i] for i in range(len(a))]
+        assert a._bulk_decode is not None
+
+        def same(x, y):
+            return x == y or (math.isnan(x) and math.isnan(y))
+        assert all(map(same, a.to_list(), expected))
+        assert all(map(same, list(a), expected))
+        assert all(map(same, a[::-3].to_list(), expected[::-3]))
+        assert all(map(same, a[5:30].to_list(), expected[5:30]))
+
+    def test_operations(self):
+        a = Array('e4m3mxfp_saturate', [1.0, -2.0, 0.5, 448.0])
+        assert (a * 2).to_list() == [2.0, -4.0, 1.0, 448.0]
+        assert (a + Array('bfloat', [1, 1, 1, 1])).to_list() == [2.0, -1.0, 1.5, 448.0]
+        a.data.append('0b1')
+        assert (a >= 0.5).to_list() == [True, False, True, True]
+        b = Array('bfloatle', [1.5, -3.0])
+        assert (b - 1).to_list() == [0.5, -4.0]
+        assert list(Array('mxint', [])) == []
+
+
+class TestBulkEncode:
+
+    @pytest.mark.parametrize('dtype', ['p3binary', 'p4binary', 'e4m3mxfp_saturate', 'e4m3mxfp_overflow',
+                                       'e5m2mxfp_saturate', 'e5m2mxfp_overflow', 'e3m2mxfp', 'e2m3mxfp',
+                                       'e2m1mxfp', 'mxint', 'bfloat', 'bfloatle'])
+    def test_matches_item_at_a_time(self, dtype):
+        d = Dtype(dtype)
+        values = [0.0, -0.0, 0.3, -1.7, 2.5, 3.5, 1e-9, 100.25, -448.0, 57344.0,
+                  65519.99, 65520.0, -1e300, 3.5e38, float('inf'), float('-inf'), '1.5']
+        if dtype not in ('e3m2mxfp', 'e2m3mxfp', 'e2m1mxfp', 'mxint'):
+            values.append(float('nan'))
+        a = Array(dtype, values)
+        assert a.data == Bits().join(d.pack(v) for v in values)
+        a[2:4] = [1.0, -1.0]
+        assert a[2:4].to_list() == [1.0, -1.0]
+        assert Array('f32', [0.5, 1e10]).astype(dtype).data == Bits().join(d.pack(v) for v in [0.5, 1e10])
+
+    def test_bad_values_raise_as_before(self):
+        with pytest.raises(ValueError):
+            Array('e2m1mxfp', [1.0, float('nan')])
+        with pytest.raises(ValueError):
+            Array('mxint', [float('nan')])
+        a = Array('e8m0mxfp', [0.5, float('nan'), 2 ** 100])
+        assert a.data == Bits().join(Dtype('e8m0mxfp').pack(v) for v in [0.5, float('nan'), 2 ** 100])
+        with pytest.raises(ValueError):
+            a.extend([3.0])
+        assert len(a) == 3
+
+
+class TestReductions:
+
+    def test_integer_reductions(self):
+        values = [5, -3, 100, -3, 100, 0]
+        for dtype in ['i8', 'i13', 'se', Dtype('i8', scale=2)]:
+            a = Array(dtype, values)
+            expected = a.to_list()
+            assert a.sum() == sum(expected)
+            assert a.nansum() == sum(expected)
+            assert a.mean() == sum(expected) / len(expected)
+            assert a.min() == min(expected) and a.max() == max(expected)
+            assert a.argmin() == 1 and a.argmax() == 2
+            assert a.nanargmin() == 1 and a.nanargmax() == 2
+        assert type(Array('u8', [1, 2]).sum()) is int
+
+    def test_float_reductions_with_nan(self):
+        nan = float('nan')
+        for dtype in ['f32', 'bfloat', 'e5m2mxfp_saturate']:
+            a = Array(dtype, [1.5, nan, -2.0, 8.0, nan, 8.0])
+            assert math.isnan(a.sum()) and math.isnan(a.mean())
+            assert math.isnan(a.min()) and math.isnan(a.max())
+            assert a.argmin() == a.argmax() == 1
+            assert a.nansum() == 15.5
+            assert a.nanmean() == 15.5 / 4
+            assert a.nanmin() == -2.0 and a.nanmax() == 8.0
+            assert a.nanargmin() == 2 and a.nanargmax() == 3
+            assert a.count(nan) == 2
+        a = Array('f16', [nan, nan])
+        with pytest.raises(ValueError):
+            a.nanmax()
+        with pytest.raises(ValueError):
+            a.nanmean()
+        assert a.nansum() == 0
+
+    def test_bool_and_empty(self):
+        a = Array('bool', [1, 0, 1, 1] * 1000)
+        assert a.sum() == 3000
+        assert a.mean() == 0.75
+        assert a.argmin() == 1
+        e = Array('u8')
+        assert e.sum() == 0
+        for method in [e.min, e.max, e.argmin, e.argmax, e.mean, e.nanmin]:
+            with pytest.raises(ValueError):
+                method()
+        with pytest.raises(TypeError):
+            Array('hex8', ['ab']).sum()
+        assert Array('hex8', ['ab', 'ff', '01']).max() == 'ff'
+
+    def test_reductions_across_chunks(self, monkeypatch):
+        monkeypatch.setattr(bitstring.array_, '_REDUCTION_CHUNK', 7)
+        values = [(i * 37) % 101 - 50 for i in range(200)]
+        for dtype in ['i8', 'i7', 'sie']:
+            a = Array(dtype, values)
+            assert a.sum() == sum(values)
+            assert a.min() == min(values) and a.argmin() == values.index(min(values))
+            assert a.max() == max(values) and a.argmax() == values.index(max(values))
+        a = Array('f32', [1.0] * 20 + [float('nan')] + [0.5] * 20)
+        assert a.argmin() == 20
+        assert a.nanargmin() == 21
+        assert a.count(float('nan')) == 1
+
+
+class TestSorting:
+
+    def test_sort_and_argsort(self):
+        values = [(i * 7919) % 1000 for i in range(500)]
+        for dtype in ['u48', 'u10', 'i32', 'ile16', 'ule32', 'ue', Dtype('u16', scale=0.5)]:
+            a = Array(dtype, values)
+            expected = a.to_list()
+            assert a.argsort() == sorted(range(500), key=expected.__getitem__)
+            assert not a.is_sorted()
+            a.sort()
+            assert a.to_list() == sorted(expected)
+            assert a.is_sorted() and not a.is_sorted(reverse=True)
+            a.sort(reverse=True)
+            assert a.to_list() == sorted(expected, reverse=True)
+            assert a.is_sorted(reverse=True)
+
+    def test_sort_strings_and_bytes_by_code(self):
+        values = [f'{(i * 7919) % 4096:03x}' for i in range(300)]
+        for dtype, items in [('hex12', values), ('bin12', [f'{int(v, 16):012b}' for v in values]),
+                             ('oct12', [f'{int(v, 16):04o}' for v in values]), ('bytes3', [v.encode() for v in values])]:
+            a = Array(dtype, items)
+            a.data += '0b1'
+            assert a.argsort() == sorted(range(300), key=items.__getitem__)
+            assert a.argsort(reverse=True) == sorted(range(300), key=items.__getitem__, reverse=True)
+            a.sort(reverse=True)
+            assert a.to_list() == sorted(items, reverse=True)
+            assert a.trailing_bits == '0b1'
+
+    def test_sort_keeps_bits_and_trailing_bits(self):
+        nan = float('nan')
+        a = Array('f16', [0.0, nan, -1.0, -0.0, 2.0, nan])
+        a.data += '0b101'
+        assert a.argsort() == [2, 0, 3, 4, 1, 5]
+        a.sort()
+        assert a.data[:96] == Array('f16', [-1.0, 0.0, -0.0, 2.0, nan, nan]).data
+        assert a.trailing_bits == '0b101'
+        assert a.is_sorted()
+        a.sort(reverse=True)
+        assert a.to_list()[:4] == [2.0, 0.0, -0.0, -1.0]
+        assert a.is_sorted(reverse=True)
+        assert not Array('f16', [1.0, nan, 2.0]).is_sorted()
+        assert Array('hex4', list('0a5f')).argsort() == [0, 2, 1, 3]
+        assert Array('u8').is_sorted()
+
+    def test_is_sorted_across_chunks(self, monkeypatch):
+        monkeypatch.setattr(bitstring.array_, '_REDUCTION_CHUNK', 3)
+        assert Array('u8', range(20)).is_sorted()
+        assert not Array('u8', list(range(9)) + [2] + list(range(10, 20))).is_sorted()
+        nan = float('nan')
+        assert Array('f32', [1.0, 2.0, 3.0, 4.0, nan, nan, nan]).is_sorted()
+        assert not Array('f32', [1.0, 2.0, nan, nan, nan, 5.0]).is_sorted()
+
+    def test_searchsorted(self):
+        a = Array('u48', [10, 20, 20, 20, 30, 2 ** 40])
+        assert [a.searchsorted(v) for v in [0, 10, 15, 20, 30, 2 ** 47]] == [0, 0, 1, 1, 4, 6]
+        assert [a.searchsorted(v, side='right') for v in [0, 10, 20, 2 ** 40]] == [0, 1, 4, 6]
+        assert Array('u8').searchsorted(5) == 0
+        assert Array('ue', [1, 5, 9]).searchsorted(6) == 2
+        with pytest.raises(ValueError):
+            a.searchsorted(5, side='middle')
+
+
+class TestScaledBulk:
+
+    def test_matches_per_element(self):
+        floats = [-3.5, 0.0, 1.25, 7.0, -0.0625]
+        for dtype, values in [(Dtype('i8', scale=2 ** -4), floats), (Dtype('f16', scale=0.5), floats),
+                              (Dtype('u12', scale=3), [0, 3, 9, 12, 3000]), (Dtype('float32', scale=2), floats),
+                              (Dtype('e4m3mxfp_saturate', scale=2 ** -2), floats), (Dtype('bfloat', scale=4), floats)]:
+            a = Array(dtype, values)
+            assert a._bulk_decode is not None and a._bulk_encode is not None
+            expected = [dtype.unpack(dtype.pack(v)) for v in values]
+            assert a.to_list() == expected
+            assert list(a) == expected
+            assert a.data == Bits().join(dtype.pack(v) for v in values)
+            a[1:3] = values[2:4]
+            assert a.to_list()[1:3] == expected[2:4]
+
+    def test_truncation_and_errors_as_per_element(self):
+        d = Dtype('i8', scale=2 ** -4)
+        a = Array(d, [0.03, -0.1, 7.99])
+        assert a.to_list() == [d.unpack(d.pack(v)) for v in [0.03, -0.1, 7.99]]
+        with pytest.raises(ValueError):
+            Array(d, [1.0, 8.0])
+        with pytest.raises(ValueError):
+            Array(Dtype('u8', scale=2), [2, -2])
+        a = Array(Dtype('i16', scale=0.5), [1, 2, 3])
+        a *= 2
+        assert a.to_list() == [2.0, 4.0, 6.0]
+        assert a.sum() == 12.0
+
+
+class TestMappedArray:
+
+    def test_lazy_from_file(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(bitstring.mappedarray, '_CHUNK_BYTES', 16)
+        monkeypatch.setattr(bitstring.mappedarray, '_CACHE_CHUNKS', 2)
+        values = [(i * 37) % 4096 - 2048 for i in range(1000)]
+        expected = Array('i12', values)
+        filename = tmp_path / 'items.bin'
+        filename.write_bytes(expected.to_bytes())
+        with Array.from_file('i12', filename, lazy=True) as m:
+            assert isinstance(m, bitstring.MappedArray)
+            assert len(m) == 1000 and m.itemsize == 12 and m.dtype == Dtype('i12')
+            assert repr(m) == "MappedArray('i12', length=1000)"
+            assert [m[i] for i in (0, 1, 999, -1, 500, 11, 0)] == [values[i] for i in (0, 1, 999, -1, 500, 11, 0)]
+            assert len(m._chunks) == 2
+            assert m.to_list() == values
+            assert list(m) == values
+            assert m.to_array() == expected
+            for key in [slice(3, 50), slice(None, None, 7), slice(900, 100, -3), slice(None, None, -1),
+                        slice(5, 5), slice(10, 0), slice(1, None, 200), slice(999, None, -250)]:
+                assert m[key].to_list() == values[key]
+                assert m[key].data == expected[key].data
+            with pytest.raises(IndexError):
+                _ = m[1000]
+            with pytest.raises(TypeError):
+                m[0] = 1
+        with pytest.raises(ValueError):
+            _ = m[0]
+
+    def test_lazy_from_file_object_and_count(self, tmp_path):
+        filename = tmp_path / 'items.bin'
+        filename.write_bytes(bytes(range(10)))
+        with open(filename, 'rb') as f:
+            f.seek(2)
+            with Array.from_file(Dtype('u8', scale=0.5), f, 3, lazy=True) as m:
+                assert f.tell() == 2
+                assert m.to_list() == [1.0, 1.5, 2.0]
+        with Array.from_file('e4m3mxfp_saturate', filename, lazy=True) as m:
+            assert m.to_list() == Array.from_file('e4m3mxfp_saturate', filename).to_list()
+        with pytest.raises(EOFError):
+            _ = Array.from_file('u8', filename, 11, lazy=True)
+        with pytest.raises(ValueError):
+            _ = Array.from_file('ue', filename, lazy=True)
+        with pytest.raises(TypeError):
+            _ = Array.from_file('u8', io.BytesIO(b'123'), lazy=True)
+
+    def test_empty_file(self, tmp_path):
+        filename = tmp_path / 'empty.bin'
+        filename.write_bytes(b'')
+        assert len(Array.from_file('u8', filename)) == 0
+        for mode in ('r', 'r+'):
+            with Array.memmap('f32', filename, mode=mode) as m:
+                assert len(m) == 0 and m.to_list() == [] and len(m[:]) == 0
+                m[:] = []
+            with pytest.raises(EOFError):
+                _ = Array.memmap('f32', filename, 1, mode=mode)
+        with open(filename, 'rb') as f:
+            with Array.from_file('u8', f, 0, lazy=True) as m:
+                assert m.to_array().equals(Array('u8'))
+            with pytest.raises(EOFError):
+                _ = Array.from_file('u8', f, 1, lazy=True)
+
+    def test_memmap_writes_in_place(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(bitstring.mappedarray, '_CHUNK_BYTES', 16)
+        values = list(range(-500, 500))
+        expected = Array('i12', values)
+        filename = tmp_path / 'items.bin'
+        filename.write_bytes(expected.to_bytes() + b'\xff')
+        with Array.memmap('i12', filename) as m:
+            assert m.mode == 'r+' and repr(m) == "MappedArray('i12', length=1000, mode='r+')"
+            assert m[3] == values[3]  # Cache the first chunk, which the writes have to refresh.
+            m[3] = 77
+            m[-1] = -2048
+            m[10:14] = [1, 2, 3, 4]
+            m[100:20:-9] = range(9)
+            for key, v in [(3, 77), (-1, -2048), (slice(10, 14), [1, 2, 3, 4]), (slice(100, 20, -9), list(range(9)))]:
+                expected[key] = v
+            assert m.to_array() == expected
+            m.flush()
+            assert filename.read_bytes()[:-1] == expected.to_bytes()
+            m += 1
+            m[0:2] = [0, 0]
+            with pytest.raises(ValueError):
+                m[0:2] = [1, 2, 3]
+            with pytest.raises(ValueError):
+                m[5] = 5000
+            with pytest.raises(IndexError):
+                m[1000] = 0
+            with pytest.raises(TypeError):
+                m += Array('i12', [1])
+        expected += 1
+        expected[0:2] = [0, 0]
+        data = filename.read_bytes()
+        assert data[:-1] == expected.to_bytes() and data[-1] == 0xff
+        with Array.memmap('i12', filename, mode='r') as m:
+            assert m.to_list() == expected.to_list()
+
+    def test_memmap_stepped_assignment_reads_little(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(bitstring.mappedarray, '_CHUNK_BYTES', 16)
+        filename = tmp_path / 'items.bin'
+        filename.write_bytes(bytes(10_000))
+        expected = Array.from_zeros('u8', 10_000)
+        with Array.memmap('u8', filename) as m:
+            spans = []
+            read = m._read
+            monkeypatch.setattr(m, '_read', lambda start, stop: spans.append(stop - start) or read(start, stop))
+            m[::1000] = range(1, 11)
+            expected[::1000] = range(1, 11)
+            assert spans == [1] * 10
+            spans.clear()
+            m[9999::-5] = [7] * 2000
+            expected[9999::-5] = [7] * 2000
+            assert max(spans) <= m._chunk_items
+            with pytest.raises(ValueError):
+                m[::1000] = range(3)
+            with pytest.raises(ValueError):
+                m[::1000] = [1] * 9 + [256]
+            assert m.to_array() == expected
+        assert filename.read_bytes() == expected.to_bytes()
+
+    def test_memmap_operator_error(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(bitstring.mappedarray, '_CHUNK_BYTES', 1)
+        filename = tmp_path / 'items.bin'
+        filename.write_bytes(bytes([0] * 10 + [250] * 10))
+        with Array.memmap('u8', filename) as m:
+            with pytest.raises(ValueError, match="failed at index 10, which has the value 250. The 8 items"):
+                m += 10
+        assert filename.read_bytes() == bytes([10] * 8 + [0] * 2 + [250] * 10)
+
+        # If no single item can be found to blame, the chunk's own error is raised.
+        monkeypatch.setattr(bitstring.MappedArray, '_raise_item_error', lambda *args: None)
+        with Array.memmap('u8', filename) as m:
+            with pytest.raises(ValueError, match="Applying operator 'add' to Array caused 6 errors"):
+                m += 10
+
+    def test_memmap_file_object_and_errors(self, tmp_path):
+        filename = tmp_path / 'items.bin'
+        filename.write_bytes(bytes(range(10)))
+        with open(filename, 'r+b') as f:
+            f.seek(4)
+            with Array.memmap('u8', f, 2) as m:
+                m[1] = 100
+                m <<= 1
+        assert filename.read_bytes() == bytes([0, 1, 2, 3, 8, 200, 6, 7, 8, 9])
+        with Array.memmap('u8', filename, mode='r') as m:
+            with pytest.raises(TypeError):
+                m[0] = 1
+            with pytest.raises(TypeError):
+                m += 1
+        with pytest.raises(ValueError):
+            _ = Array.memmap('u8', filename, mode='w')
+        with pytest.raises(EOFError):
+            _ = Array.memmap('u8', filename, 11)
+
+
+class TestViews:
+
+    def test_view_shares_data(self):
+        a = Array('u16', range(100))
+        v = a.view(10, 20)
+        assert v.to_list() == list(range(10, 20))
+        assert a.view().to_list() == list(range(100))
+        assert a.view(-3).to_list() == [97, 98, 99]
+        assert len(a.view(50, 10)) == 0
+        # The view and later slices of either Array use the shared data.
+        shared = a.data._bitstore.tibs
+        assert v.data._bitstore.tibs.to_bytes() == shared[160:320].to_bytes()
+        assert isinstance(a[5:8].data._bitstore, bitstring.bitstore.SharedBitStore)
+        assert isinstance(v[1:3].data._bitstore, bitstring.bitstore.SharedBitStore)
+
+    def test_copy_on_write(self):
+        a = Array('i7', [1, 2, 3, 4, 5, 6])
+        v = a.view(1, 4)
+        w = a.view(2)
+        v[0] = -1
+        assert v.to_list() == [-1, 3, 4]
+        assert a.to_list() == [1, 2, 3, 4, 5, 6]
+        a += 10
+        assert a.to_list() == [11, 12, 13, 14, 15, 16]
+        assert w.to_list() == [3, 4, 5, 6]
+        w.append(7)
+        w.data.invert()
+        assert w.to_list() == [-4, -5, -6, -7, -8]
+        assert v.to_list() == [-1, 3, 4]
+
+    def test_variable_length_view(self):
+        a = Array('se', [0, -1, 2, -3, 4, -5])
+        v = a.view(2, 5)
+        assert v.to_list() == [2, -3, 4]
+        del v[0]
+        a.extend([6])
+        assert v.to_list() == [-3, 4]
+        assert a.to_list() == [0, -1, 2, -3, 4, -5, 6]
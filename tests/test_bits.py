@@ -1147,3 +1147,37 @@ def test_large_ints():
     assert s.int == -1
     s = Bits(u=12, length=201)
     assert s.uint == 12
+
+
+class TestBufferProtocol:
+
+    def test_whole_bytes(self):
+        b = Bits(b'hello world')
+        view = b.__buffer__(0)
+        assert view.readonly
+        assert view.tobytes() == b'hello world'
+        assert b[8:40].__buffer__(0).tobytes() == b'ello'
+        assert b[3:35].__buffer__(0).tobytes() == b[3:35].to_bytes()
+        a = BitArray(b)
+        assert a.__buffer__(0).tobytes() == b'hello world'
+        a.append('0x00')
+        assert a.__buffer__(0).tobytes() == b'hello world\x00'
+        with pytest.raises(BufferError):
+            b[0:5].__buffer__(0)
+        with pytest.raises(BufferError):
+            BitArray('0b1').__buffer__(0)
+
+    @pytest.mark.skipif(sys.version_info < (3, 12), reason="The buffer protocol needs __buffer__ support.")
+    def test_memoryview(self):
+        import hashlib
+        b = Bits('0x0102ff')
+        assert memoryview(b)[1:].tolist() == [2, 255]
+        assert hashlib.sha256(b).digest() == hashlib.sha256(b'\x01\x02\xff').digest()
+        assert bytearray(BitArray('0xabcd')) == b'\xab\xcd'
+
+    def test_to_file(self):
+        b = Bits(b'hello world')
+        for s in [b, b[8:], b[3:35], b[3:10]]:
+            f = io.BytesIO()
+            s.to_file(f)
+            assert f.getvalue() == s.to_bytes()
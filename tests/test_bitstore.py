@@ -27,3 +27,33 @@ class TestBasicFunctionality:
             _ = a.getindex(3)
         with pytest.raises(IndexError):
             _ = a.getindex(-4)
+
+
+class TestSharedBitStore:
+
+    def test_share_and_copy_on_write(self):
+        a = MutableBitStore(Mutibs.from_bin('00110101'))
+        t = a.share()
+        assert isinstance(a, bitstring.bitstore.SharedBitStore)
+        assert a.share() is t
+        b = a.getslice(2, 6)
+        assert isinstance(b, bitstring.bitstore.SharedBitStore)
+        assert b.to_bin() == '1101'
+        b[0:2] = MutableBitStore(Mutibs.from_bin('00'))
+        assert type(b) is MutableBitStore
+        assert b.to_bin() == '0001'
+        assert a.to_bin() == '00110101'
+        a.reverse()
+        assert type(a) is MutableBitStore
+        assert a.to_bin() == '10101100'
+        assert t.to_bin() == '00110101'
+
+    def test_clear_and_copy(self):
+        a = MutableBitStore(Mutibs.from_bin('1111'))
+        a.share()
+        c = a._mutable_copy()
+        a.clear()
+        assert len(a) == 0
+        assert c.to_bin() == '1111'
+        c += MutableBitStore(Mutibs.from_bin('0'))
+        assert c.to_bin() == '11110'
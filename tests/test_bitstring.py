@@ -8,6 +8,7 @@ import pickle
 from collections import abc
 import sys
 import os
+import pytest
 
 
 sys.path.insert(0, '..')
@@ -17,8 +18,8 @@ THIS_DIR = os.path.dirname(os.path.abspath(__file__))
 class TestModuleData:
 
     def test_all(self):
-        exported = ['Reader', 'BitArray',
-                    'Bits', 'pack', 'Error', 'ReadError', 'Array',
+        exported = ['Reader', 'StreamReader', 'AsyncReader', 'BitArray',
+                    'Bits', 'pack', 'pack_rows', 'Error', 'ReadError', 'Array', 'MXArray', 'MappedArray',
                     'InterpretError', 'ByteAlignError', 'CreationError', 'Dtype']
         assert set(bitstring.__all__) == set(exported)
 
@@ -39,7 +40,7 @@ class TestModuleData:
     def test_no_internal_names_in_namespace(self):
         # Only the public API and genuine submodules should be visible on the package.
         submodules = {'array_', 'bitarray_', 'bits', 'bitstore', 'bitstore_helpers',
-                      'colour', 'dtypes', 'exceptions', 'fp8', 'helpers', 'luts', 'methods', 'mxfp',
+                      'colour', 'dtypes', 'exceptions', 'fp8', 'helpers', 'luts', 'mappedarray', 'methods', 'mxarray', 'mxfp',
                       'reader', 'utils'}
         public = {n for n in dir(bitstring) if not n.startswith('_')}
         unexpected = public - set(bitstring.__all__) - submodules
@@ -173,6 +174,54 @@ class TestABCs:
         assert not isinstance(bitarray, abc.Sequence)
 
 
+class TestPackRows:
+
+    def test_matches_pack(self):
+        rows = [(i % 256, i * 0.25, bool(i % 3), 'a5') for i in range(1000)]
+        expected = bitstring.Bits().join(bitstring.pack('u8, f32, bool, hex8', *row) for row in rows)
+        assert bitstring.pack_rows('u8, f32, bool, hex8', rows) == expected
+        assert bitstring.pack_rows('u8, f32, bool, hex8', (row for row in rows), chunk_size=7) == expected
+        assert bitstring.pack_rows('u8', []) == bitstring.Bits()
+
+    def test_general_formats(self):
+        assert bitstring.pack_rows('u4, ue, 0b1', [(1, 2), (3, 4)]) == '0b0001, 0b011, 0b1, 0b0011, 0b00101, 0b1'
+        assert bitstring.pack_rows('u:n', [(1,), (2,)], n=4) == '0x12'
+        assert bitstring.pack_rows(['u4', 'bits'], [[1, '0b1'], [2, '0b01']]) == '0b00011, 0b001001'
+
+    def test_errors(self):
+        with pytest.raises(ValueError):
+            bitstring.pack_rows('u8, u8', [(1, 2), (3, 300)])
+        with pytest.raises(bitstring.CreationError):
+            bitstring.pack_rows('u8, u8', [(1, 2), (3,)])
+        with pytest.raises(ValueError):
+            bitstring.pack_rows('u8', [(1,)], chunk_size=0)
+
+
+class TestPackWithKeywords:
+
+    def test_keyword_values_and_lengths(self):
+        fmt = 'u8=version, u16=length, bytes:length=payload'
+        for payload in [b'abc', b'', b'xy' * 100]:
+            s = bitstring.pack(fmt, version=1, length=len(payload), payload=payload)
+            assert s == bitstring.Bits(u8=1) + bitstring.Bits(u16=len(payload)) + payload
+        assert bitstring.pack('u8, i:n=v, bool=b, f:n', 5, 3.5, n=16, v=-2, b=True) == \
+            bitstring.pack('u8, i16, bool, f16', 5, -2, True, 3.5)
+        # Literals and keyword-only tokens still work.
+        assert bitstring.pack('u8=55, i:n=v', n=8, v=1) == '0x3701'
+        assert bitstring.pack('hello, u4=a', hello='0b1', a=2) == '0b10010'
+
+    def test_errors(self):
+        fmt = 'u8=version, u16=length, bytes:length=payload'
+        with pytest.raises(ValueError):
+            bitstring.pack(fmt, version=1, length=3, payload=b'ab')
+        with pytest.raises(ValueError):
+            bitstring.pack(fmt, version=256, length=3, payload=b'abc')
+        with pytest.raises(bitstring.CreationError):
+            bitstring.pack('u8=a, u8', a=1)
+        with pytest.raises(bitstring.CreationError):
+            bitstring.pack('u8=a', 2, a=1)
+
+
 class TestNoFixedLengthPackingBug:
 
     def test_packing_bytes_with_no_length(self):
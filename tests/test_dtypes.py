@@ -155,6 +155,27 @@ class TestBasicFunctionality:
         with pytest.raises(ValueError):
             d.pack(4)
 
+    def test_pack_many_exp_golomb(self):
+        for name, values in [('ue', [0, 1, 100, 2 ** 300, 7]), ('se', [0, -1, 1, -2 ** 200, 55]),
+                             ('uie', [0, 1, 100, 2 ** 300, 7]), ('sie', [0, -1, 1, -2 ** 200, 55])]:
+            d = Dtype(name)
+            a = d.pack_many(values)
+            assert a == bs.Bits().join(d.pack(v) for v in values)
+            assert a.unpack([name] * len(values)) == values
+        assert Dtype('ue').pack_many(x for x in range(3)) == '0b1010011'
+        assert Dtype('se').pack_many([]) == bs.Bits()
+        with pytest.raises(ValueError):
+            Dtype('ue').pack_many([1, -1])
+        with pytest.raises(ValueError):
+            Dtype('uie').pack_many([-1])
+
+    def test_pack_many(self):
+        assert Dtype('u8').pack_many(range(3)) == '0x000102'
+        assert Dtype('bin3').pack_many(['101', '010']) == '0b101010'
+        assert Dtype('u4', scale=2).pack_many([2, 30]) == '0x1f'
+        with pytest.raises(ValueError):
+            Dtype('u8').pack_many([1, 256])
+
 
 class TestChangingTheRegister:
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import sys
 import math
-from bitstring import BitArray, Dtype, Array, CreationError
+from bitstring import BitArray, Dtype, Array, CreationError, MXArray
 import pytest
 import gfloat
 from gfloat.formats import format_info_ocp_e4m3, format_info_ocp_e5m2
@@ -252,6 +252,20 @@ def test_auto_scaling_error():
     assert b.dtype.scale == expected_scale
 
 
+def test_auto_scaling_from_iterables():
+    f = [0.0, 100.0, 1000.0, -150.0]
+    expected = Array(Dtype('e4m3mxfp_saturate', scale='auto'), f)
+    assert expected.dtype.scale == 2
+    a = Array(Dtype('e4m3mxfp_saturate', scale='auto'), (x for x in f))
+    assert a.dtype == expected.dtype and a.data == expected.data
+    a = Array(Dtype('mxint', scale='auto'), range(-100, 101, 50))
+    assert a.dtype.scale == 64 and a.to_list() == [-100.0, -50.0, 0.0, 50.0, 100.0]
+    with pytest.raises(ValueError):
+        _ = Array(Dtype('e3m2mxfp', scale='auto'), iter([]))
+    with pytest.raises(TypeError):
+        _ = Array(Dtype('e3m2mxfp', scale='auto'), 'abc')
+
+
 def test_scaled_array_errors():
     with pytest.raises(ValueError):
         _ = Array(Dtype('bfloat', scale='auto'), [0.0, 100.0, 256.0, -150.0])
@@ -467,3 +481,43 @@ def test_roundtrips(fmt):
             assert math.isnan(fmt.unpack(b2))
         else:
             assert b == b2
+
+
+@pytest.mark.parametrize("name", ['e4m3mxfp_saturate', 'e5m2mxfp_overflow', 'e3m2mxfp', 'e2m3mxfp', 'e2m1mxfp', 'mxint'])
+def test_mxarray_matches_auto_scaled_blocks(name):
+    values = [math.sin(i) * 2.0 ** (i % 23 - 11) for i in range(100)]
+    m = MXArray(name, values)
+    assert len(m) == 100 and len(m.scales) == 4
+    expected = []
+    for i in range(0, 100, 32):
+        a = Array(Dtype(name, scale='auto'), values[i: i + 32])
+        assert a.dtype.scale == m.scales[i // 32]
+        assert a.data == m.codes.data[i * a.itemsize: (i + 32) * a.itemsize]
+        expected.extend(a.to_list())
+    assert m.to_list() == expected
+    assert list(m) == expected
+    assert [m[0], m[-1]] == [expected[0], expected[-1]]
+    assert MXArray.from_arrays(m.codes, m.scales) == m
+
+
+def test_mxarray_special_values():
+    nan, inf = float('nan'), float('inf')
+    m = MXArray('e5m2mxfp_overflow', [0.0, 0.0, 512.0, nan, -inf, 3.0], block_size=3)
+    assert m.scales.to_list() == [2.0 ** -6, 2.0 ** -14]
+    assert m.to_list()[:3] == [0.0, 0.0, 512.0]
+    assert MXArray('mxint', [0.0, 0.0]).scales.to_list() == [1.0]
+    assert math.isnan(m[3]) and m[4] == -inf and m[5] == 3.0
+    assert repr(MXArray('mxint', [1.0], block_size=2)) == "MXArray('mxint', [1.0], block_size=2)"
+    assert MXArray('mxint').to_list() == []
+    with pytest.raises(ValueError):
+        MXArray('e2m1mxfp', [1.0, nan])
+    with pytest.raises(ValueError):
+        MXArray('f16', [1.0])
+    with pytest.raises(ValueError):
+        MXArray(Dtype('e2m1mxfp', scale=2), [1.0])
+    with pytest.raises(ValueError):
+        MXArray('mxint', [1.0], block_size=0)
+    with pytest.raises(ValueError):
+        MXArray.from_arrays(Array('mxint', [1.0] * 33), Array('e8m0mxfp', [1.0]))
+    with pytest.raises(IndexError):
+        MXArray('mxint', [1.0])[1]
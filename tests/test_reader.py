@@ -1,7 +1,11 @@
+import asyncio
+import io
+import os
+
 import pytest
 
 import bitstring
-from bitstring import BitArray, Bits, Dtype, Reader, pack
+from bitstring import AsyncReader, BitArray, Bits, Dtype, Reader, StreamReader, pack
 
 
 def test_creation_and_bits_property():
@@ -190,3 +194,306 @@ def test_reader_with_pack_result():
     r = Reader(bits)
     assert r.read("uint8") == 1
     assert r.read("uint8") == 2
+
+
+def test_read_ue_and_se_many():
+    values = [0, 1, 2, 3, 100, 0, 65535, 7]
+    bits = Bits().join(Bits(ue=v) for v in values)
+    r = Reader(bits + "0b1")
+    assert r.read_ue_many(len(values)) == values
+    assert r.pos == len(bits)
+    assert r.read_ue_many(0) == []
+    assert r.read_ue_many(1) == [0]
+
+    signed = [0, -1, 1, -200, 200, 3]
+    bits = Bits().join(Bits(se=v) for v in signed)
+    r = Reader(bits)
+    assert r.read_se_many(len(signed)) == signed
+    assert r.pos == len(bits)
+
+
+def test_read_ue_many_long_codes_and_windows():
+    # Codes longer than the decoder's window, and enough codes to need several windows.
+    values = [2 ** 700, 5, 2 ** 1200 + 3] + list(range(1000))
+    bits = Bits().join(Bits(ue=v) for v in values)
+    assert Reader(bits).read_ue_many(len(values)) == values
+    assert bits.unpack(", ".join(["ue"] * len(values))) == values
+
+
+def test_read_ue_many_off_end_restores_pos():
+    r = Reader(Bits("0b1, 0b010, 0b0001"), pos=0)
+    with pytest.raises(bitstring.ReadError):
+        r.read_ue_many(3)
+    assert r.pos == 0
+    assert r.read_ue_many(2) == [0, 1]
+    with pytest.raises(ValueError):
+        r.read_ue_many(-1)
+
+
+def test_read_list_with_runs_of_exp_golomb_codes():
+    bits = pack("u8, ue, ue, ue, se, se, u4, ue", 9, 4, 0, 12, -3, 6, 2, 1)
+    r = Reader(bits)
+    assert r.read_list("u8, ue, ue, ue, se, se, u4, ue") == [9, 4, 0, 12, -3, 6, 2, 1]
+    assert r.pos == len(bits)
+
+
+def test_read_uie_and_sie():
+    values = [0, 1, 2, 3, 14, 15, 100, 2 ** 40 + 5, 2 ** 300]
+    bits = Dtype("uie").pack_many(values)
+    r = Reader(bits)
+    assert [r.read("uie") for _ in values] == values
+    assert r.pos == len(bits)
+    r.pos = 0
+    assert r.read_uie_many(len(values)) == values
+    assert r.pos == len(bits)
+
+    signed = [0, -1, 1, -14, 15, -(2 ** 40), 2 ** 300, 0]
+    bits = Dtype("sie").pack_many(signed)
+    r = Reader(bits)
+    assert [r.read("sie") for _ in signed] == signed
+    r.pos = 0
+    assert r.read_sie_many(len(signed)) == signed
+    assert bits.unpack(["sie"] * len(signed)) == signed
+
+
+def test_read_uie_many_across_windows():
+    values = list(range(3000)) + [2 ** 600, 7]
+    bits = Dtype("uie").pack_many(values)
+    assert Reader(bits).read_uie_many(len(values)) == values
+    assert bits.unpack(", ".join(["uie"] * len(values))) == values
+
+
+def test_read_interleaved_off_end_restores_pos():
+    for b in ["0b0", "0b01", "0b0100"]:
+        r = Reader(Bits(b))
+        with pytest.raises(bitstring.ReadError):
+            r.read("uie")
+        assert r.pos == 0
+    # A non-zero sie code needs its sign bit.
+    r = Reader(Bits("0b1, 0b011"))
+    with pytest.raises(bitstring.ReadError):
+        r.read_sie_many(2)
+    assert r.pos == 0
+    assert r.read_sie_many(1) == [0]
+
+
+def test_stream_reader_matches_reader():
+    bits = pack("u8, ue, se, f32, bits5, uie, hex12", 5, 1000, -7, 1.5, "0b10101", 3, "abc") * 500
+    r = StreamReader(io.BytesIO(bits.to_bytes()), chunk_size=16)
+    expected = Reader(bits)
+    for _ in range(500):
+        assert r.read_list("u8, ue, se, f32") == expected.read_list("u8, ue, se, f32")
+        assert r.peek("bits5") == expected.peek("bits5")
+        assert r.read(5) == expected.read(5)
+        assert r.peek_list(["uie", 4]) == expected.peek_list(["uie", 4])
+        assert r.read("uie") == expected.read("uie")
+        assert r.read("hex12") == expected.read("hex12")
+        assert r.pos == expected.pos
+    # Only a chunk or so of the stream is ever held.
+    assert len(r._buffer) < 64
+    with pytest.raises(bitstring.ReadError):
+        r.read(8)
+    assert r.pos == len(bits)
+
+
+def test_stream_reader_from_pipe():
+    read_fd, write_fd = os.pipe()
+    os.write(write_fd, b"\x00\x11\xaa\xbb" * 100 + b"\xff\xff\x01")
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as f:
+        r = StreamReader(f, chunk_size=7)
+        assert r.read("u16") == 0x11
+        assert r.read_to("0xffff", bytealigned=True) == Bits("0xaabb") + Bits("0x0011aabb") * 99 + "0xffff"
+        assert r.bytepos == 402
+        r.read(3)
+        assert r.byte_align() == 5
+        assert r.bytepos == 403
+        with pytest.raises(bitstring.ReadError):
+            r.read_to("0xff")
+        assert r.bytepos == 403
+
+
+def test_stream_reader_positions_and_stretchy_tokens():
+    r = StreamReader(io.BytesIO(b"\x01\x80\xab\xcd"), chunk_size=1)
+    assert r.read_to("0b11") == "0b000000011"
+    assert r.pos == 9
+    r.pos = 16
+    assert r.read_list("u4, hex") == [10, "bcd"]
+    r.pos = 0
+    with pytest.raises(ValueError):
+        r.read(1)
+    r.pos = 100
+    with pytest.raises(ValueError):
+        r.read(1)
+
+    r = StreamReader(io.BytesIO(b"abcdef"), chunk_size=2)
+    assert r.read("bytes1") == b"a"
+    assert r.read("bytes") == b"bcdef"
+    with pytest.raises(TypeError):
+        StreamReader(b"abc")
+
+
+def test_async_reader():
+    bits = pack("u8, ue, se, f32, bits5, uie, hex12", 5, 1000, -7, 1.5, "0b10101", 3, "abc") * 200
+    data = bits.to_bytes() + b"\x00\x00\x01\xff"
+
+    async def parse():
+        stream = asyncio.StreamReader()
+
+        async def feed():
+            # Arrive in awkward sized pieces, with waits in between.
+            for i in range(0, len(data), 37):
+                stream.feed_data(data[i: i + 37])
+                await asyncio.sleep(0)
+            stream.feed_eof()
+
+        feeder = asyncio.ensure_future(feed())
+        r = AsyncReader(stream, chunk_size=8)
+        expected = Reader(bits)
+        for _ in range(200):
+            assert await r.read_list("u8, ue, se, f32") == expected.read_list("u8, ue, se, f32")
+            assert await r.peek("bits5") == expected.peek("bits5")
+            assert await r.read(5) == expected.read(5)
+            assert await r.peek_list(["uie"]) == expected.peek_list(["uie"])
+            assert await r.read("uie") == expected.read("uie")
+            assert await r.read("hex12") == expected.read("hex12")
+        assert r.pos == len(bits)
+        assert await r.byte_align() == (-len(bits)) % 8
+        assert await r.read_to("0x000001", bytealigned=True) == "0x000001"
+        with pytest.raises(bitstring.ReadError):
+            await r.read(9)
+        assert await r.read("bytes") == b"\xff"
+        await feeder
+
+    asyncio.run(parse())
+
+
+def test_stream_reader_compiled_read_plan():
+    bits = pack("u8, ue, pad3, f16, se", 5, 1000, 1.5, -7) * 50
+    plan = Reader.compile("u8, ue, pad3, f16, se")
+    r = StreamReader(io.BytesIO(bits.to_bytes()), chunk_size=3)
+    expected = Reader(bits)
+    for _ in range(50):
+        assert r.peek_list(plan) == expected.peek_list(plan)
+        assert r.read_list(plan) == expected.read_list(plan)
+        assert r.pos == expected.pos
+    with pytest.raises(bitstring.ReadError):
+        r.read_list(plan)
+    assert r.pos == len(bits)
+
+    r = StreamReader(io.BytesIO(b"\x01\x80\xab\xcd"), chunk_size=1)
+    assert r.read_list(Reader.compile("u8, hex, u8")) == [1, "80ab", 0xcd]
+
+
+def test_async_reader_compiled_read_plan():
+    bits = pack("u8, ue, pad3, f16, se", 5, 1000, 1.5, -7) * 50
+    plan = Reader.compile("u8, ue, pad3, f16, se")
+
+    async def parse():
+        stream = asyncio.StreamReader()
+        stream.feed_data(bits.to_bytes())
+        stream.feed_eof()
+        r = AsyncReader(stream, chunk_size=3)
+        expected = Reader(bits)
+        for _ in range(50):
+            assert await r.peek_list(plan) == expected.peek_list(plan)
+            assert await r.read_list(plan) == expected.read_list(plan)
+            assert r.pos == expected.pos
+        with pytest.raises(bitstring.ReadError):
+            await r.read_list(plan)
+        assert r.pos == len(bits)
+
+    asyncio.run(parse())
+
+
+def test_compiled_read_plan():
+    fmt = "u8, bool, u4, ue, ue, se, pad3, hex8, e4m3mxfp_saturate, f16, uie, bits5"
+    bits = pack("u8, bool, u4, ue, ue, se, 0b000, hex8, e4m3mxfp_saturate, f16, uie, bits5",
+                1, True, 3, 4, 5, -6, "ab", 1.5, 2.5, 7, "0b10101")
+    plan = Reader.compile(fmt)
+    assert repr(plan) == f"ReadPlan('{fmt}')"
+    r = Reader(bits * 3)
+    for _ in range(3):
+        assert r.read_list(plan) == [1, True, 3, 4, 5, -6, "ab", 1.5, 2.5, 7, "0b10101"]
+    assert r.pos == 3 * len(bits)
+    r.pos = 0
+    assert r.peek_list(plan) == r.read_list(fmt)
+    assert bits.unpack(plan) == bits.unpack(fmt)
+
+    plan = Reader.compile(["u:n", 4, Dtype("se", scale=2)], n=5)
+    assert Reader(Bits("0b10101, 0b1100, 0b011")).read_list(plan) == [21, "0b1100", -2]
+
+    r = Reader(Bits("0b10101, 0b1100, 0b01"), pos=3)
+    with pytest.raises(bitstring.ReadError):
+        r.read_list(plan)
+    assert r.pos == 3
+
+    bits = Bits("0x0102030405")
+    plan = Reader.compile("u8, hex, i4, pad4")
+    assert Reader(bits).read_list(plan) == Reader(bits).read_list("u8, hex, i4, pad4") == [1, "020304", 0]
+    assert Reader(bits, pos=8).read_list(Reader.compile("bytes")) == [b"\x02\x03\x04\x05"]
+    with pytest.raises(ValueError):
+        Reader(bits, pos=3).read_list(plan)
+    with pytest.raises(bitstring.Error):
+        Reader.compile("u8, hex, bin")
+    with pytest.raises(bitstring.Error):
+        Reader.compile("hex, ue")
+
+    # A short read names the token that didn't fit, not the whole run.
+    with pytest.raises(bitstring.ReadError, match="at least 16 bits, but only 12"):
+        Reader(Bits("0x010203")).read_list(Reader.compile("u8, i4, f16"))
+
+
+def test_read_records():
+    rows = [(i, -i, 0.5 * i, bool(i % 3), "cd") for i in range(50)]
+    bits = Bits().join(pack("u8, 0b11, i8, f16, bool, hex8", *row) for row in rows)
+    r = Reader(bits + "0b1")
+    columns = r.read_records("u8, pad2, i8, f16, bool, hex8", 50)
+    assert columns == [list(c) for c in zip(*rows)]
+    assert r.pos == len(bits)
+    assert r.read_records("u8, pad2", 0) == [[]]
+
+    r.pos = 0
+    ids, deltas = r.read_records(Reader.compile("u:n, pad2, i8", n=8), 2, arrays=True)
+    assert ids == bitstring.Array("u8", [0, 1])
+    assert deltas == bitstring.Array("i8", [0, -1])
+
+    old_pos = r.pos
+    with pytest.raises(bitstring.ReadError):
+        r.read_records("u8, pad2, i8, f16, bool, hex8", 50)
+    assert r.pos == old_pos
+    with pytest.raises(ValueError):
+        r.read_records("u8", -1)
+    with pytest.raises(ValueError):
+        r.read_records("u8, bin", 2)
+
+
+def test_unpack_records_variable_length_and_scaled():
+    bits = pack("ue, u4, se", 5, 3, -2) + pack("ue, u4, se", 100, 1, 7)
+    assert bits.unpack_records("ue, u4, se") == [[5, 100], [3, 1], [-2, 7]]
+    assert Reader(bits).read_records(["ue", 4, "se"], 2) == [[5, 100], [Bits("0x3"), Bits("0x1")], [-2, 7]]
+    with pytest.raises(bitstring.ReadError):
+        (bits + "0b0").unpack_records("ue, u4, se")
+
+    bits = Bits("0x0102030405")
+    assert bits.unpack_records(["u8", Dtype("u8", scale=2)]) == [[1, 3], [4, 8]]
+    assert bits.unpack_records("u16", 1, arrays=True) == [bitstring.Array("u16", [0x0102])]
+
+
+def test_read_scaled_dtypes_in_bulk():
+    bits = pack("i8, u12, e4m3mxfp_saturate, pad4, f16", -20, 300, 1.5, 2.5) * 3
+    scaled = [Dtype("i8", scale=2 ** -4), Dtype("u12", scale=3), "e4m3mxfp_saturate", "pad4", Dtype("f16", scale=0.5)]
+    expected = [-20 * 2 ** -4, 900, 1.5, 1.25]
+    assert Reader(bits).read_list(scaled) == expected
+    plan = Reader.compile(scaled)
+    assert Reader(bits).read_list(plan) == expected
+    assert bits.unpack_records(scaled) == [[v] * 3 for v in expected]
+
+    r = Reader(bits)
+    assert r.read(Dtype("i8", scale=2 ** -4)) == -1.25
+    assert r.read(Dtype("u12", scale=3)) == 900
+    assert r.pos == 20
+    r.pos = len(bits) - 4
+    with pytest.raises(bitstring.ReadError):
+        r.read(Dtype("u8", scale=2))
+    assert r.pos == len(bits) - 4